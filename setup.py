@@ -6,7 +6,7 @@ with open('README.rst') as _readme_file:
 
 
 tests_require = [
-    'pytz', 'idna'
+    'pytz', 'idna', 'numpy'
 ]
 
 setup(
@@ -42,7 +42,8 @@ setup(
     tests_require=tests_require,
     extras_require={
         'test': tests_require,
-        'email': ['idna >= 2.0.0']
+        'email': ['idna >= 2.0.0'],
+        'numpy': ['numpy'],
     },
     packages=find_packages(),
     package_data={
@@ -4,8 +4,12 @@ import validation
 
 
 def _print_message(snippet):
-    context = {}
-    context.update(validation.__dict__)
+    # Names are loaded lazily, so are not in `validation.__dict__` until they
+    # have been accessed.
+    context = {
+        name: getattr(validation, name) for name in validation.__all__
+        if hasattr(validation, name)
+    }
     context.update(dict(datetime=datetime, date=date))
 
     try:
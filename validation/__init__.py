@@ -1,41 +1,117 @@
+import importlib
+import sys
 
-from .core import (
-    validate_bool,
-)
+# Maps each public name to the submodule that defines it.  Submodules are
+# imported the first time one of their names is accessed, so that programs
+# that only use a few validators don't pay to import the rest.
+#
+# `validate_email_address` is only available if the `idna` package is
+# installed.  Depend on `validation[email]` to pull in the right version.
+_lazy_attributes = {
+    'validate_bool': 'core',
+    'validate_int': 'number',
+    'validate_float': 'number',
+    'validate_text': 'string',
+    'validate_bytes': 'string',
+    'validate_date': 'datetime',
+    'validate_datetime': 'datetime',
+    'validate_timedelta': 'datetime',
+    'validate_list': 'datastructure',
+    'validate_set': 'datastructure',
+    'validate_mapping': 'datastructure',
+    'validate_structure': 'datastructure',
+    'validate_tuple': 'datastructure',
+    'validate_uuid': 'uuid',
+    'validate_records': 'records',
+    'validate_email_address': 'email',
+    'validate_email_addresses': 'email',
+    'compile': 'compiler',
+    'is_valid': 'compiler',
+}
 
-from .number import (
-    validate_int, validate_float,
-)
+MYPY = False
+if MYPY or sys.version_info < (3, 7):  # pragma: no cover
+    # Module level `__getattr__` is not supported, so everything has to be
+    # imported up front.
+    from .core import (
+        validate_bool,
+    )
 
-from .string import (
-    validate_text, validate_bytes,
-)
+    from .number import (
+        validate_int, validate_float,
+    )
 
-from .datetime import (
-    validate_date, validate_datetime, validate_timedelta,
-)
+    from .string import (
+        validate_text, validate_bytes,
+    )
 
-from .datastructure import (
-    validate_list, validate_set,
-    validate_mapping, validate_structure,
-    validate_tuple,
-)
+    from .datetime import (
+        validate_date, validate_datetime, validate_timedelta,
+    )
 
-from .uuid import validate_uuid
+    from .datastructure import (
+        validate_list, validate_set,
+        validate_mapping, validate_structure,
+        validate_tuple,
+    )
 
-try:
-    from .email import validate_email_address
-except ImportError:
-    # `validate_email_address` is only available if the `idna` package is
-    # installed.  Depend on `validation[email]` to pull in the right version.
-    pass
+    from .uuid import validate_uuid
 
+    from .records import validate_records
+
+    from .compiler import is_valid
+
+    # Bound by assignment, rather than imported, as it is not in `__all__`.
+    from . import compiler as _compiler
+    compile = _compiler.compile  # pylint: disable=redefined-builtin
+
+    try:
+        from .email import validate_email_address, validate_email_addresses
+    except ImportError:
+        pass
+
+else:
+    def __getattr__(name):
+        # Submodules are only bound as attributes of the package once they
+        # have been imported, which may not have happened yet.
+        module_name = _lazy_attributes.get(name, name)
+
+        try:
+            module = importlib.import_module('.' + module_name, __name__)
+        except ImportError as e:
+            if name not in _lazy_attributes and getattr(e, 'name', None) == (
+                __name__ + '.' + name
+            ):
+                raise AttributeError(
+                    "module {module!r} has no attribute {name!r}".format(
+                        module=__name__, name=name,
+                    )
+                )
+            raise AttributeError(
+                "module {module!r} has no attribute {name!r} "
+                "({error})".format(module=__name__, name=name, error=e)
+            )
+
+        if name not in _lazy_attributes:
+            return module
+
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    def __dir__():
+        return sorted(set(globals()) | set(_lazy_attributes))
+
+
+# `compile` is deliberately left out, so that `from validation import *` does
+# not shadow the builtin.  Import it by name.
 __all__ = [
     'validate_int', 'validate_float', 'validate_bool',
     'validate_text', 'validate_bytes',
     'validate_date', 'validate_datetime', 'validate_timedelta',
     'validate_list', 'validate_set',
     'validate_mapping', 'validate_structure',
-    'validate_tuple', 'validate_uuid',
-    'validate_email_address',
+    'validate_tuple', 'validate_uuid', 'validate_records',
+    'validate_email_address', 'validate_email_addresses',
+    'is_valid',
 ]
@@ -1,3 +1,17 @@
+import math
+import operator
+import sys
+import weakref
+
+import six
+
+try:
+    from functools import lru_cache as _lru_cache
+except ImportError:  # pragma: no cover
+    # Python 2.
+    _lru_cache = None  # type: ignore
+
+
 class _Default(object):
     def __repr__(self):
         return "<optional>"
@@ -40,3 +54,535 @@ def make_optional_argument_default():
     moved out and will get their own default value.
     """
     return _Default()
+
+
+def make_validator_cache(factory, maxsize=256):
+    """
+    Wraps a validator constructor so that calls with the same arguments will
+    return a shared instance.
+
+    Used by the public validation functions to avoid constructing, and
+    re-checking the arguments to, a new validator every time they are called
+    with a value to check inline.
+
+        _int_validator_cache = make_validator_cache(_int_validator)
+
+        def validate_int(value=_undefined, min_value=None):
+            if value is not _undefined:
+                _int_validator_cache(min_value)(value)
+            ...
+
+    Arguments must be passed positionally, in the same order as they are
+    accepted by the constructor.
+    The types of the arguments, and of any values nested inside them, form
+    part of the key so that values that compare equal but which the
+    constructor would treat differently, for example `1` and `True`, or `0`
+    and `0.0`, do not share an entry.  This includes nested validators that
+    compare equal, but were constructed with arguments of different types.
+    Calls with arguments that can't be hashed are passed straight through to
+    the constructor.
+    """
+    def construct(*args):
+        return factory(*args), args
+
+    # Used for calls where the arguments compare equal to those of a cached
+    # validator, but are not the same objects.
+    cached_by_type = _make_simple_cache(factory, maxsize)
+
+    if _lru_cache is not None:
+        cached_construct = _lru_cache(maxsize=maxsize, typed=True)(construct)
+    else:  # pragma: no cover
+        def cached_construct(*args):
+            return cached_by_type(args), args
+
+    def get_validator(*args):
+        try:
+            validator, cached_args = cached_construct(*args)
+            if not all(map(operator.is_, args, cached_args)):
+                # The LRU cache only considers the types of top level
+                # arguments, and compares nested validators by value, so
+                # would otherwise return an instance with a nested validator
+                # configured with, for example, `True` instead of `1`.
+                validator = cached_by_type(args)
+            return validator
+        except TypeError:
+            # Either one of the arguments is unhashable, or the constructor
+            # rejected them.  In both cases we want whatever happens when
+            # calling the constructor directly.
+            return factory(*args)
+
+    return get_validator
+
+
+def _make_simple_cache(factory, maxsize):
+    """
+    Returns a function that takes a tuple of arguments for `factory` and
+    returns a shared instance constructed from them, keyed by
+    :func:`_typed_key`.
+
+    Used by :func:`make_validator_cache` for arguments that can't be told
+    apart from those of an existing entry in the LRU cache, and for everything
+    on versions of python that do not have :func:`functools.lru_cache`.
+
+    Once the cache contains `maxsize` entries it will be cleared.  This keeps
+    memory use bounded, without needing to do any bookkeeping on the hot path.
+    """
+    cache = {}
+
+    def get_validator(args):
+        key = _typed_key(args)
+
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        validator = factory(*args)
+
+        if len(cache) >= maxsize:
+            cache.clear()
+        cache[key] = validator
+
+        return validator
+
+    return get_validator
+
+
+class _ContextualizedError(object):
+    """
+    Mixin for copies of built-in exceptions, raised in place of the original
+    when a validator nested inside a data-structure validator fails.
+
+    Rather than raising a new copy at every level of nesting, a single copy
+    is raised by the innermost data-structure validator, and each of the
+    data-structure validators that it is nested inside adds its context to the
+    copy as it propagates.  The full message is only rendered when it is asked
+    for.
+
+    Instances pretend to be the built-in exception that they extend.  They
+    have the same name and module, so that tracebacks are unchanged, and they
+    will be pickled as an instance of the original built-in.
+    """
+    def __init__(self, message):
+        super(_ContextualizedError, self).__init__(message)
+        self._contexts = []
+
+    @property
+    def path(self):
+        """
+        The list of indices and keys, outermost first, that lead to the value
+        that failed validation.
+        """
+        return [key for _context, key in reversed(self._contexts)]
+
+    def _add_context(self, context, key):
+        self._contexts.append((context, key))
+
+    @property
+    def args(self):
+        args = _base_exception_args.__get__(self, type(self))
+        if len(args) != 1:
+            return args
+
+        message = args[0]
+        for context, key in self._contexts:
+            message = "{context}: {message}".format(
+                context=context.format(key=key), message=message,
+            )
+        return (message,)
+
+    @args.setter
+    def args(self, args):
+        _base_exception_args.__set__(self, args)
+        del self._contexts[:]
+
+    def __as_builtin(self):
+        return self._builtin_type(*self.args)
+
+    def __str__(self):
+        return str(self.__as_builtin())
+
+    def __repr__(self):
+        return repr(self.__as_builtin())
+
+    def __reduce__(self):
+        return self._builtin_type, self.args
+
+
+class _AggregateError(_ContextualizedError):
+    """
+    Mixin for the error raised by data-structure validators that have been
+    asked to collect more than one error.
+
+    The aggregate is an instance of the same built-in exception as the first
+    error that was collected, and has the same message and path, but with a
+    count of any other errors appended to the message.  All of the errors,
+    including the first, are available as a list in the `errors` attribute.
+    Context added to the aggregate is recorded on it, as for any other
+    contextualized error, and is also added to each of the errors.
+    """
+    def __init__(self, errors):
+        # pylint: disable=super-init-not-called,non-parent-init-called
+        self._builtin_type.__init__(self)
+        self._contexts = []
+        self.errors = errors
+
+    @property
+    def path(self):
+        return getattr(self.errors[0], 'path', [])
+
+    def _add_context(self, context, key):
+        super(_AggregateError, self)._add_context(context, key)
+        for error in self.errors:
+            if isinstance(error, _ContextualizedError):
+                error._add_context(context, key)
+
+    @property
+    def args(self):
+        # Arguments assigned explicitly replace the generated message.
+        args = _base_exception_args.__get__(self, type(self))
+        if args:
+            return args
+
+        args = self.errors[0].args
+        if len(self.errors) == 1:
+            return args
+
+        if len(args) != 1 or not isinstance(args[0], str):
+            return args
+
+        return ("{message} (and {count} more {errors})".format(
+            message=args[0], count=len(self.errors) - 1,
+            errors='error' if len(self.errors) == 2 else 'errors',
+        ),)
+
+    @args.setter
+    def args(self, args):
+        _base_exception_args.__set__(self, args)
+        del self._contexts[:]
+
+
+_base_exception_args = BaseException.__dict__['args']
+
+
+def _make_error_type(mixin, builtin_type):
+    return type(builtin_type.__name__, (mixin, builtin_type), {
+        '__module__': builtin_type.__module__,
+        '_builtin_type': builtin_type,
+    })
+
+
+# The list of built-in exceptions that it seems likely will be raised by a
+# validation function in normal operation.  Stuff like :exc:`SyntaxError`
+# probably indicates something more fundamental, for which the original
+# exception is more useful.
+_supported_exceptions = (
+    TypeError, ValueError,
+    KeyError, IndexError,
+    AssertionError,
+)
+
+_contextualized_error_types = {
+    builtin_type: _make_error_type(_ContextualizedError, builtin_type)
+    for builtin_type in _supported_exceptions
+}
+
+_aggregate_error_types = {
+    builtin_type: _make_error_type(_AggregateError, builtin_type)
+    for builtin_type in _supported_exceptions
+}
+
+
+def _contextualize_error(error, context=None, key=None):
+    """
+    Returns a copy of an error that can have context added to it, with the
+    given context added if it is not `None`.
+
+    Errors that were returned by a previous call are modified in place.
+    Errors that can't safely be copied are returned unchanged.
+    """
+    if isinstance(error, _ContextualizedError):
+        if context is not None:
+            error._add_context(context, key)
+        return error
+
+    if type(error) not in _contextualized_error_types:
+        # No safe way to extend the message for subclasses.
+        return error
+
+    # Check that the exception has been properly constructed.  The
+    # documentation requires that :exception:`TypeError`s and
+    # :exception:`ValueError`s are constructed with a single,
+    # string argument, but this is not enforced anywhere.
+    if len(error.args) != 1:
+        return error
+
+    if not isinstance(error.args[0], str):
+        return error
+
+    copy = _contextualized_error_types[type(error)](error.args[0])
+    if context is not None:
+        copy._add_context(context, key)
+    copy.__cause__ = error
+    return copy
+
+
+def _try_contextualize_exception(context, key):
+    """
+    Will attempt to re-raise a caught :exc:`TypeError`, :exc:`ValueError`,
+    :exc:`KeyError, :exc:`IndexError` or :exc:`AssertionError` with a
+    description of the context.
+
+    `context` should be a template containing a single ``{key}`` field, that
+    describes where the key or index `key` is in the value being validated.
+    It will only be formatted if the message is rendered.
+
+    If the caught exception was raised by a nested call to this function, the
+    context is added to it and this function returns so that it can be
+    re-raised by the caller.
+    If the original error does not match the expected form, or is not one of
+    the supported types, will simply return without raising anything.
+    """
+    exc_value = sys.exc_info()[1]
+
+    contextualized = _contextualize_error(exc_value, context, key)
+    if contextualized is not exc_value:
+        six.raise_from(contextualized, exc_value)
+
+
+class _ErrorCollector(object):
+    """
+    Accumulates the errors found by a data-structure validator that has been
+    asked to report up to `max_errors` errors rather than stopping at the
+    first.
+
+        errors = _ErrorCollector(max_errors)
+        for index, item in enumerate(value):
+            try:
+                validator(item)
+            except (TypeError, ValueError, KeyError) as exc:
+                if errors.add(exc, "invalid item at position {key}", index):
+                    break
+        errors.raise_errors()
+
+    Errors are contextualized as they are added.  If a nested validator
+    raises an aggregate error then each of the errors that it contains is
+    added separately.
+    """
+    __slots__ = ('__max_errors', '__errors')
+
+    def __init__(self, max_errors):
+        self.__max_errors = max_errors
+        self.__errors = []
+
+    def add(self, error, context=None, key=None):
+        """
+        Records an error.  Returns `True` if the error budget is exhausted
+        and validation should stop.
+        """
+        if isinstance(error, _AggregateError):
+            errors = error.errors
+        else:
+            errors = [error]
+
+        for collected in errors:
+            self.__errors.append(_contextualize_error(collected, context, key))
+
+        del self.__errors[self.__max_errors:]
+        return len(self.__errors) >= self.__max_errors
+
+    def raise_errors(self):
+        """
+        Raises an aggregate of all of the errors collected so far, if there
+        are any.
+        """
+        if not self.__errors:
+            return
+
+        first = self.__errors[0]
+        for builtin_type in type(first).__mro__:
+            if builtin_type in _aggregate_error_types:
+                break
+        else:  # pragma: no cover
+            # Only errors that are instances of the supported types are
+            # collected.
+            raise first
+
+        raise _aggregate_error_types[builtin_type](self.__errors)
+
+
+class _validator(object):
+    """
+    Base class for all validator closures returned by this library.
+
+    Validators are immutable, and are compared and hashed based on their
+    configuration.  Subclasses that take arguments must override :meth:`_key`,
+    which should return a hashable tuple of all of the arguments that the
+    validator was constructed with.
+
+    Validators are pickled as a call to their constructor with the arguments
+    returned by :meth:`_key`, so that functions compiled by
+    :meth:`validate_many` and :meth:`is_valid` are not included, and are
+    compiled again when they are next needed.  Subclasses for which the key
+    is not the list of constructor arguments must override
+    :meth:`__reduce__`.
+    """
+    __slots__ = ('__weakref__', '__validate_many', '__is_valid')
+
+    def _key(self):
+        return ()
+
+    def validate_many(self, values):
+        """
+        Checks every value in an iterable.
+
+        Equivalent to calling the validator on each value in turn, but the
+        loop, and the checks for each value, are compiled into a single
+        function the first time this method is called.
+
+        :param values:
+            An iterable of values to be validated.  Iterators will be consumed.
+
+        :raises TypeError:
+        :raises ValueError:
+            If any value fails validation.  The message of the first error will
+            be prefixed with the position of the value that caused it.
+        """
+        try:
+            validate_many = self.__validate_many
+        except AttributeError:
+            validate_many = None
+
+        if validate_many is None:
+            validate_many = self.__validate_many = self._compile_many()
+
+        validate_many(values)
+
+    def _reused_for_many(self):
+        """
+        Returns `True` if :meth:`validate_many` has already been compiled, or
+        if this method has been called before.
+
+        Compiling costs far more than checking a short list in a loop.  Data
+        structure validators use this to put off compiling until it is clear
+        that the validator will be used again, rather than paying for it on
+        every inline call with a newly constructed child validator.
+        """
+        try:
+            self.__validate_many
+        except AttributeError:
+            # Marks the first request without compiling anything.
+            self.__validate_many = None
+            return False
+        return True
+
+    def is_valid(self, value):
+        """
+        Returns `True` if the value would be accepted by this validator, and
+        `False` if it would not.
+
+        Runs the same checks as calling the validator, compiled into a
+        predicate the first time this method is called, but doesn't raise,
+        format or contextualize any exceptions for checks that can be
+        inlined.
+        Validators that were not created by this library, for example plain
+        functions passed to :func:`~validation.datastructure.validate_list`,
+        are still called, and any :exc:`TypeError`, :exc:`ValueError` or
+        :exc:`KeyError` that they raise is caught.
+
+        :param value:
+            The value to be checked.
+
+        :returns:
+            A `bool`.
+        """
+        try:
+            is_valid = self.__is_valid
+        except AttributeError:
+            # Imported here as the compiler depends on this module.
+            from .compiler import compile_is_valid
+            is_valid = self.__is_valid = compile_is_valid(self)
+
+        return is_valid(value)
+
+    def _compile_many(self):
+        """
+        Returns the function used to implement :meth:`validate_many`.
+
+        Subclasses can override this to provide a faster implementation for
+        some inputs.
+        """
+        # Imported here as the compiler depends on this module.
+        from .compiler import compile_many
+        return compile_many(self)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        if equal is NotImplemented:
+            return equal
+        return not equal
+
+    def __hash__(self):
+        return hash((type(self), self._key()))
+
+    def __reduce__(self):
+        return type(self), self._key()
+
+
+_interned_validators = (
+    weakref.WeakValueDictionary()
+)  # type: weakref.WeakValueDictionary[tuple, _validator]
+
+
+def _typed_key(value):
+    """
+    Returns a hashable key for an argument of a validator that, unlike the
+    argument itself, doesn't compare equal to the key of an argument of a
+    different type.
+
+    Tuples are tagged recursively.  Nested validators are identified by
+    identity rather than by value.  They are interned themselves, so nested
+    validators constructed with differently typed arguments are different
+    instances.
+    """
+    if isinstance(value, _validator):
+        return (type(value), id(value))
+    if isinstance(value, tuple):
+        return (type(value), tuple(_typed_key(item) for item in value))
+    if isinstance(value, frozenset):
+        return (type(value), frozenset(_typed_key(item) for item in value))
+    if isinstance(value, float):
+        # `-0.0` compares equal to `0.0`, but is rendered differently.
+        return (type(value), value, math.copysign(1, value))
+    return (type(value), value)
+
+
+def intern_validator(validator):
+    """
+    Returns a shared instance of a validator equal to the one passed in.
+
+    Instances are only kept alive for as long as something else holds a
+    reference to them, so this should be called on every validator returned
+    to the user, so that large schemas built from many identical validators
+    can share them.
+    Validators that can't be hashed, because they wrap something unhashable,
+    are returned unchanged.
+    """
+    # As with `make_validator_cache`, include the types of arguments in the
+    # key to avoid, for example, returning an instance with `min_value=True`
+    # when asked for one with `min_value=1`.  The two will compare equal, but
+    # have different representations.  The types of values nested in
+    # arguments, such as the keys of a schema, matter in the same way.
+    key = _typed_key(validator._key())  # pylint: disable=protected-access
+
+    try:
+        return _interned_validators.setdefault(
+            (type(validator), key), validator,
+        )
+    except TypeError:
+        return validator
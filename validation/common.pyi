@@ -0,0 +1,30 @@
+from typing import Any, Callable, Generic, Iterable, TypeVar
+
+
+T = TypeVar('T')
+T_contra = TypeVar('T_contra', contravariant=True)
+
+
+def make_optional_argument_default() -> object:
+    ...
+
+
+def make_validator_cache(
+    factory: Callable[..., T], maxsize: int=...,
+) -> Callable[..., T]:
+    ...
+
+
+def intern_validator(validator: T) -> T:
+    ...
+
+
+class _validator(Generic[T_contra]):
+    def __call__(self, value: T_contra) -> None:
+        ...
+
+    def validate_many(self, values: Iterable[T_contra]) -> None:
+        ...
+
+    def is_valid(self, value: Any) -> bool:
+        ...
@@ -0,0 +1,363 @@
+"""
+This module contains a compiler that flattens trees of validators into a
+single, specialised python function.
+
+Validators created by this library are interpreted: every call to a
+:func:`~validation.datastructure.validate_structure` closure calls into the
+closures for each of its values, which then re-check their own configuration
+on every call.
+:func:`compile` walks a tree of validators once, and generates the source for
+a function that performs all of the same checks inline, with bounds baked in
+as constants and with checks for unset options removed.
+
+Compiled functions are intended as a drop in replacement for the original
+validator.  They raise exactly the same exceptions, with exactly the same
+messages.  This is achieved by only inlining the fast, successful path.  If an
+inlined check fails, the original validator is called to raise the error.
+
+The same code can instead be generated as a predicate, that returns `False` as
+soon as an inlined check fails.  This is used to implement :func:`is_valid`,
+which never raises, formats or contextualizes an exception for values that are
+checked inline.
+
+.. autofunction:: compile
+.. autofunction:: compile_many
+.. autofunction:: is_valid
+"""
+import contextlib
+import itertools
+import linecache
+import math
+import weakref
+
+import six
+from six.moves import builtins
+
+from .common import _validator, _try_contextualize_exception
+
+
+_compiled_counter = itertools.count()
+
+
+# Weak references to compiled functions, keyed by the filename their source
+# is registered under in `linecache`.  The callback removes the source once
+# the function is garbage collected.
+_compiled_sources = {}
+
+
+def _forget_source(filename):
+    linecache.cache.pop(filename, None)
+    _compiled_sources.pop(filename, None)
+
+
+def _register_source(filename, source, function):
+    """
+    Registers the generated source with `linecache`, so that it shows up in
+    tracebacks, for as long as the compiled function is alive.
+    """
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(True), filename,
+    )
+    _compiled_sources[filename] = weakref.ref(
+        function, lambda _, filename=filename: _forget_source(filename),
+    )
+
+
+class _Compiler(object):
+    def __init__(self, predicate=False):
+        self.__predicate = predicate
+        self.__lines = []
+        self.__depth = 1
+        self.__namespace = {
+            '_try_contextualize_exception': _try_contextualize_exception,
+        }
+        self.__counter = itertools.count()
+
+    @property
+    def predicate(self):
+        """
+        `True` if generating a predicate rather than a validator.
+        """
+        return self.__predicate
+
+    def name(self, prefix):
+        """
+        Returns a new, unique, variable name.
+        """
+        return '_{prefix}{index}'.format(
+            prefix=prefix, index=next(self.__counter),
+        )
+
+    def constant(self, value):
+        """
+        Returns a python expression that evaluates to the given value.
+
+        Simple values are written out as literals.  Anything else is bound to
+        a unique name in the namespace of the generated function.
+        """
+        if value is None or isinstance(value, (bool, six.integer_types)):
+            return repr(value)
+
+        if isinstance(value, float) and not (
+            math.isinf(value) or math.isnan(value)
+        ):
+            return repr(value)
+
+        name = self.name('c')
+        self.__namespace[name] = value
+        return name
+
+    def line(self, line):
+        self.__lines.append('    ' * self.__depth + line)
+
+    @contextlib.contextmanager
+    def block(self, header):
+        self.line(header + ':')
+        self.__depth += 1
+        yield
+        self.__depth -= 1
+
+    @contextlib.contextmanager
+    def optional(self, value, required):
+        """
+        Skips the checks generated inside the block if the value is `None` and
+        is not required.
+
+        Required values do not need to be special cased: `None` will fail the
+        type check and fall through to the original validator, which will
+        raise an error.
+        """
+        if required:
+            yield
+        else:
+            with self.block('if {value} is not None'.format(value=value)):
+                yield
+
+    def call(self, validator, value):
+        """
+        Emits a call to a validator that can't be inlined.
+
+        When generating a predicate, a failure will cause it to return
+        `False`.
+        """
+        if self.__predicate:
+            with self.block('try'):
+                self.line('{validator}({value})'.format(
+                    validator=self.constant(validator), value=value,
+                ))
+            with self.block('except (TypeError, ValueError, KeyError)'):
+                self.line('return False')
+        else:
+            self.line('{validator}({value})'.format(
+                validator=self.constant(validator), value=value,
+            ))
+
+    def check(self, validator, value, conditions):
+        """
+        Emits code that will call the original validator, and therefore raise
+        the appropriate exception, if any of the conditions do not hold.
+
+        When generating a predicate, it will return `False` instead.  The
+        conditions must therefore only fail for values that the original
+        validator would reject.
+        """
+        with self.block('if not ({conditions})'.format(
+            conditions=' and '.join(conditions),
+        )):
+            if self.__predicate:
+                self.line('return False')
+            else:
+                self.line('{validator}({value})'.format(
+                    validator=self.constant(validator), value=value,
+                ))
+
+    @contextlib.contextmanager
+    def contextualize(self, context, key):
+        """
+        Wraps the code generated inside the block in a ``try`` block that will
+        add context to exceptions in the same way as the datastructure
+        validators.
+
+        `key` should be a python expression that evaluates to the key or index
+        that will be substituted into the context template if an error occurs.
+
+        Predicates don't raise errors, so don't need context.
+        """
+        if self.__predicate:
+            yield
+            return
+
+        with self.block('try'):
+            yield
+        with self.block('except (TypeError, ValueError, KeyError)'):
+            self.line('_try_contextualize_exception({context}, {key})'.format(
+                context=self.constant(context), key=key,
+            ))
+            self.line('raise')
+
+    def emit(self, validator, value):
+        """
+        Emits code that will check the value against the given validator.
+
+        Validators provided by this library are inlined.  Anything else is
+        called directly.
+        """
+        compile_validator = getattr(type(validator), '_compile', None)
+        if compile_validator is not None:
+            compile_validator(validator, self, value)
+        else:
+            self.call(validator, value)
+
+    def build(self, name):
+        if self.__predicate:
+            self.line('return True')
+
+        source = 'def {name}(value):\n{body}\n'.format(
+            name=name, body='\n'.join(self.__lines) or '    pass',
+        )
+
+        filename = '<validation.compile-{index}>'.format(
+            index=next(_compiled_counter),
+        )
+
+        namespace = dict(self.__namespace)
+        six.exec_(builtins.compile(source, filename, 'exec'), namespace)
+        function = namespace[name]
+
+        _register_source(filename, source, function)
+        return function
+
+
+def compile(validator):  # pylint: disable=redefined-builtin
+    """
+    Flattens a validator, and all of the validators nested inside it, into a
+    single specialised function.
+
+    The returned function accepts and rejects exactly the same values as the
+    original validator, and raises exactly the same exceptions, but avoids the
+    overhead of re-entering each nested validator and re-reading its
+    configuration on every call.
+
+    .. code:: python
+
+        validator = compile(validate_structure(schema={
+            'id': validate_int(min_value=0),
+            'tags': validate_list(validator=validate_text()),
+        }))
+        validator({'id': 1, 'tags': [u"one", u"two"]})
+
+    Validators that were not created by this library are called as normal
+    from the generated code.
+
+    :param func validator:
+        The validator to be compiled.
+
+    :returns:
+        A function that takes a single value and validates it.
+
+    :raises TypeError:
+        If the argument is not callable.
+    """
+    if not callable(validator):
+        raise TypeError((
+            "expected validator function, but value is of type {cls!r}"
+        ).format(cls=validator.__class__.__name__))
+
+    compiler = _Compiler()
+    compiler.emit(validator, 'value')
+    return compiler.build('validate')
+
+
+def compile_many(validator):
+    """
+    Compiles a validator into a function that will check every value in an
+    iterable.
+
+    Used to implement the ``validate_many`` method of validators provided by
+    this library.
+
+    :param func validator:
+        The validator to be compiled.
+
+    :returns:
+        A function that takes an iterable and validates each of its values.
+    """
+    if not callable(validator):
+        raise TypeError((
+            "expected validator function, but value is of type {cls!r}"
+        ).format(cls=validator.__class__.__name__))
+
+    compiler = _Compiler()
+    index = compiler.name('index')
+    item = compiler.name('item')
+
+    # The `try` block is inside the loop so that errors raised while
+    # iterating, for example from a generator, are not attributed to the
+    # previous value.
+    with compiler.block('for {index}, {item} in enumerate(value)'.format(
+        index=index, item=item,
+    )):
+        with compiler.contextualize("invalid item at position {key}", index):
+            compiler.emit(validator, item)
+
+    return compiler.build('validate_many')
+
+
+def compile_is_valid(validator):
+    """
+    Compiles a validator into a predicate that returns `True` if a value is
+    valid, and `False` otherwise.
+
+    Used to implement the ``is_valid`` method of validators provided by this
+    library.
+
+    :param func validator:
+        The validator to be compiled.
+
+    :returns:
+        A function that takes a single value and returns a `bool`.
+    """
+    if not callable(validator):
+        raise TypeError((
+            "expected validator function, but value is of type {cls!r}"
+        ).format(cls=validator.__class__.__name__))
+
+    compiler = _Compiler(predicate=True)
+    compiler.emit(validator, 'value')
+    return compiler.build('is_valid')
+
+
+def is_valid(validator, value):
+    """
+    Returns `True` if a validator would accept a value, and `False` if it would
+    raise a :exc:`TypeError`, :exc:`ValueError` or :exc:`KeyError`.
+
+    Validators provided by this library, including any validators nested
+    inside them, are checked using a predicate compiled on first use, that
+    returns `False` without raising an exception.  Only validators from
+    elsewhere, and validators that can't be inlined, are called and have
+    their exceptions caught.
+
+    .. code:: python
+
+        if is_valid(validate_structure(schema=schema_a), payload):
+            ...
+        elif is_valid(validate_structure(schema=schema_b), payload):
+            ...
+
+    :param func validator:
+        The validator to check the value against.
+    :param value:
+        The value to be checked.
+
+    :returns:
+        `True` if the value is valid, otherwise `False`.
+    """
+    if isinstance(validator, _validator):
+        return validator.is_valid(value)
+
+    try:
+        validator(value)
+    except (TypeError, ValueError, KeyError):
+        return False
+    return True
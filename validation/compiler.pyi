@@ -0,0 +1,22 @@
+from typing import Any, Callable, Iterable, TypeVar
+
+
+T = TypeVar('T')
+
+
+def compile(validator: Callable[[T], None]) -> Callable[[T], None]:
+    ...
+
+
+def compile_many(
+    validator: Callable[[T], None],
+) -> Callable[[Iterable[T]], None]:
+    ...
+
+
+def compile_is_valid(validator: Callable[[T], None]) -> Callable[[Any], bool]:
+    ...
+
+
+def is_valid(validator: Callable[[T], None], value: Any) -> bool:
+    ...
@@ -1,4 +1,7 @@
-from .common import make_optional_argument_default
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator,
+)
 
 
 _undefined = make_optional_argument_default()
@@ -16,13 +19,35 @@ def _validate_bool(value, required=True):
         ).format(cls=value.__class__.__name__))
 
 
-class _bool_validator(object):
+class _bool_validator(_validator):
+    __slots__ = ('__required',)
+
     def __init__(self, required):
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (self.__required,)
+
     def __call__(self, value):
-        _validate_bool(value, required=self.__required)
+        _validate_bool(value, self.__required)
+
+    def _compile(self, compiler, value):
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, [
+                'isinstance({value}, bool)'.format(value=value),
+            ])
+
+    def _compile_many(self):
+        # Imported here to avoid loading NumPy until it is needed.
+        from .numpy import (
+            vectorize_many, find_invalid_bools, bools_guaranteed,
+        )
+
+        return vectorize_many(
+            self, super(_bool_validator, self)._compile_many(),
+            (bool,), 'bool', find_invalid_bools, bools_guaranteed,
+        )
 
     def __repr__(self):
         args = []
@@ -34,6 +59,9 @@ class _bool_validator(object):
         return 'validate_bool({args})'.format(args=', '.join(args))
 
 
+_bool_validator_cache = make_validator_cache(_bool_validator)
+
+
 def validate_bool(value=_undefined, required=True):
     """
     Checks that the target value is a valid boolean.
@@ -47,9 +75,8 @@ def validate_bool(value=_undefined, required=True):
         If the value is not a boolean, or if it was marked as `required` but
         `None` was passed in.
     """
-    validate = _bool_validator(required=required)
-
     if value is not _undefined:
+        validate = _bool_validator_cache(required)
         validate(value)
     else:
-        return validate
+        return intern_validator(_bool_validator(required=required))
@@ -1,5 +1,7 @@
 from typing import overload, Callable, Optional
 
+from .common import _validator
+
 
 @overload
 def validate_bool(value: bool) -> None:
@@ -12,10 +14,10 @@ def validate_bool(value: Optional[bool], *, required: bool) -> None:
 
 
 @overload
-def validate_bool() -> Callable[[bool], None]:
+def validate_bool() -> _validator[bool]:
     ...
 
 
 @overload
-def validate_bool(*, required: bool) -> Callable[[Optional[bool]], None]:
+def validate_bool(*, required: bool) -> _validator[Optional[bool]]:
     ...
@@ -32,6 +32,28 @@ don't try to catch them.
 There doesn't appear to be a safe way to extend custom exceptions so these are
 also left alone.
 
+Only one copy is made, however deeply the failing validator is nested.
+Each enclosing validator records its context on the copy as it propagates, and
+the full message is only built when it is needed.
+The copy also has a ``path`` attribute, listing the keys and indices, outermost
+first, that lead from the top level value to the value that failed.
+
+    >>> try:
+    ...     validate_list(values, validator=validate_int(min_value=0))
+    ... except ValueError as exc:
+    ...     print(exc.path)
+    [3]
+
+Copies are subclasses of the original built-in exception, and are pickled as
+instances of it.
+
+Every data-structure validator accepts a ``max_errors`` argument.  If it is
+set, the validator keeps going after the first error, until it has collected
+that many.  The error that is then raised is of the same type, and has the same
+message and path, as the first, but with a count of the others appended to the
+message.  All of the errors, each with its own path, are listed in its
+``errors`` attribute.
+
 There is no single ``validate_dict`` function.
 Dictionaries can be validated either as a mapping, that maps between keys of
 one type and values of another, using :func:`validate_mapping`, or as struct
@@ -57,64 +79,76 @@ Dictionaries
 .. autofunction:: validate_mapping
 .. autofunction:: validate_structure
 """
-import sys
+import array
 import itertools
+import sys
 
-import six
-
-from .core import _validate_bool
-from .number import _validate_int
-from .common import make_optional_argument_default
+from .core import _validate_bool, _bool_validator
+from .number import _validate_int, _int_validator, _float_validator
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator, _try_contextualize_exception,
+    _ErrorCollector,
+)
 
 
 _undefined = make_optional_argument_default()
 
 
-def _try_contextualize_exception(context):
-    """
-    Will attempt to re-raise a caught :exc:`TypeError`, :exc:`ValueError`,
-    :exc:`KeyError, :exc:`IndexError` or :exc:`AssertionError` with a
-    description of the context.
+_array_validators = (_bool_validator, _int_validator, _float_validator)
+
+
+# Lists shorter than this are checked in an interpreted loop the first time a
+# child validator is seen, as compiling its `validate_many` method takes as
+# long as checking several hundred items.
+_MIN_BULK_LENGTH = 512
 
-    If the original error does not match the expected form, or is not one of
-    the supported types, will simply return without raising anything.
+
+def _is_typed_array(value):
+    """
+    Returns `True` if the value is a typed array from the :mod:`array` module,
+    or a one dimensional NumPy array.
     """
-    exc_type, exc_value, exc_traceback = sys.exc_info()
-
-    # The list of built-in exceptions that it seems likely will be raised by a
-    # validation function in normal operation.  Stuff like :exc:`SyntaxError`
-    # probably indicates something more fundamental, for which the original
-    # exception is more useful.
-    supported_exceptions = (
-        TypeError, ValueError,
-        KeyError, IndexError,
-        AssertionError
+    if isinstance(value, array.array):
+        return True
+
+    # There is no need to import NumPy to check.  If it hasn't already been
+    # imported then the value can't be a NumPy array.
+    numpy = sys.modules.get('numpy')
+    return (
+        numpy is not None and isinstance(value, numpy.ndarray) and
+        value.ndim == 1
     )
 
-    if exc_type not in supported_exceptions:
-        # No safe way to extend the message for subclasses.
-        return
-
-    # Check that the exception has been properly constructed.  The
-    # documentation requires that :exception:`TypeError`s and
-    # :exception:`ValueError`s are constructed with a single,
-    # string argument, but this is not enforced anywhere.
-    if len(exc_value.args) != 1:
-        return
 
-    if not isinstance(exc_value.args[0], str):
-        return
+def _collect_errors(checks, max_errors):
+    """
+    Calls each validator in an iterable of ``(validator, item, context, key)``
+    tuples on its item, and raises the first `max_errors` errors, with
+    their contexts, as a single aggregate error.  The iterable is not consumed
+    any further once the limit has been reached.
+    """
+    errors = _ErrorCollector(max_errors)
+    for validator, item, context, key in checks:
+        try:
+            validator(item)
+        except (TypeError, ValueError, KeyError) as exc:
+            if errors.add(exc, context, key):
+                break
+    errors.raise_errors()
 
-    message = "{context}: {message}".format(
-        context=context, message=exc_value.args[0],
-    )
 
-    six.raise_from(exc_type(message), exc_value)
+def _raise(error):
+    # Lets errors that are found without calling a validator, such as missing
+    # keys, be passed to `_collect_errors` as checks.
+    raise error
 
 
 def _validate_list(
     value, validator=None,
     min_length=None, max_length=None,
+    allow_arrays=False,
+    max_errors=None,
     required=True,
 ):
     if value is None:
@@ -122,7 +156,9 @@ def _validate_list(
             return
         raise TypeError("required value is None")
 
-    if not isinstance(value, list):
+    if not isinstance(value, list) and not (
+        allow_arrays and _is_typed_array(value)
+    ):
         raise TypeError((
             "expected 'list', value is of type {cls!r}"
         ).format(cls=type(value).__name__))
@@ -139,19 +175,58 @@ def _validate_list(
             "but list contains {actual}"
         ).format(expected=max_length, actual=len(value)))
 
-    if validator is not None:
+    if validator is None:
+        return
+
+    if max_errors is not None:
+        if not isinstance(value, list):
+            value = value.tolist()
+
+        _collect_errors((
+            (validator, item, "invalid item at position {key}", index)
+            for index, item in enumerate(value)
+        ), max_errors)
+        return
+
+    if not isinstance(value, list):
+        if isinstance(validator, _array_validators):
+            # The numeric validators can check arrays directly, without
+            # converting them.
+            validator.validate_many(value)
+            return
+
+        # Typed arrays are otherwise validated as if they were lists of
+        # python values, not of NumPy scalars.
+        value = value.tolist()
+
+    if isinstance(validator, _validator) and (
+        len(value) >= _MIN_BULK_LENGTH or
+        validator._reused_for_many()  # pylint: disable=protected-access
+    ):
+        # Raises the same errors as the loop below, but is compiled, and can
+        # check lists of numbers in a single pass if NumPy is available.
+        validator.validate_many(value)
+    else:
         for index, item in enumerate(value):
             try:
                 validator(item)
             except (TypeError, ValueError, KeyError):
                 _try_contextualize_exception(
-                    "invalid item at position {index}".format(index=index),
+                    "invalid item at position {key}", index,
                 )
                 raise
 
 
-class _list_validator(object):
-    def __init__(self, validator, min_length, max_length, required):
+class _list_validator(_validator):
+    __slots__ = (
+        '__validator', '__min_length', '__max_length', '__allow_arrays',
+        '__max_errors', '__required',
+    )
+
+    def __init__(
+        self, validator, min_length, max_length, allow_arrays, max_errors,
+        required,
+    ):
         self.__validator = validator
 
         _validate_int(min_length, min_value=0, required=False)
@@ -167,16 +242,78 @@ class _list_validator(object):
         self.__min_length = min_length
         self.__max_length = max_length
 
+        _validate_bool(allow_arrays)
+        self.__allow_arrays = allow_arrays
+
+        _validate_int(max_errors, min_value=1, required=False)
+        self.__max_errors = max_errors
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__validator,
+            self.__min_length, self.__max_length,
+            self.__allow_arrays, self.__max_errors,
+            self.__required,
+        )
+
     def __call__(self, value):
         _validate_list(
-            value, validator=self.__validator,
-            min_length=self.__min_length, max_length=self.__max_length,
-            required=self.__required,
+            value, self.__validator, self.__min_length, self.__max_length,
+            self.__allow_arrays, self.__max_errors, self.__required,
         )
 
+    def _compile(self, compiler, value):
+        if self.__max_errors is not None and not compiler.predicate:
+            # Collecting errors is not a fast path.
+            compiler.call(self, value)
+            return
+
+        if not self.__allow_arrays:
+            self.__compile_list(compiler, value)
+            return
+
+        # Anything that isn't a list is passed through to the original
+        # validator, which will either raise an error or check the array in
+        # bulk.
+        with compiler.block('if not isinstance({value}, list)'.format(
+            value=value,
+        )):
+            compiler.call(self, value)
+        with compiler.block('else'):
+            self.__compile_list(compiler, value)
+
+    def __compile_list(self, compiler, value):
+        conditions = ['isinstance({value}, list)'.format(value=value)]
+
+        if self.__min_length is not None:
+            conditions.append('len({value}) >= {min}'.format(
+                value=value, min=compiler.constant(self.__min_length),
+            ))
+
+        if self.__max_length is not None:
+            conditions.append('len({value}) <= {max}'.format(
+                value=value, max=compiler.constant(self.__max_length),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+            if self.__validator is not None:
+                index = compiler.name('index')
+                item = compiler.name('item')
+                with compiler.contextualize(
+                    "invalid item at position {key}", index,
+                ):
+                    with compiler.block(
+                        'for {index}, {item} in enumerate({value})'.format(
+                            index=index, item=item, value=value,
+                        )
+                    ):
+                        compiler.emit(self.__validator, item)
+
     def __repr__(self):
         args = []
         if self.__validator is not None:
@@ -194,6 +331,16 @@ class _list_validator(object):
                 max_length=self.__max_length,
             ))
 
+        if self.__allow_arrays:
+            args.append('allow_arrays={allow_arrays!r}'.format(
+                allow_arrays=self.__allow_arrays,
+            ))
+
+        if self.__max_errors is not None:
+            args.append('max_errors={max_errors!r}'.format(
+                max_errors=self.__max_errors,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -202,10 +349,15 @@ class _list_validator(object):
         return 'validate_list({args})'.format(args=', '.join(args))
 
 
+_list_validator_cache = make_validator_cache(_list_validator)
+
+
 def validate_list(
     value=_undefined,
     validator=None,
     min_length=None, max_length=None,
+    allow_arrays=False,
+    max_errors=None,
     required=True,
 ):
     """
@@ -222,23 +374,36 @@ def validate_list(
     :param int max_length:
         The maximum acceptable length for the list.  If `None`, the maximum
         length is not checked.
+    :param bool allow_arrays:
+        Whether to also accept typed arrays from the :mod:`array` module, and
+        one dimensional NumPy arrays, in place of a list.  Arrays are checked
+        as if they had been converted to lists using ``tolist()``.  If the
+        array's type guarantees that every element is valid, the elements
+        will not be checked individually.  Defaults to `False`.
+    :param int max_errors:
+        If set, collect up to this many errors rather than stopping at the
+        first.  Defaults to `None`.
     :param bool required:
         Whether the value can be `None`.  Defaults to `True`.
     """
-    validate = _list_validator(
-        min_length=min_length, max_length=max_length,
-        validator=validator, required=required,
-    )
-
     if value is not _undefined:
+        validate = _list_validator_cache(
+            validator, min_length, max_length, allow_arrays, max_errors,
+            required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_list_validator(
+            min_length=min_length, max_length=max_length,
+            validator=validator, allow_arrays=allow_arrays,
+            max_errors=max_errors, required=required,
+        ))
 
 
 def _validate_set(
     value, validator=None,
     min_length=None, max_length=None,
+    max_errors=None,
     required=True,
 ):
     if value is None:
@@ -263,13 +428,28 @@ def _validate_set(
             "but set contains {actual}"
         ).format(expected=max_length, actual=len(value)))
 
-    if validator is not None:
-        for item in value:
-            validator(item)
+    if validator is None:
+        return
+
+    if max_errors is not None:
+        _collect_errors((
+            (validator, item, None, None) for item in value
+        ), max_errors)
+        return
+
+    for item in value:
+        validator(item)
 
 
-class _set_validator(object):
-    def __init__(self, validator, min_length, max_length, required):
+class _set_validator(_validator):
+    __slots__ = (
+        '__validator', '__min_length', '__max_length', '__max_errors',
+        '__required',
+    )
+
+    def __init__(
+        self, validator, min_length, max_length, max_errors, required,
+    ):
         self.__validator = validator
 
         _validate_int(min_length, min_value=0, required=False)
@@ -285,16 +465,53 @@ class _set_validator(object):
         self.__min_length = min_length
         self.__max_length = max_length
 
+        _validate_int(max_errors, min_value=1, required=False)
+        self.__max_errors = max_errors
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__validator,
+            self.__min_length, self.__max_length,
+            self.__max_errors,
+            self.__required,
+        )
+
     def __call__(self, value):
         _validate_set(
-            value, validator=self.__validator,
-            min_length=self.__min_length, max_length=self.__max_length,
-            required=self.__required,
+            value, self.__validator, self.__min_length, self.__max_length,
+            self.__max_errors, self.__required,
         )
 
+    def _compile(self, compiler, value):
+        if self.__max_errors is not None and not compiler.predicate:
+            compiler.call(self, value)
+            return
+
+        conditions = ['isinstance({value}, set)'.format(value=value)]
+
+        if self.__min_length is not None:
+            conditions.append('len({value}) >= {min}'.format(
+                value=value, min=compiler.constant(self.__min_length),
+            ))
+
+        if self.__max_length is not None:
+            conditions.append('len({value}) <= {max}'.format(
+                value=value, max=compiler.constant(self.__max_length),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+            if self.__validator is not None:
+                item = compiler.name('item')
+                with compiler.block('for {item} in {value}'.format(
+                    item=item, value=value,
+                )):
+                    compiler.emit(self.__validator, item)
+
     def __repr__(self):
         args = []
         if self.__validator is not None:
@@ -312,6 +529,11 @@ class _set_validator(object):
                 max_length=self.__max_length,
             ))
 
+        if self.__max_errors is not None:
+            args.append('max_errors={max_errors!r}'.format(
+                max_errors=self.__max_errors,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -320,10 +542,14 @@ class _set_validator(object):
         return 'validate_set({args})'.format(args=', '.join(args))
 
 
+_set_validator_cache = make_validator_cache(_set_validator)
+
+
 def validate_set(
     value=_undefined,
     validator=None,
     min_length=None, max_length=None,
+    max_errors=None,
     required=True,
 ):
     """
@@ -340,23 +566,40 @@ def validate_set(
     :param int max_length:
         The maximum acceptable number of entries in the set.  If `None`, the
         maximum size is not checked.
+    :param int max_errors:
+        If set, collect up to this many errors rather than stopping at the
+        first.  Defaults to `None`.
     :param bool required:
         Whether the value can be `None`.  Defaults to `True`.
     """
-    validate = _set_validator(
-        min_length=min_length, max_length=max_length,
-        validator=validator, required=required,
-    )
-
     if value is not _undefined:
+        validate = _set_validator_cache(
+            validator, min_length, max_length, max_errors, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_set_validator(
+            min_length=min_length, max_length=max_length,
+            validator=validator, max_errors=max_errors, required=required,
+        ))
+
+
+def _mapping_checks(value, key_validator, value_validator):
+    for item_key, item_value in value.items():
+        if key_validator is not None:
+            yield key_validator, item_key, "invalid key {key!r}", item_key
+
+        if value_validator is not None:
+            yield (
+                value_validator, item_value,
+                "invalid value for key {key!r}", item_key,
+            )
 
 
 def _validate_mapping(
     value,
     key_validator=None, value_validator=None,
+    max_errors=None,
     required=True,
 ):
     if value is None:
@@ -369,14 +612,19 @@ def _validate_mapping(
             "expected 'dict', but value is of type {cls!r}"
         ).format(cls=value.__class__.__name__))
 
+    if max_errors is not None:
+        _collect_errors(
+            _mapping_checks(value, key_validator, value_validator),
+            max_errors,
+        )
+        return
+
     for item_key, item_value in value.items():
         if key_validator is not None:
             try:
                 key_validator(item_key)
             except (TypeError, ValueError, KeyError):
-                _try_contextualize_exception(
-                    "invalid key {key!r}".format(key=item_key),
-                )
+                _try_contextualize_exception("invalid key {key!r}", item_key)
                 raise
 
         if value_validator is not None:
@@ -384,27 +632,71 @@ def _validate_mapping(
                 value_validator(item_value)
             except (TypeError, ValueError, KeyError):
                 _try_contextualize_exception(
-                    "invalid value for key {key!r}".format(key=item_key),
+                    "invalid value for key {key!r}", item_key,
                 )
                 raise
 
 
-class _mapping_validator(object):
-    def __init__(self, key_validator, value_validator, required):
+class _mapping_validator(_validator):
+    __slots__ = (
+        '__key_validator', '__value_validator', '__max_errors', '__required',
+    )
+
+    def __init__(self, key_validator, value_validator, max_errors, required):
         self.__key_validator = key_validator
         self.__value_validator = value_validator
 
+        _validate_int(max_errors, min_value=1, required=False)
+        self.__max_errors = max_errors
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__key_validator, self.__value_validator,
+            self.__max_errors,
+            self.__required,
+        )
+
     def __call__(self, value):
         _validate_mapping(
-            value,
-            key_validator=self.__key_validator,
-            value_validator=self.__value_validator,
-            required=self.__required,
+            value, self.__key_validator, self.__value_validator,
+            self.__max_errors, self.__required,
         )
 
+    def _compile(self, compiler, value):
+        if self.__max_errors is not None and not compiler.predicate:
+            compiler.call(self, value)
+            return
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, [
+                'isinstance({value}, dict)'.format(value=value),
+            ])
+
+            if self.__key_validator is None and self.__value_validator is None:
+                return
+
+            item_key = compiler.name('key')
+            item_value = compiler.name('value')
+            with compiler.block(
+                'for {key}, {item} in {value}.items()'.format(
+                    key=item_key, item=item_value, value=value,
+                )
+            ):
+                if self.__key_validator is not None:
+                    with compiler.contextualize(
+                        "invalid key {key!r}", item_key,
+                    ):
+                        compiler.emit(self.__key_validator, item_key)
+
+                if self.__value_validator is not None:
+                    with compiler.contextualize(
+                        "invalid value for key {key!r}", item_key,
+                    ):
+                        compiler.emit(self.__value_validator, item_value)
+
     def __repr__(self):
         args = []
         if self.__key_validator is not None:
@@ -417,6 +709,11 @@ class _mapping_validator(object):
                 value_validator=self.__value_validator,
             ))
 
+        if self.__max_errors is not None:
+            args.append('max_errors={max_errors!r}'.format(
+                max_errors=self.__max_errors,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -425,9 +722,13 @@ class _mapping_validator(object):
         return 'validate_mapping({args})'.format(args=', '.join(args))
 
 
+_mapping_validator_cache = make_validator_cache(_mapping_validator)
+
+
 def validate_mapping(
     value=_undefined,
     key_validator=None, value_validator=None,
+    max_errors=None,
     required=True,
 ):
     """
@@ -446,24 +747,63 @@ def validate_mapping(
     :param func value_validator:
         Optional function to be call to check each of the values in the
         dictionary.
+    :param int max_errors:
+        If set, collect up to this many errors rather than stopping at the
+        first.  Defaults to `None`.
     :param bool required:
         Whether the value can't be `None`. Defaults to `True`.
     """
-    validate = _mapping_validator(
-        key_validator=key_validator,
-        value_validator=value_validator,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _mapping_validator_cache(
+            key_validator, value_validator, max_errors, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_mapping_validator(
+            key_validator=key_validator,
+            value_validator=value_validator,
+            max_errors=max_errors,
+            required=required,
+        ))
+
+
+def _missing_key_error(key):
+    return KeyError((
+        "dictionary missing expected key: {key!r}"
+    ).format(key=key))
+
+
+def _unexpected_keys_error(unexpected_keys):
+    return ValueError((
+        "dictionary contains unexpected keys: {unexpected}"
+    ).format(
+        unexpected=', '.join(
+            repr(unexpected) for unexpected in unexpected_keys
+        )
+    ))
+
+
+def _structure_checks(value, schema, allow_extra, missing_as_none):
+    for key, validator in schema.items():
+        if not missing_as_none and key not in value:
+            yield _raise, _missing_key_error(key), None, None
+        else:
+            yield (
+                validator, value.get(key, None),
+                "invalid value for key {key!r}", key,
+            )
+
+    if not allow_extra and set(value) - set(schema):
+        yield (
+            _raise, _unexpected_keys_error(set(value) - set(schema)),
+            None, None,
+        )
 
 
 def _validate_structure(
     value,
     schema=None, allow_extra=False, missing_as_none=False,
+    max_errors=None,
     required=True,
 ):
     if value is None:
@@ -476,34 +816,41 @@ def _validate_structure(
             "expected 'dict' but value is of type {cls!r}"
         ).format(cls=value.__class__.__name__))
 
-    if schema is not None:
-        for key, validator in schema.items():
-            if not missing_as_none and key not in value:
-                raise KeyError((
-                    "dictionary missing expected key: {key!r}"
-                ).format(key=key))
+    if schema is None:
+        return
 
-            try:
-                validator(value.get(key, None))
-            except (TypeError, ValueError, KeyError):
-                _try_contextualize_exception(
-                    "invalid value for key {key!r}".format(key=key),
-                )
-                raise
+    if max_errors is not None:
+        _collect_errors(
+            _structure_checks(value, schema, allow_extra, missing_as_none),
+            max_errors,
+        )
+        return
 
-        if not allow_extra and set(value) - set(schema):
-            raise ValueError((
-                "dictionary contains unexpected keys: {unexpected}"
-            ).format(
-                unexpected=', '.join(
-                    repr(unexpected)
-                    for unexpected in set(value) - set(schema)
-                )
-            ))
+    for key, validator in schema.items():
+        if not missing_as_none and key not in value:
+            raise _missing_key_error(key)
+
+        try:
+            validator(value.get(key, None))
+        except (TypeError, ValueError, KeyError):
+            _try_contextualize_exception(
+                "invalid value for key {key!r}", key,
+            )
+            raise
 
+    if not allow_extra and set(value) - set(schema):
+        raise _unexpected_keys_error(set(value) - set(schema))
 
-class _structure_validator(object):
-    def __init__(self, schema, allow_extra, missing_as_none, required):
+
+class _structure_validator(_validator):
+    __slots__ = (
+        '__schema', '__allow_extra', '__missing_as_none', '__max_errors',
+        '__required',
+    )
+
+    def __init__(
+        self, schema, allow_extra, missing_as_none, max_errors, required,
+    ):
         _validate_structure(schema, schema=None, required=False)
         if schema is not None:
             # Make a copy of the schema to make sure it won't be mutated while
@@ -517,18 +864,90 @@ class _structure_validator(object):
         _validate_bool(missing_as_none)
         self.__missing_as_none = missing_as_none
 
+        _validate_int(max_errors, min_value=1, required=False)
+        self.__max_errors = max_errors
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        if self.__schema is not None:
+            schema = tuple(self.__schema.items())
+        else:
+            schema = None
+
+        return (
+            schema, self.__allow_extra, self.__missing_as_none,
+            self.__max_errors,
+            self.__required,
+        )
+
+    def __reduce__(self):
+        return type(self), (
+            self.__schema, self.__allow_extra, self.__missing_as_none,
+            self.__max_errors,
+            self.__required,
+        )
+
     def __call__(self, value):
         _validate_structure(
-            value,
-            schema=self.__schema,
-            allow_extra=self.__allow_extra,
-            missing_as_none=self.__missing_as_none,
-            required=self.__required,
+            value, self.__schema, self.__allow_extra, self.__missing_as_none,
+            self.__max_errors, self.__required,
         )
 
+    def _compile(self, compiler, value):
+        if self.__max_errors is not None and not compiler.predicate:
+            compiler.call(self, value)
+            return
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, [
+                'isinstance({value}, dict)'.format(value=value),
+            ])
+
+            if self.__schema is None:
+                return
+
+            for key, validator in self.__schema.items():
+                key_expression = compiler.constant(key)
+                item = compiler.name('item')
+
+                if self.__missing_as_none:
+                    compiler.line('{item} = {value}.get({key})'.format(
+                        item=item, value=value, key=key_expression,
+                    ))
+                else:
+                    compiler.check(self, value, [
+                        '{key} in {value}'.format(
+                            key=key_expression, value=value,
+                        ),
+                    ])
+                    compiler.line('{item} = {value}[{key}]'.format(
+                        item=item, value=value, key=key_expression,
+                    ))
+
+                with compiler.contextualize(
+                    "invalid value for key {key!r}", key_expression,
+                ):
+                    compiler.emit(validator, item)
+
+            if not self.__allow_extra:
+                if self.__missing_as_none:
+                    compiler.check(self, value, [
+                        '{keys}.issuperset({value})'.format(
+                            keys=compiler.constant(frozenset(self.__schema)),
+                            value=value,
+                        ),
+                    ])
+                else:
+                    # All keys in the schema are known to be present, so any
+                    # difference in length must be due to unexpected keys.
+                    compiler.check(self, value, [
+                        'len({value}) == {length}'.format(
+                            value=value, length=len(self.__schema),
+                        ),
+                    ])
+
     def __repr__(self):
         args = []
         if self.__schema is not None:
@@ -546,6 +965,11 @@ class _structure_validator(object):
                 missing_as_none=self.__missing_as_none,
             ))
 
+        if self.__max_errors is not None:
+            args.append('max_errors={max_errors!r}'.format(
+                max_errors=self.__max_errors,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -554,11 +978,15 @@ class _structure_validator(object):
         return 'validate_structure({args})'.format(args=', '.join(args))
 
 
+_structure_validator_cache = make_validator_cache(_structure_validator)
+
+
 def validate_structure(
     value=_undefined,
     schema=None,
     allow_extra=False,
     missing_as_none=False,
+    max_errors=None,
     required=True,
 ):
     """
@@ -592,26 +1020,32 @@ def validate_structure(
         Set to treat keys that are absent from the structure as if they had
         been set to None.  Default is to raise an error if any keys are
         missing.
+    :param int max_errors:
+        If set, collect up to this many errors rather than stopping at the
+        first.  Defaults to `None`.
     :param bool required:
         Whether the value can't be `None`. Defaults to True.
     """
-    validate = _structure_validator(
-        schema=schema,
-        allow_extra=allow_extra,
-        missing_as_none=missing_as_none,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _structure_validator_cache(
+            schema, allow_extra, missing_as_none, max_errors, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_structure_validator(
+            schema=schema,
+            allow_extra=allow_extra,
+            missing_as_none=missing_as_none,
+            max_errors=max_errors,
+            required=required,
+        ))
 
 
 def _validate_tuple(
     value,
     schema=None,
     length=None,
+    max_errors=None,
     required=True,
 ):
     if value is None:
@@ -636,19 +1070,32 @@ def _validate_tuple(
             "but value is of length {actual}"
         ).format(expected=length, actual=len(value)))
 
-    if schema is not None:
-        for index, entry, validator in zip(itertools.count(), value, schema):
-            try:
-                validator(entry)
-            except (TypeError, ValueError, KeyError):
-                _try_contextualize_exception(
-                    "invalid value at index {index}".format(index=index),
-                )
-                raise
+    if schema is None:
+        return
+
+    if max_errors is not None:
+        _collect_errors((
+            (validator, entry, "invalid value at index {key}", index)
+            for index, entry, validator in zip(
+                itertools.count(), value, schema,
+            )
+        ), max_errors)
+        return
 
+    for index, entry, validator in zip(itertools.count(), value, schema):
+        try:
+            validator(entry)
+        except (TypeError, ValueError, KeyError):
+            _try_contextualize_exception(
+                "invalid value at index {key}", index,
+            )
+            raise
+
+
+class _tuple_validator(_validator):
+    __slots__ = ('__length', '__schema', '__max_errors', '__required')
 
-class _tuple_validator(object):
-    def __init__(self, length, schema, required):
+    def __init__(self, length, schema, max_errors, required):
         if length is not None and schema is not None:
             raise TypeError(
                 "length and schema arguments are mutually exclusive",
@@ -660,17 +1107,56 @@ class _tuple_validator(object):
         _validate_tuple(schema, schema=None, required=False)
         self.__schema = schema
 
+        _validate_int(max_errors, min_value=1, required=False)
+        self.__max_errors = max_errors
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__length, self.__schema, self.__max_errors, self.__required,
+        )
+
     def __call__(self, value):
         _validate_tuple(
-            value,
-            length=self.__length,
-            schema=self.__schema,
-            required=self.__required,
+            value, self.__schema, self.__length, self.__max_errors,
+            self.__required,
         )
 
+    def _compile(self, compiler, value):
+        if self.__max_errors is not None and not compiler.predicate:
+            compiler.call(self, value)
+            return
+
+        if self.__schema is not None:
+            length = len(self.__schema)
+        else:
+            length = self.__length
+
+        conditions = ['isinstance({value}, tuple)'.format(value=value)]
+
+        if length is not None:
+            conditions.append('len({value}) == {length}'.format(
+                value=value, length=compiler.constant(length),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+            if self.__schema is None:
+                return
+
+            for index, validator in enumerate(self.__schema):
+                item = compiler.name('item')
+                compiler.line('{item} = {value}[{index}]'.format(
+                    item=item, value=value, index=index,
+                ))
+                with compiler.contextualize(
+                    "invalid value at index {key}", repr(index),
+                ):
+                    compiler.emit(validator, item)
+
     def __repr__(self):
         args = []
         if self.__schema is not None:
@@ -683,6 +1169,11 @@ class _tuple_validator(object):
                 length=self.__length,
             ))
 
+        if self.__max_errors is not None:
+            args.append('max_errors={max_errors!r}'.format(
+                max_errors=self.__max_errors,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -691,9 +1182,13 @@ class _tuple_validator(object):
         return 'validate_tuple({args})'.format(args=', '.join(args))
 
 
+_tuple_validator_cache = make_validator_cache(_tuple_validator)
+
+
 def validate_tuple(
     value=_undefined,
     schema=None, length=None,
+    max_errors=None,
     required=True,
 ):
     """
@@ -723,14 +1218,19 @@ def validate_tuple(
     :param int length:
         The maximum length of the tuple.  `schema` and `length` arguments
         are mutually exclusive and must not be passed at the same time.
+    :param int max_errors:
+        If set, collect up to this many errors rather than stopping at the
+        first.  Defaults to `None`.
     :param bool required:
         Whether the value can't be `None`. Defaults to True.
     """
-    validate = _tuple_validator(
-        length=length, schema=schema, required=required,
-    )
-
     if value is not _undefined:
+        validate = _tuple_validator_cache(
+            length, schema, max_errors, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_tuple_validator(
+            length=length, schema=schema, max_errors=max_errors,
+            required=required,
+        ))
@@ -3,6 +3,8 @@ from typing import (
 )
 from datetime import date, datetime
 
+from .common import _validator
+
 
 T = TypeVar('T')
 
@@ -11,7 +13,9 @@ T = TypeVar('T')
 def validate_list(
     value: List[T],
     *, min_length: int=None, max_length: int=None,
+    allow_arrays: bool=False,
     validator: Callable[[T], None]=None,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -20,8 +24,10 @@ def validate_list(
 def validate_list(
     value: Optional[List[T]],
     *, min_length: int=None, max_length: int=None,
+    allow_arrays: bool=False,
     validator: Callable[[T], None]=None,
     required: bool,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -29,32 +35,40 @@ def validate_list(
 @overload
 def validate_list(
     *, min_length: int=None, max_length: int=None,
-) -> Callable[[List], None]:
+    allow_arrays: bool=False,
+    max_errors: int=None,
+) -> _validator[List]:
     ...
 
 
 @overload
 def validate_list(
     *, min_length: int=None, max_length: int=None,
+    allow_arrays: bool=False,
     required: bool,
-) -> Callable[[Optional[List]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[List]]:
     ...
 
 
 @overload
 def validate_list(
     *, min_length: int=None, max_length: int=None,
+    allow_arrays: bool=False,
     validator: Callable[[T], None],
-) -> Callable[[List[T]], None]:
+    max_errors: int=None,
+) -> _validator[List[T]]:
     ...
 
 
 @overload
 def validate_list(
     *, min_length: int=None, max_length: int=None,
+    allow_arrays: bool=False,
     validator: Callable[[T], None],
     required: bool,
-) -> Callable[[Optional[List[T]]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[List[T]]]:
     ...
 
 
@@ -63,6 +77,7 @@ def validate_set(
     value: Set[T],
     *, min_length: int=None, max_length: int=None,
     validator: Callable[[T], None]=None,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -73,6 +88,7 @@ def validate_set(
     *, min_length: int=None, max_length: int=None,
     validator: Callable[[T], None]=None,
     required: bool,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -80,7 +96,8 @@ def validate_set(
 @overload
 def validate_set(
     *, min_length: int=None, max_length: int=None,
-) -> Callable[[Set], None]:
+    max_errors: int=None,
+) -> _validator[Set]:
     ...
 
 
@@ -88,7 +105,8 @@ def validate_set(
 def validate_set(
     *, min_length: int=None, max_length: int=None,
     required: bool,
-) -> Callable[[Optional[Set]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Set]]:
     ...
 
 
@@ -96,7 +114,8 @@ def validate_set(
 def validate_set(
     *, min_length: int=None, max_length: int=None,
     validator: Callable[[T], None],
-) -> Callable[[Set[T]], None]:
+    max_errors: int=None,
+) -> _validator[Set[T]]:
     ...
 
 
@@ -105,7 +124,8 @@ def validate_set(
     *, min_length: int=None, max_length: int=None,
     validator: Callable[[T], None],
     required: bool,
-) -> Callable[[Optional[Set[T]]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Set[T]]]:
     ...
 
 
@@ -118,6 +138,7 @@ def validate_mapping(
     value: Dict[K, V],
     *, key_validator: Callable[[K], None]=None,
     value_validator: Callable[[V], None]=None,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -128,26 +149,31 @@ def validate_mapping(
     *, required: bool,
     key_validator: Callable[[K], None]=None,
     value_validator: Callable[[V], None]=None,
+    max_errors: int=None,
 ) -> None:
     ...
 
 
 @overload
-def validate_mapping() -> Callable[[Dict[object, object]], None]:
+def validate_mapping(
+    *, max_errors: int=None,
+) -> _validator[Dict[object, object]]:
     ...
 
 
 @overload
 def validate_mapping(
     *, key_validator: Callable[[K], None],
-) -> Callable[[Dict[K, object]], None]:
+    max_errors: int=None,
+) -> _validator[Dict[K, object]]:
     ...
 
 
 @overload
 def validate_mapping(
     *, value_validator: Callable[[V], None],
-) -> Callable[[Dict[object, V]], None]:
+    max_errors: int=None,
+) -> _validator[Dict[object, V]]:
     ...
 
 
@@ -155,14 +181,16 @@ def validate_mapping(
 def validate_mapping(
     *, key_validator: Callable[[K], None],
     value_validator: Callable[[V], None],
-) -> Callable[[Dict[K, V]], None]:
+    max_errors: int=None,
+) -> _validator[Dict[K, V]]:
     ...
 
 
 @overload
 def validate_mapping(
     *, required: bool,
-) -> Callable[[Optional[Dict[object, object]]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Dict[object, object]]]:
     ...
 
 
@@ -170,7 +198,8 @@ def validate_mapping(
 def validate_mapping(
     *, required: bool,
     key_validator: Callable[[K], None],
-) -> Callable[[Optional[Dict[K, object]]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Dict[K, object]]]:
     ...
 
 
@@ -178,7 +207,8 @@ def validate_mapping(
 def validate_mapping(
     *, required: bool,
     value_validator: Callable[[V], None],
-) -> Callable[[Optional[Dict[object, V]]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Dict[object, V]]]:
     ...
 
 
@@ -187,7 +217,8 @@ def validate_mapping(
     *, required: bool,
     key_validator: Callable[[K], None],
     value_validator: Callable[[V], None],
-) -> Callable[[Optional[Dict[K, V]]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Dict[K, V]]]:
     ...
 
 
@@ -198,6 +229,7 @@ def validate_structure(
     schema: Dict=None,
     allow_extra: bool=False,
     missing_as_none: bool=False,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -210,6 +242,7 @@ def validate_structure(
     allow_extra: bool=False,
     missing_as_none: bool=False,
     required: bool,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -220,7 +253,8 @@ def validate_structure(
     schema: Dict=None,
     allow_extra: bool=False,
     missing_as_none: bool=False,
-) -> Callable[[Dict], None]:
+    max_errors: int=None,
+) -> _validator[Dict]:
     ...
 
 
@@ -231,7 +265,8 @@ def validate_structure(
     allow_extra: bool=False,
     missing_as_none: bool=False,
     required: bool,
-) -> Callable[[Optional[Dict]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Dict]]:
     ...
 
 
@@ -240,6 +275,7 @@ def validate_tuple(
     value: Tuple,
     *, schema: Tuple=None,
     length: int=None,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -250,6 +286,7 @@ def validate_tuple(
     *, required: bool,
     schema: Tuple=None,
     length: int=None,
+    max_errors: int=None,
 ) -> None:
     ...
 
@@ -258,7 +295,8 @@ def validate_tuple(
 def validate_tuple(
     *, schema: Tuple=None,
     length: int=None,
-) -> Callable[[Tuple], None]:
+    max_errors: int=None,
+) -> _validator[Tuple]:
     ...
 
 @overload
@@ -266,5 +304,6 @@ def validate_tuple(
     *, required: bool,
     schema: Tuple=None,
     length: int=None,
-) -> Callable[[Optional[Tuple]], None]:
+    max_errors: int=None,
+) -> _validator[Optional[Tuple]]:
     ...
@@ -3,7 +3,10 @@ from __future__ import absolute_import
 from datetime import date, datetime, timedelta
 
 from .core import _validate_bool
-from .common import make_optional_argument_default
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator,
+)
 
 
 _undefined = make_optional_argument_default()
@@ -24,13 +27,29 @@ def _validate_date(value, required=True):
         ).format(cls=value.__class__.__name__))
 
 
-class _date_validator(object):
+class _date_validator(_validator):
+    __slots__ = ('__required',)
+
     def __init__(self, required):
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (self.__required,)
+
     def __call__(self, value):
-        _validate_date(value, required=self.__required)
+        _validate_date(value, self.__required)
+
+    def _compile(self, compiler, value):
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, [
+                'isinstance({value}, {date})'.format(
+                    value=value, date=compiler.constant(date),
+                ),
+                'not isinstance({value}, {datetime})'.format(
+                    value=value, datetime=compiler.constant(datetime),
+                ),
+            ])
 
     def __repr__(self):
         args = []
@@ -42,6 +61,9 @@ class _date_validator(object):
         return 'validate_date({args})'.format(args=', '.join(args))
 
 
+_date_validator_cache = make_validator_cache(_date_validator)
+
+
 def validate_date(value=_undefined, required=True):
     """
     Checks that the value is a valid :class:`datetime.date` value.
@@ -55,12 +77,11 @@ def validate_date(value=_undefined, required=True):
         If the value is not a date, or if it was marked as `required` but
         None was passed in.
     """
-    validate = _date_validator(required=required)
-
     if value is not _undefined:
+        validate = _date_validator_cache(required)
         validate(value)
     else:
-        return validate
+        return intern_validator(_date_validator(required=required))
 
 
 def _validate_datetime(value, required=True):
@@ -80,13 +101,27 @@ def _validate_datetime(value, required=True):
         ))
 
 
-class _datetime_validator(object):
+class _datetime_validator(_validator):
+    __slots__ = ('__required',)
+
     def __init__(self, required):
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (self.__required,)
+
     def __call__(self, value):
-        _validate_datetime(value, required=self.__required)
+        _validate_datetime(value, self.__required)
+
+    def _compile(self, compiler, value):
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, [
+                'isinstance({value}, {datetime})'.format(
+                    value=value, datetime=compiler.constant(datetime),
+                ),
+                '{value}.tzinfo is not None'.format(value=value),
+            ])
 
     def __repr__(self):
         args = []
@@ -98,6 +133,9 @@ class _datetime_validator(object):
         return 'validate_datetime({args})'.format(args=', '.join(args))
 
 
+_datetime_validator_cache = make_validator_cache(_datetime_validator)
+
+
 def validate_datetime(value=_undefined, required=True):
     """
     Checks that the value is a valid :class:`datetime.datetime` value.
@@ -116,12 +154,11 @@ def validate_datetime(value=_undefined, required=True):
     :raises ValueError:
         If the value does not have a valid timezone.
     """
-    validate = _datetime_validator(required=required)
-
     if value is not _undefined:
+        validate = _datetime_validator_cache(required)
         validate(value)
     else:
-        return validate
+        return intern_validator(_datetime_validator(required=required))
 
 
 def _validate_timedelta(value, min_value=None, max_value=None, required=True):
@@ -146,7 +183,9 @@ def _validate_timedelta(value, min_value=None, max_value=None, required=True):
         ).format(value=value, max=max_value))
 
 
-class _timedelta_validator(object):
+class _timedelta_validator(_validator):
+    __slots__ = ('__min_value', '__max_value', '__required')
+
     def __init__(self, min_value, max_value, required):
         _validate_timedelta(min_value, required=False)
         _validate_timedelta(max_value, required=False)
@@ -161,9 +200,20 @@ class _timedelta_validator(object):
         self.__max_value = max_value
         self.__required = required
 
+    def _key(self):
+        return (self.__min_value, self.__max_value, self.__required)
+
     def __call__(self, value):
         _validate_timedelta(value, required=self.__required)
 
+    def _compile(self, compiler, value):
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, [
+                'isinstance({value}, {timedelta})'.format(
+                    value=value, timedelta=compiler.constant(timedelta),
+                ),
+            ])
+
     def __repr__(self):
         args = []
         if self.__min_value is not None:
@@ -184,6 +234,9 @@ class _timedelta_validator(object):
         return 'validate_timedelta({args})'.format(args=', '.join(args))
 
 
+_timedelta_validator_cache = make_validator_cache(_timedelta_validator)
+
+
 def validate_timedelta(
     value=_undefined,
     min_value=None,
@@ -211,11 +264,10 @@ def validate_timedelta(
     :raises ValueError:
         If the value is not within bounds.
     """
-    validate = _timedelta_validator(
-        min_value=min_value, max_value=max_value, required=required
-    )
-
     if value is not _undefined:
+        validate = _timedelta_validator_cache(min_value, max_value, required)
         validate(value)
     else:
-        return validate
+        return intern_validator(_timedelta_validator(
+            min_value=min_value, max_value=max_value, required=required
+        ))
@@ -1,6 +1,8 @@
 from typing import overload, Callable, Optional
 from datetime import date, datetime, timedelta
 
+from .common import _validator
+
 
 @overload
 def validate_date(value: date) -> None:
@@ -16,14 +18,14 @@ def validate_date(
 
 
 @overload
-def validate_date() -> Callable[[date], None]:
+def validate_date() -> _validator[date]:
     ...
 
 
 @overload
 def validate_date(
     *, required: bool,
-) -> Callable[[Optional[date]], None]:
+) -> _validator[Optional[date]]:
     ...
 
 
@@ -41,14 +43,14 @@ def validate_datetime(
 
 
 @overload
-def validate_datetime() -> Callable[[datetime], None]:
+def validate_datetime() -> _validator[datetime]:
     ...
 
 
 @overload
 def validate_datetime(
     *, required: bool,
-) -> Callable[[Optional[datetime]], None]:
+) -> _validator[Optional[datetime]]:
     ...
 
 
@@ -77,7 +79,7 @@ def validate_timedelta(
     *,
     max_value: Optional[timedelta] = None,
     min_value: Optional[timedelta] = None,
-) -> Callable[[timedelta], None]:
+) -> _validator[timedelta]:
     ...
 
 
@@ -87,5 +89,5 @@ def validate_timedelta(
     max_value: Optional[timedelta] = None,
     min_value: Optional[timedelta] = None,
     required: bool,
-) -> Callable[[Optional[timedelta]], None]:
+) -> _validator[Optional[timedelta]]:
     ...
@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 
+import collections
 import re
+import threading
 import unicodedata
 # The `idna` package is only installed if `validation` is installed with the
 # `email` extras tag.
@@ -8,7 +10,11 @@ import idna
 import six
 
 from .core import _validate_bool
-from .common import make_optional_argument_default
+from .number import _validate_int
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator,
+)
 
 _undefined = make_optional_argument_default()
 
@@ -27,6 +33,14 @@ _DOT_ATOM_TEXT = "[" + _ATEXT + "]+(?:\\.[" + _ATEXT + "]+)*"
 _ATEXT_UTF8 = _ATEXT + u"\u0080-\U0010FFFF"
 _DOT_ATOM_TEXT_UTF8 = "[" + _ATEXT_UTF8 + "]+(?:\\.[" + _ATEXT_UTF8 + "]+)*"
 
+_LOCAL_PART_RE = re.compile(_DOT_ATOM_TEXT + "\\Z")
+_LOCAL_PART_UTF8_RE = re.compile(_DOT_ATOM_TEXT_UTF8 + "\\Z")
+
+# Match any single character that may not appear in a local part, so that all
+# of them can be found in one pass when reporting an error.
+_BAD_CHAR_RE = re.compile(u"[^" + _ATEXT + u"]")
+_BAD_CHAR_UTF8_RE = re.compile(u"[^" + _ATEXT_UTF8 + u"]")
+
 # The domain part of the email address, after IDNA (ASCII) encoding,
 # must also satisfy the requirements of RFC 952/RFC 1123 which restrict
 # the allowed characters of hostnames further. The hyphen cannot be at
@@ -37,6 +51,18 @@ _ATEXT_HOSTNAME = r"(?:(?:[a-zA-Z0-9][a-zA-Z0-9\-]*)?[a-zA-Z0-9])"
 # characters allowed in a hostname (see ATEXT_HOSTNAME above).
 _DOT_ATOM_TEXT_HOSTNAME = _ATEXT_HOSTNAME + r"(?:\." + _ATEXT_HOSTNAME + r")*"
 
+_HOSTNAME_RE = re.compile(_DOT_ATOM_TEXT_HOSTNAME + "\\Z")
+
+# A hostname that is already in the form that IDNA normalization would produce.
+# Labels are limited to 63 characters by RFC 1035 section 2.3.4.
+_PLAIN_HOSTNAME_LABEL = r"[a-z0-9](?:[a-z0-9\-]{0,61}[a-z0-9])?"
+_PLAIN_HOSTNAME_RE = re.compile(
+    _PLAIN_HOSTNAME_LABEL + r"(?:\." + _PLAIN_HOSTNAME_LABEL + r")*\Z"
+)
+
+# All TLDs end with a letter.
+_TLD_RE = re.compile(r"[A-Za-z]\Z")
+
 # Length constants
 # RFC 3696 + errata 1003 + errata 1690
 # (https://www.rfc-editor.org/errata_search.php?rfc=3696&eid=1690)
@@ -45,92 +71,12 @@ _EMAIL_MAX_LENGTH = 254
 _LOCAL_PART_MAX_LENGTH = 64
 _DOMAIN_MAX_LENGTH = 255
 
+# The `idna` package rejects domains longer than this, not counting a trailing
+# period.
+_IDNA_DOMAIN_MAX_LENGTH = 253
 
-def _validate_email_address(
-    value,
-    allow_unnormalized,
-    allow_smtputf8,
-    required,
-):
-    if value is None:
-        if required:
-            raise TypeError("required value is None")
-        return
-
-    if not isinstance(value, six.text_type):
-        raise TypeError(
-            ("expected unicode string, but value is of type {cls!r}").format(
-                cls=value.__class__.__name__
-            )
-        )
-
-    parts = value.split("@")
-    if len(parts) < 2:
-        raise ValueError("email address is missing an '@' sign")
-    if len(parts) > 2:
-        raise ValueError("email address contains multiple '@' signs")
-
-    local_part, domain = parts
-
-    # === Validate and normalize the email address' local part ===
-
-    if not local_part:
-        raise ValueError("expected local part before '@', but found nothing")
-
-    # RFC 5321 4.5.3.1.1
-    # We're checking the number of characters here. If the local part
-    # is ASCII-only, then that's the same as bytes (octets). If it's
-    # internationalized, then the UTF-8 encoding may be longer, but
-    # that may not be relevant. We will check the total address length
-    # instead.
-    if len(local_part) > _LOCAL_PART_MAX_LENGTH:
-        raise ValueError(
-            "expected at most 64 characters, "
-            "but local part contains {chars}".format(chars=len(local_part))
-        )
-
-    if re.match(_DOT_ATOM_TEXT + "\\Z", local_part):
-        # The local part is valid ascii.
-        normalized_local_part = local_part
-        ascii_local_part = local_part
-
-    else:
-        if not re.match(_DOT_ATOM_TEXT_UTF8 + "\\Z", local_part):
-            # It's not a valid internationalized address either. Report which
-            # characters were not valid.
-            bad_chars = ", ".join(
-                sorted(
-                    set(
-                        c
-                        for c in local_part
-                        if not re.match(
-                            u"["
-                            + (_ATEXT if not allow_smtputf8 else _ATEXT_UTF8)
-                            + u"]",
-                            c,
-                        )
-                    )
-                )
-            )
-            raise ValueError(
-                "local part contains invalid characters: {bad_chars!r}".format(
-                    bad_chars=bad_chars
-                )
-            )
-
-        if not allow_smtputf8:
-            raise ValueError("invalid non-ascii characters in local part")
-
-        # RFC 6532 section 3.1 also says that Unicode NFC normalization should
-        # be applied.
-        normalized_local_part = unicodedata.normalize("NFC", local_part)
-        ascii_local_part = None
-
-    # === Validate and normalize the email address' domain ===
-
-    if len(domain) == 0:
-        raise ValueError("expected domain name after '@', but found nothing")
 
+def _idna_normalize_domain(domain):
     # Perform UTS-46 normalization, which includes casefolding, NFC
     # normalization, and converting all label separators (the period/full
     # stop, fullwidth full stop, ideographic full stop, and halfwidth
@@ -194,6 +140,33 @@ def _validate_email_address(
             "domain name is not valid idna: {error}".format(error=e)
         )
 
+    return normalized_domain, ascii_domain
+
+
+def _is_plain_hostname(domain):
+    """
+    Returns `True` if `domain` is a lowercase ascii hostname, with no labels
+    that are too long and none that could be mistaken for an IDNA A-label.
+    Such hostnames are left unchanged by `_idna_normalize_domain`.
+    """
+    return bool(
+        len(domain) <= _IDNA_DOMAIN_MAX_LENGTH and
+        "--" not in domain and
+        _PLAIN_HOSTNAME_RE.match(domain)
+    )
+
+
+def _normalize_domain(domain):
+    """
+    Returns the canonical internationalized and the IDNA ASCII forms of a
+    non-empty domain name, or raises a `ValueError` if it isn't valid.
+    """
+    if _is_plain_hostname(domain):
+        # This is by far the most common case, so skip `idna` altogether.
+        normalized_domain = ascii_domain = domain
+    else:
+        normalized_domain, ascii_domain = _idna_normalize_domain(domain)
+
     # RFC 5321 4.5.3.1.2
     # We're checking the number of bytes (octets) here, which can be much
     # higher than the number of characters in internationalized domains, on
@@ -208,7 +181,7 @@ def _validate_email_address(
 
     # Check the regular expression. This is probably entirely redundant with
     # idna.decode, which also checks this format.
-    m = re.match(_DOT_ATOM_TEXT_HOSTNAME + "\\Z", ascii_domain)
+    m = _HOSTNAME_RE.match(ascii_domain)
     if not m:
         raise ValueError("unexpected characters in address domain")
 
@@ -218,11 +191,227 @@ def _validate_email_address(
         raise ValueError(
             "expected a subdomain of a tld, but domain is missing a period"
         )
-    if not re.search(r"[A-Za-z]\Z", ascii_domain):
+    if not _TLD_RE.search(ascii_domain):
         raise ValueError(
             "expected a subdomain of a tld, but tld does not match pattern"
         )
 
+    return normalized_domain, ascii_domain
+
+
+_CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'],
+)
+
+
+class _DomainCache(object):
+    """
+    A thread safe, bounded, least recently used cache of the results of
+    `_normalize_domain`.
+
+    Most addresses in a large list share a small number of domains, and IDNA
+    normalization is far more expensive than all of the other checks put
+    together.  Failures are cached as messages rather than as exception
+    objects so that each caller gets a fresh exception with its own
+    traceback.
+    """
+    def __init__(self, maxsize):
+        self.__lock = threading.Lock()
+        self.__entries = collections.OrderedDict()
+        self.__maxsize = maxsize
+        self.__hits = 0
+        self.__misses = 0
+
+    def lookup(self, domain):
+        with self.__lock:
+            try:
+                # Re-insert to mark as most recently used.
+                result = self.__entries.pop(domain)
+            except KeyError:
+                self.__misses += 1
+            else:
+                self.__entries[domain] = result
+                self.__hits += 1
+                return result
+
+        # Normalization is done without the lock held.  Two threads may race
+        # to normalize the same domain, but they will get the same answer.
+        try:
+            normalized_domain, ascii_domain = _normalize_domain(domain)
+        except ValueError as e:
+            result = (None, None, six.text_type(e))
+        else:
+            result = (normalized_domain, ascii_domain, None)
+
+        with self.__lock:
+            if self.__maxsize > 0:
+                self.__entries[domain] = result
+                while len(self.__entries) > self.__maxsize:
+                    self.__entries.popitem(last=False)
+        return result
+
+    def resize(self, maxsize):
+        with self.__lock:
+            self.__maxsize = maxsize
+            while len(self.__entries) > maxsize:
+                self.__entries.popitem(last=False)
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
+            self.__hits = 0
+            self.__misses = 0
+
+    def info(self):
+        with self.__lock:
+            return _CacheInfo(
+                self.__hits, self.__misses, self.__maxsize,
+                len(self.__entries),
+            )
+
+
+_domain_cache = _DomainCache(maxsize=4096)
+
+
+def set_domain_cache_size(maxsize):
+    """
+    Sets the maximum number of distinct domains for which the result of IDNA
+    normalization will be remembered.  Least recently used domains are
+    discarded first.  Set to `0` to disable caching.  Defaults to `4096`.
+
+    :param int maxsize:
+        The new maximum size of the cache.
+    """
+    _validate_int(maxsize, min_value=0)
+    _domain_cache.resize(maxsize)
+
+
+def domain_cache_info():
+    """
+    Returns a named tuple of `hits`, `misses`, `maxsize` and `currsize`,
+    describing the effectiveness of the domain normalization cache, in the
+    same form as `functools.lru_cache`.
+    """
+    return _domain_cache.info()
+
+
+def clear_domain_cache():
+    """
+    Empties the domain normalization cache and resets its statistics.
+    """
+    _domain_cache.clear()
+
+
+def _validate_email_address(
+    value,
+    allow_unnormalized,
+    allow_smtputf8,
+    required,
+):
+    if value is None:
+        if required:
+            raise TypeError("required value is None")
+        return
+
+    local_part, domain = _split_email_address(value)
+
+    normalized_local_part, ascii_local_part = _normalize_local_part(
+        local_part, allow_smtputf8,
+    )
+
+    if not domain:
+        raise ValueError("expected domain name after '@', but found nothing")
+
+    normalized_domain, ascii_domain, error = _domain_cache.lookup(domain)
+    if error is not None:
+        raise ValueError(error)
+
+    _check_email_address(
+        value,
+        normalized_local_part, ascii_local_part,
+        normalized_domain, ascii_domain,
+        allow_unnormalized,
+    )
+
+
+def _split_email_address(value):
+    if not isinstance(value, six.text_type):
+        raise TypeError(
+            ("expected unicode string, but value is of type {cls!r}").format(
+                cls=value.__class__.__name__
+            )
+        )
+
+    parts = value.split("@")
+    if len(parts) < 2:
+        raise ValueError("email address is missing an '@' sign")
+    if len(parts) > 2:
+        raise ValueError("email address contains multiple '@' signs")
+
+    local_part, domain = parts
+    return local_part, domain
+
+
+def _normalize_local_part(local_part, allow_smtputf8):
+    """
+    Returns the NFC normalized and the ASCII forms of the local part of an
+    email address, or raises a `ValueError` if it isn't valid.  The ASCII
+    form will be `None` if the local part is internationalized.
+    """
+    if not local_part:
+        raise ValueError("expected local part before '@', but found nothing")
+
+    # RFC 5321 4.5.3.1.1
+    # We're checking the number of characters here. If the local part
+    # is ASCII-only, then that's the same as bytes (octets). If it's
+    # internationalized, then the UTF-8 encoding may be longer, but
+    # that may not be relevant. We will check the total address length
+    # instead.
+    if len(local_part) > _LOCAL_PART_MAX_LENGTH:
+        raise ValueError(
+            "expected at most 64 characters, "
+            "but local part contains {chars}".format(chars=len(local_part))
+        )
+
+    if _LOCAL_PART_RE.match(local_part):
+        # The local part is valid ascii.
+        normalized_local_part = local_part
+        ascii_local_part = local_part
+
+    else:
+        if not _LOCAL_PART_UTF8_RE.match(local_part):
+            # It's not a valid internationalized address either. Report which
+            # characters were not valid.
+            if allow_smtputf8:
+                bad_char_re = _BAD_CHAR_UTF8_RE
+            else:
+                bad_char_re = _BAD_CHAR_RE
+            bad_chars = ", ".join(
+                sorted(set(bad_char_re.findall(local_part)))
+            )
+            raise ValueError(
+                "local part contains invalid characters: {bad_chars!r}".format(
+                    bad_chars=bad_chars
+                )
+            )
+
+        if not allow_smtputf8:
+            raise ValueError("invalid non-ascii characters in local part")
+
+        # RFC 6532 section 3.1 also says that Unicode NFC normalization should
+        # be applied.
+        normalized_local_part = unicodedata.normalize("NFC", local_part)
+        ascii_local_part = None
+
+    return normalized_local_part, ascii_local_part
+
+
+def _check_email_address(
+    value,
+    normalized_local_part, ascii_local_part,
+    normalized_domain, ascii_domain,
+    allow_unnormalized,
+):
     # === Check bulk properties of the email address ===
 
     normalized_email = normalized_local_part + "@" + normalized_domain
@@ -263,7 +452,9 @@ def _validate_email_address(
         raise ValueError("email address is not normalised")
 
 
-class _email_address_validator(object):
+class _email_address_validator(_validator):
+    __slots__ = ('__allow_unnormalized', '__allow_smtputf8', '__required')
+
     def __init__(self, allow_unnormalized, allow_smtputf8, required):
         _validate_bool(allow_unnormalized)
         self.__allow_unnormalized = allow_unnormalized
@@ -274,12 +465,16 @@ class _email_address_validator(object):
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__allow_unnormalized, self.__allow_smtputf8,
+            self.__required,
+        )
+
     def __call__(self, value):
         _validate_email_address(
-            value,
-            allow_unnormalized=self.__allow_unnormalized,
-            allow_smtputf8=self.__allow_smtputf8,
-            required=self.__required,
+            value, self.__allow_unnormalized, self.__allow_smtputf8,
+            self.__required,
         )
 
     def __repr__(self):
@@ -300,6 +495,9 @@ class _email_address_validator(object):
         return "validate_email_address({args})".format(args=", ".join(args))
 
 
+_email_address_validator_cache = make_validator_cache(_email_address_validator)
+
+
 def validate_email_address(
     value=_undefined,
     allow_unnormalized=False,
@@ -338,13 +536,134 @@ def validate_email_address(
     :raises ValueError:
         If the value is not an email address, or is not normalized.
     """
-    validate = _email_address_validator(
-        allow_unnormalized=allow_unnormalized,
-        allow_smtputf8=allow_smtputf8,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _email_address_validator_cache(
+            allow_unnormalized, allow_smtputf8, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_email_address_validator(
+            allow_unnormalized=allow_unnormalized,
+            allow_smtputf8=allow_smtputf8,
+            required=required,
+        ))
+
+
+def validate_email_addresses(
+    values,
+    allow_unnormalized=False,
+    allow_smtputf8=True,
+    required=True,
+):
+    """
+    Checks a sequence of email addresses in bulk, returning a list with, for
+    each address in order, either `None` if it is valid, or the exception that
+    :func:`validate_email_address` would have raised.
+
+    Addresses are grouped by domain so that each distinct domain is normalized
+    and checked only once.  This makes validating a large list of addresses
+    from a small number of domains much faster than calling
+    :func:`validate_email_address` in a loop.
+
+    .. code:: python
+
+        errors = validate_email_addresses(addresses)
+        invalid = [
+            address for address, error in zip(addresses, errors)
+            if error is not None
+        ]
+
+    :param values:
+        An iterable of the values to be validated.
+    :param bool allow_unnormalized:
+        See :func:`validate_email_address`.
+    :param bool allow_smtputf8:
+        See :func:`validate_email_address`.
+    :param bool required:
+        Whether values can be `None`.  Defaults to `True`.
+
+    :returns:
+        A list of `None` or `TypeError` or `ValueError` instances, one for
+        each value.
+    """
+    _validate_bool(allow_unnormalized)
+    _validate_bool(allow_smtputf8)
+    _validate_bool(required)
+
+    results = []
+    by_domain = {}
+
+    for index, value in enumerate(values):
+        results.append(None)
+
+        # Fast path for the common case of an address with a plain ascii local
+        # part.  Anything else goes through the same checks as
+        # `validate_email_address` so that errors are reported identically.
+        if type(value) is six.text_type:
+            local_part, at, domain = value.partition("@")
+            if (
+                at and domain and "@" not in domain and
+                len(local_part) <= _LOCAL_PART_MAX_LENGTH and
+                _LOCAL_PART_RE.match(local_part)
+            ):
+                by_domain.setdefault(domain, []).append(
+                    (index, value, local_part, local_part),
+                )
+                continue
+
+        if value is None:
+            if required:
+                results[index] = TypeError("required value is None")
+            continue
+
+        try:
+            local_part, domain = _split_email_address(value)
+            normalized_local_part, ascii_local_part = _normalize_local_part(
+                local_part, allow_smtputf8,
+            )
+            if not domain:
+                raise ValueError(
+                    "expected domain name after '@', but found nothing"
+                )
+        except (TypeError, ValueError) as e:
+            results[index] = e
+            continue
+
+        by_domain.setdefault(domain, []).append(
+            (index, value, normalized_local_part, ascii_local_part),
+        )
+
+    for domain, addresses in by_domain.items():
+        normalized_domain, ascii_domain, error = _domain_cache.lookup(domain)
+        if error is not None:
+            for index, _, _, _ in addresses:
+                results[index] = ValueError(error)
+            continue
+
+        # If both parts are plain ascii then the only remaining check that
+        # depends on the local part is its length.
+        if normalized_domain == ascii_domain and (
+            allow_unnormalized or domain == normalized_domain
+        ):
+            max_local_part_length = _EMAIL_MAX_LENGTH - 1 - len(ascii_domain)
+        else:
+            max_local_part_length = -1
+
+        for index, value, normalized_local_part, ascii_local_part in addresses:
+            if (
+                ascii_local_part is not None and
+                len(ascii_local_part) <= max_local_part_length
+            ):
+                continue
+
+            try:
+                _check_email_address(
+                    value,
+                    normalized_local_part, ascii_local_part,
+                    normalized_domain, ascii_domain,
+                    allow_unnormalized,
+                )
+            except ValueError as e:
+                results[index] = e
+
+    return results
@@ -1,7 +1,11 @@
-from typing import Union, overload, Callable, Optional, Text
+from typing import (
+    Union, overload, Callable, Iterable, List, NamedTuple, Optional, Text,
+)
 
 import six
 
+from .common import _validator
+
 @overload
 def validate_email_address(
     value: Text,
@@ -25,11 +29,30 @@ def validate_email_address(
     allow_unnormalized: bool=False,
     allow_smtputf8: bool=True,
     required: bool,
-) -> Callable[[Optional[Text]], None]: ...
+) -> _validator[Optional[Text]]: ...
 
 @overload
 def validate_email_address(
     *,
     allow_unnormalized: bool=False,
     allow_smtputf8: bool=True,
-) -> Callable[[Text], None]: ...
+) -> _validator[Text]: ...
+
+class _CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+def set_domain_cache_size(maxsize: int) -> None: ...
+
+def domain_cache_info() -> _CacheInfo: ...
+
+def clear_domain_cache() -> None: ...
+
+def validate_email_addresses(
+    values: Iterable[Optional[Text]],
+    allow_unnormalized: bool=False,
+    allow_smtputf8: bool=True,
+    required: bool=True,
+) -> List[Optional[Exception]]: ...
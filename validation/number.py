@@ -3,7 +3,10 @@ import math
 import six
 
 from .core import _validate_bool
-from .common import make_optional_argument_default
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator,
+)
 
 
 _undefined = make_optional_argument_default()
@@ -31,7 +34,9 @@ def _validate_int(value, min_value=None, max_value=None, required=True):
         ).format(value=value, max=max_value))
 
 
-class _int_validator(object):
+class _int_validator(_validator):
+    __slots__ = ('__min_value', '__max_value', '__required')
+
     def __init__(self, min_value, max_value, required):
         _validate_int(min_value, required=False)
         _validate_int(max_value, required=False)
@@ -49,11 +54,51 @@ class _int_validator(object):
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (self.__min_value, self.__max_value, self.__required)
+
     def __call__(self, value):
         _validate_int(
-            value,
-            min_value=self.__min_value, max_value=self.__max_value,
-            required=self.__required,
+            value, self.__min_value, self.__max_value, self.__required,
+        )
+
+    def _compile(self, compiler, value):
+        conditions = ['isinstance({value}, {types})'.format(
+            value=value, types=compiler.constant(six.integer_types),
+        )]
+
+        if self.__min_value is not None:
+            conditions.append('{value} >= {min}'.format(
+                value=value, min=compiler.constant(self.__min_value),
+            ))
+
+        if self.__max_value is not None:
+            conditions.append('{value} <= {max}'.format(
+                value=value, max=compiler.constant(self.__max_value),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+    def _compile_many(self):
+        # Imported here to avoid loading NumPy until it is needed.
+        from .numpy import (
+            vectorize_many, find_invalid_ints, ints_guaranteed,
+        )
+
+        def find_invalid(array):
+            return find_invalid_ints(
+                array, self.__min_value, self.__max_value,
+            )
+
+        def guaranteed(kind, lowest, highest):
+            return ints_guaranteed(
+                kind, lowest, highest, self.__min_value, self.__max_value,
+            )
+
+        return vectorize_many(
+            self, super(_int_validator, self)._compile_many(),
+            six.integer_types + (bool,), 'int64', find_invalid, guaranteed,
         )
 
     def __repr__(self):
@@ -76,6 +121,9 @@ class _int_validator(object):
         return 'validate_int({args})'.format(args=', '.join(args))
 
 
+_int_validator_cache = make_validator_cache(_int_validator)
+
+
 def validate_int(
     value=_undefined,
     min_value=None, max_value=None,
@@ -105,15 +153,14 @@ def validate_int(
     :raises ValueError:
         If the value is not within bounds.
     """
-    validate = _int_validator(
-        min_value=min_value, max_value=max_value,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _int_validator_cache(min_value, max_value, required)
         validate(value)
     else:
-        return validate
+        return intern_validator(_int_validator(
+            min_value=min_value, max_value=max_value,
+            required=required,
+        ))
 
 
 def _validate_float(
@@ -153,7 +200,12 @@ def _validate_float(
         ).format(value=value, max=max_value))
 
 
-class _float_validator(object):
+class _float_validator(_validator):
+    __slots__ = (
+        '__min_value', '__max_value', '__allow_infinite', '__allow_nan',
+        '__required',
+    )
+
     def __init__(
         self,
         min_value, max_value,
@@ -187,12 +239,68 @@ class _float_validator(object):
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__min_value, self.__max_value,
+            self.__allow_infinite, self.__allow_nan,
+            self.__required,
+        )
+
     def __call__(self, value):
         _validate_float(
-            value,
-            min_value=self.__min_value, max_value=self.__max_value,
-            allow_infinite=self.__allow_infinite, allow_nan=self.__allow_nan,
-            required=self.__required,
+            value, self.__min_value, self.__max_value, self.__allow_infinite,
+            self.__allow_nan, self.__required,
+        )
+
+    def _compile(self, compiler, value):
+        conditions = ['isinstance({value}, float)'.format(value=value)]
+
+        if not self.__allow_infinite:
+            conditions.append('not {isinf}({value})'.format(
+                value=value, isinf=compiler.constant(math.isinf),
+            ))
+
+        if not self.__allow_nan:
+            conditions.append('not {isnan}({value})'.format(
+                value=value, isnan=compiler.constant(math.isnan),
+            ))
+
+        # Comparisons are negated to match `_validate_float`, which will
+        # accept NaNs regardless of bounds.
+        if self.__min_value is not None:
+            conditions.append('not {value} < {min}'.format(
+                value=value, min=compiler.constant(self.__min_value),
+            ))
+
+        if self.__max_value is not None:
+            conditions.append('not {value} > {max}'.format(
+                value=value, max=compiler.constant(self.__max_value),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+    def _compile_many(self):
+        # Imported here to avoid loading NumPy until it is needed.
+        from .numpy import (
+            vectorize_many, find_invalid_floats, floats_guaranteed,
+        )
+
+        def find_invalid(array):
+            return find_invalid_floats(
+                array, self.__min_value, self.__max_value,
+                self.__allow_infinite, self.__allow_nan,
+            )
+
+        def guaranteed(kind, lowest, highest):
+            return floats_guaranteed(
+                kind, lowest, highest, self.__min_value, self.__max_value,
+                self.__allow_infinite, self.__allow_nan,
+            )
+
+        return vectorize_many(
+            self, super(_float_validator, self)._compile_many(),
+            (float,), 'float64', find_invalid, guaranteed,
         )
 
     def __repr__(self):
@@ -225,6 +333,9 @@ class _float_validator(object):
         return 'validate_float({args})'.format(args=', '.join(args))
 
 
+_float_validator_cache = make_validator_cache(_float_validator)
+
+
 def validate_float(
     value=_undefined,
     min_value=None, max_value=None,
@@ -255,13 +366,14 @@ def validate_float(
     :raises ValueError:
         If the value is not within bounds.
     """
-    validate = _float_validator(
-        min_value=min_value, max_value=max_value,
-        allow_infinite=allow_infinite, allow_nan=allow_nan,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _float_validator_cache(
+            min_value, max_value, allow_infinite, allow_nan, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_float_validator(
+            min_value=min_value, max_value=max_value,
+            allow_infinite=allow_infinite, allow_nan=allow_nan,
+            required=required,
+        ))
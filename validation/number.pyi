@@ -1,5 +1,7 @@
 from typing import overload, Callable, Optional
 
+from .common import _validator
+
 
 @overload
 def validate_int(
@@ -21,7 +23,7 @@ def validate_int(
 @overload
 def validate_int(
     *, min_value: int=None, max_value: int=None,
-) -> Callable[[int], None]:
+) -> _validator[int]:
     ...
 
 
@@ -29,7 +31,7 @@ def validate_int(
 def validate_int(
     *, min_value: int=None, max_value: int=None,
     required: bool,
-) -> Callable[[Optional[int]], None]:
+) -> _validator[Optional[int]]:
     ...
 
 
@@ -56,7 +58,7 @@ def validate_float(
 def validate_float(
     *, min_value: float=None, max_value: float=None,
     allow_infinite: bool=False, allow_nan: bool=False,
-) -> Callable[[float], None]:
+) -> _validator[float]:
     ...
 
 
@@ -65,5 +67,5 @@ def validate_float(
     *, min_value: float=None, max_value: float=None,
     allow_infinite: bool=False, allow_nan: bool=False,
     required: bool,
-) -> Callable[[Optional[float]], None]:
+) -> _validator[Optional[float]]:
     ...
@@ -0,0 +1,299 @@
+"""
+Optional NumPy backend for the bulk validation of numbers.
+
+If NumPy is installed, the ``validate_many`` methods of the validators returned
+by :func:`~validation.number.validate_int`,
+:func:`~validation.number.validate_float` and
+:func:`~validation.core.validate_bool` will check one dimensional NumPy arrays,
+typed arrays from the :mod:`array` module, and long lists of plain numbers,
+in a single vectorised pass rather than one element at a time.
+
+Arrays are validated as if they had first been converted to lists using
+``tolist()``, which converts each element to the closest python type.  An
+array of ``int64`` is therefore valid input for a ``validate_int`` closure, but
+an array of ``float64`` is not.
+
+If the type of an array is enough to guarantee that all of its elements are
+valid, for example an array of ``uint8`` checked against
+``validate_int(min_value=0, max_value=255)``, then the elements are not looked
+at at all.  This check does not depend on NumPy.
+"""
+from __future__ import absolute_import
+
+import array
+
+# NumPy is not a dependency of this library.  If it is not installed then bulk
+# validation always falls back to checking one value at a time.
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from .common import _try_contextualize_exception
+
+
+# Maps from `array.array` typecodes to the equivalent NumPy dtype kind.  `u`,
+# for unicode characters, is deliberately excluded.
+_TYPECODE_KINDS = {
+    'b': 'i', 'h': 'i', 'i': 'i', 'l': 'i', 'q': 'i',
+    'B': 'u', 'H': 'u', 'I': 'u', 'L': 'u', 'Q': 'u',
+    'f': 'f', 'd': 'f',
+}
+
+
+def _make_dtype_ranges():
+    inf = float('inf')
+    ranges = {
+        ('b', 1): (0, 1),
+        ('f', 2): (-inf, inf),
+        ('f', 4): (-inf, inf),
+        ('f', 8): (-inf, inf),
+    }
+    for itemsize in (1, 2, 4, 8):
+        bits = 8 * itemsize
+        ranges['i', itemsize] = (-2 ** (bits - 1), 2 ** (bits - 1) - 1)
+        ranges['u', itemsize] = (0, 2 ** bits - 1)
+    return ranges
+
+
+# Maps from a dtype kind and item size to the smallest and largest values that
+# an array of that type can hold.  Floating point ranges also include NaN.
+_DTYPE_RANGES = _make_dtype_ranges()
+
+
+# Below this length, the cost of checking the type of each item and copying it
+# into an array outweighs the savings from checking all of them at once.
+_MIN_LIST_LENGTH = 512
+
+
+def _typed_array_range(values):
+    """
+    Returns the dtype kind, and the smallest and largest possible values, for a
+    one dimensional typed array, or `None` if the input is not a typed array,
+    or has a type that this module doesn't understand.
+    """
+    if isinstance(values, array.array):
+        kind = _TYPECODE_KINDS.get(values.typecode)
+        itemsize = values.itemsize
+    elif (
+        numpy is not None and isinstance(values, numpy.ndarray) and
+        values.ndim == 1
+    ):
+        kind = values.dtype.kind
+        itemsize = values.dtype.itemsize
+    else:
+        return None
+
+    dtype_range = _DTYPE_RANGES.get((kind, itemsize))
+    if dtype_range is None:
+        return None
+
+    lowest, highest = dtype_range
+    return kind, lowest, highest
+
+
+def _within(lowest, highest, min_value, max_value):
+    return (
+        (min_value is None or min_value <= lowest) and
+        (max_value is None or max_value >= highest)
+    )
+
+
+def ints_guaranteed(kind, lowest, highest, min_value, max_value):
+    """
+    Returns `True` if every value in an array with the given dtype kind and
+    range would be accepted by ``validate_int``.
+    """
+    return kind in 'biu' and _within(lowest, highest, min_value, max_value)
+
+
+def floats_guaranteed(
+    kind, lowest, highest, min_value, max_value, allow_infinite, allow_nan,
+):
+    """
+    Returns `True` if every value in an array with the given dtype kind and
+    range would be accepted by ``validate_float``.
+    """
+    return (
+        kind == 'f' and allow_infinite and allow_nan and
+        _within(lowest, highest, min_value, max_value)
+    )
+
+
+def bools_guaranteed(kind, lowest, highest):
+    """
+    Returns `True` if every value in an array with the given dtype kind and
+    range would be accepted by ``validate_bool``.
+    """
+    return kind == 'b'
+
+
+def _as_array(values, item_types, dtype):
+    """
+    Returns a one dimensional array containing the same values as the input,
+    or `None` if it can't be converted without changing the result of
+    validation.
+    """
+    if isinstance(values, numpy.ndarray):
+        if values.ndim != 1:
+            return None
+        return values
+
+    if isinstance(values, array.array):
+        if values.typecode not in _TYPECODE_KINDS:
+            return None
+        return numpy.asarray(values)
+
+    if not isinstance(values, list) or len(values) < _MIN_LIST_LENGTH:
+        return None
+
+    # Exact type checks.  Subclasses, and values that NumPy would convert
+    # silently, such as NumPy's own scalar types, need to be looked at
+    # individually.
+    if not set(map(type, values)).issubset(item_types):
+        return None
+
+    try:
+        return numpy.fromiter(values, dtype=dtype, count=len(values))
+    except OverflowError:
+        # Integers too big to fit in any of NumPy's integer types.
+        return None
+
+
+def find_invalid_ints(array, min_value, max_value):
+    """
+    Returns a boolean mask of the items in an array that would be rejected by
+    ``validate_int``, or `None` if the array does not have an integer dtype.
+    """
+    if array.dtype.kind not in 'biu':
+        return None
+
+    invalid = numpy.zeros(array.shape, dtype=bool)
+    if min_value is not None:
+        invalid |= array < min_value
+    if max_value is not None:
+        invalid |= array > max_value
+    return invalid
+
+
+def find_invalid_floats(
+    array, min_value, max_value, allow_infinite, allow_nan,
+):
+    """
+    Returns a boolean mask of the items in an array that would be rejected by
+    ``validate_float``, or `None` if the array does not have a floating point
+    dtype that converts losslessly to python floats.
+    """
+    if array.dtype.kind != 'f' or array.dtype.itemsize > 8:
+        return None
+
+    # Bounds are python floats.  Comparing them against a narrower array
+    # would round the bound rather than widening the values.
+    array = array.astype(numpy.float64, copy=False)
+
+    invalid = numpy.zeros(array.shape, dtype=bool)
+    if not allow_infinite:
+        invalid |= numpy.isinf(array)
+    if not allow_nan:
+        invalid |= numpy.isnan(array)
+
+    # NaNs compare false against everything, so are not rejected by the
+    # bounds checks, matching `_validate_float`.
+    if min_value is not None:
+        invalid |= array < min_value
+    if max_value is not None:
+        invalid |= array > max_value
+    return invalid
+
+
+def find_invalid_bools(array):
+    """
+    Returns a boolean mask of the items in an array that would be rejected by
+    ``validate_bool``, or `None` if the array does not have a boolean dtype.
+    """
+    if array.dtype.kind != 'b':
+        return None
+
+    return numpy.zeros(array.shape, dtype=bool)
+
+
+def record_columns(buffer, fields, size):
+    """
+    Returns a list of one dimensional arrays, one for each field in a buffer
+    of packed records, that share memory with the buffer.
+
+    `fields` should be a list of `(dtype, offset)` tuples, and `size` the
+    size of each record in bytes.
+    """
+    names = ['f{index}'.format(index=index) for index in range(len(fields))]
+    dtype = numpy.dtype({
+        'names': names,
+        'formats': [field_dtype for field_dtype, _ in fields],
+        'offsets': [offset for _, offset in fields],
+        'itemsize': size,
+    })
+    records = numpy.frombuffer(buffer, dtype=dtype)
+    return [records[name] for name in names]
+
+
+def vectorize_many(
+    validator, validate_many, item_types, dtype, find_invalid, guaranteed,
+):
+    """
+    Wraps a function that checks each value in an iterable so that typed
+    arrays, and long lists of values with types in `item_types`, are checked
+    using `find_invalid` instead.  Lists are copied into an array of the given
+    `dtype` before checking.
+
+    `find_invalid` should take a one dimensional array and return a boolean
+    mask of the values that `validator` would reject, or `None` if it can't
+    make a decision based on the array's dtype.  The original validator is
+    called on the first rejected value to raise the error.
+
+    `guaranteed` should take a dtype kind, and the smallest and largest values
+    that an array of that dtype can hold, and return `True` if every such
+    array is valid, in which case the values will not be checked.
+
+    If NumPy is not installed, only the `guaranteed` check is made.
+    """
+    item_types = frozenset(item_types)
+
+    def validate_many_vectorized(values):
+        dtype_range = _typed_array_range(values)
+        if dtype_range is not None and guaranteed(*dtype_range):
+            return
+
+        if numpy is None:
+            validate_many(values)
+            return
+
+        data = _as_array(values, item_types, dtype)
+
+        invalid = None
+        if data is not None:
+            invalid = find_invalid(data)
+
+        if invalid is None:
+            if isinstance(values, numpy.ndarray) and values.ndim:
+                values = values.tolist()
+            validate_many(values)
+            return
+
+        if not invalid.any():
+            return
+
+        index = int(invalid.argmax())
+        if data is values:
+            item = data[index].item()
+        else:
+            item = values[index]
+
+        try:
+            validator(item)
+        except (TypeError, ValueError, KeyError):
+            _try_contextualize_exception(
+                "invalid item at position {key}", index,
+            )
+            raise
+
+    return validate_many_vectorized
@@ -0,0 +1,48 @@
+from typing import Any, Callable, Iterable, Optional, Tuple, Type
+
+
+def find_invalid_ints(
+    array: Any, min_value: Optional[int], max_value: Optional[int],
+) -> Any:
+    ...
+
+
+def find_invalid_floats(
+    array: Any, min_value: Optional[float], max_value: Optional[float],
+    allow_infinite: bool, allow_nan: bool,
+) -> Any:
+    ...
+
+
+def find_invalid_bools(array: Any) -> Any:
+    ...
+
+
+def ints_guaranteed(
+    kind: str, lowest: float, highest: float,
+    min_value: Optional[int], max_value: Optional[int],
+) -> bool:
+    ...
+
+
+def floats_guaranteed(
+    kind: str, lowest: float, highest: float,
+    min_value: Optional[float], max_value: Optional[float],
+    allow_infinite: bool, allow_nan: bool,
+) -> bool:
+    ...
+
+
+def bools_guaranteed(kind: str, lowest: float, highest: float) -> bool:
+    ...
+
+
+def vectorize_many(
+    validator: Callable[[Any], None],
+    validate_many: Callable[[Iterable[Any]], None],
+    item_types: Tuple[Type[Any], ...],
+    dtype: str,
+    find_invalid: Callable[[Any], Any],
+    guaranteed: Callable[[str, float, float], bool],
+) -> Callable[[Iterable[Any]], None]:
+    ...
@@ -0,0 +1,286 @@
+"""
+Validation of packed binary records, as produced by the :mod:`struct` module,
+without first unpacking every record into a tuple.
+"""
+from __future__ import absolute_import
+
+import re
+import struct
+
+import six
+
+from .core import _validate_bool
+from .string import _buffer_length, _contiguous_buffer, _iter_unpack
+from .datastructure import validate_tuple
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator, _try_contextualize_exception,
+)
+
+
+_undefined = make_optional_argument_default()
+
+
+_FORMAT_ITEM_RE = re.compile(r'\s*([0-9]*)([xcbB?hHiIlLqQnNefdspP])')
+
+
+# Maps from struct format characters to the equivalent NumPy dtype kind, for
+# fields that can be checked in bulk.  `?` is a single byte that NumPy will
+# read as a bool in the same way as `struct`.
+_NUMERIC_KINDS = {
+    'b': 'i', 'h': 'i', 'i': 'i', 'l': 'i', 'q': 'i', 'n': 'i',
+    'B': 'u', 'H': 'u', 'I': 'u', 'L': 'u', 'Q': 'u', 'N': 'u',
+    'e': 'f', 'f': 'f', 'd': 'f',
+    '?': 'b',
+}
+
+
+# Maps from struct byte order characters to NumPy byte order characters.
+_BYTE_ORDERS = {'@': '=', '=': '=', '<': '<', '>': '>', '!': '>'}
+
+
+def _numeric_fields(record_format):
+    """
+    Returns a list of `(dtype, offset)` tuples describing each field in a
+    struct format, or `None` if any of the fields is not a number.
+    """
+    if record_format[:1] in _BYTE_ORDERS:
+        byte_order, items = record_format[:1], record_format[1:]
+    else:
+        byte_order, items = '@', record_format
+
+    fields = []
+    prefix = byte_order
+    for count, code in _FORMAT_ITEM_RE.findall(items):
+        count = int(count) if count else 1
+        if code == 'x':
+            prefix += '{count}x'.format(count=count)
+            continue
+
+        kind = _NUMERIC_KINDS.get(code)
+        if kind is None:
+            return None
+
+        for _ in range(count):
+            # A repeat count of zero aligns the end of the format to the
+            # alignment of the type, without adding a field.
+            offset = struct.calcsize(prefix + '0' + code)
+            dtype = '{byte_order}{kind}{size}'.format(
+                byte_order=_BYTE_ORDERS[byte_order], kind=kind,
+                size=struct.calcsize(byte_order + code),
+            )
+            fields.append((dtype, offset))
+            prefix += code
+
+    return fields
+
+
+def _validate_records(value, record_struct, schema, required):
+    """
+    Checks the length of a buffer, then, if `schema` is not `None`, unpacks
+    and checks each record in turn.  This is the slow path, used to find and
+    report the first error.
+    """
+    if value is None:
+        if required:
+            raise TypeError("required value is None")
+        return
+
+    length = _buffer_length(value)
+    if length is None:
+        raise TypeError((
+            "expected bytes-like object, but value is of type {cls!r}"
+        ).format(cls=value.__class__.__name__))
+
+    if length % record_struct.size:
+        raise ValueError((
+            "expected a multiple of {size} bytes, but buffer contains {length}"
+        ).format(size=record_struct.size, length=length))
+
+    if schema is None:
+        return
+
+    records = _iter_unpack(record_struct, _contiguous_buffer(value))
+    for index, record in enumerate(records):
+        try:
+            schema(record)
+        except (TypeError, ValueError, KeyError):
+            _try_contextualize_exception(
+                "invalid record at position {key}", index,
+            )
+            raise
+
+
+class _records_validator(_validator):
+    __slots__ = (
+        '__format', '__record_struct', '__schema', '__record_validator',
+        '__record_fields', '__required',
+    )
+
+    def __init__(self, record_format, schema, required):
+        if not isinstance(record_format, six.string_types):
+            raise TypeError((
+                "expected string, but format is of type {cls!r}"
+            ).format(cls=record_format.__class__.__name__))
+
+        try:
+            record_struct = struct.Struct(record_format)
+        except struct.error as exc:
+            raise ValueError((
+                "invalid struct format {format!r}: {error}"
+            ).format(format=record_format, error=exc))
+
+        if not record_struct.size:
+            raise ValueError((
+                "expected struct format describing at least one byte, but "
+                "got {format!r}"
+            ).format(format=record_format))
+
+        self.__format = record_format
+        self.__record_struct = record_struct
+
+        self.__schema = schema
+        if schema is None:
+            self.__record_validator = None
+            self.__record_fields = None
+        else:
+            self.__record_validator = validate_tuple(schema=schema)
+
+            length = len(record_struct.unpack(b'\0' * record_struct.size))
+            if len(schema) != length:
+                raise ValueError((
+                    "expected one validator for each of the {length} fields "
+                    "in format {format!r}, but schema has {count}"
+                ).format(
+                    length=length, format=record_format, count=len(schema),
+                ))
+
+            fields = _numeric_fields(record_format)
+            if fields is not None and all(
+                isinstance(validator, _validator) for validator in schema
+            ):
+                self.__record_fields = fields
+            else:
+                self.__record_fields = None
+
+        _validate_bool(required)
+        self.__required = required
+
+    def _key(self):
+        return (self.__format, self.__schema, self.__required)
+
+    def __call__(self, value):
+        if self.__record_validator is not None and self.__valid_in_bulk(value):
+            return
+
+        _validate_records(
+            value, self.__record_struct, self.__record_validator,
+            self.__required,
+        )
+
+    def __valid_in_bulk(self, value):
+        """
+        Returns `True` if every record in the buffer is valid.  Returns `False`
+        if anything is wrong, in which case `_validate_records` is needed to
+        find the first error, and to say which record and field caused it.
+        """
+        length = _buffer_length(value)
+        if length is None or length % self.__record_struct.size:
+            return False
+
+        buffer = _contiguous_buffer(value)
+        try:
+            if self.__record_fields is not None:
+                # Imported here to avoid loading NumPy until it is needed.
+                from .numpy import numpy, record_columns
+
+                if numpy is not None:
+                    columns = record_columns(
+                        buffer, self.__record_fields,
+                        self.__record_struct.size,
+                    )
+                    for validator, column in zip(self.__schema, columns):
+                        validator.validate_many(column)
+                    return True
+
+            self.__record_validator.validate_many(
+                _iter_unpack(self.__record_struct, buffer),
+            )
+        except (TypeError, ValueError, KeyError):
+            return False
+        return True
+
+    def _compile(self, compiler, value):
+        # Checking every record in a buffer is already done in bulk, so there
+        # is nothing to gain from inlining it.
+        compiler.call(self, value)
+
+    def __repr__(self):
+        args = ['format={format!r}'.format(format=self.__format)]
+
+        if self.__schema is not None:
+            args.append('schema={schema!r}'.format(schema=self.__schema))
+
+        if not self.__required:
+            args.append('required={required!r}'.format(
+                required=self.__required,
+            ))
+
+        return 'validate_records({args})'.format(args=', '.join(args))
+
+
+_records_validator_cache = make_validator_cache(_records_validator)
+
+
+def validate_records(  # pylint: disable=redefined-builtin
+    value=_undefined,
+    format=None,
+    schema=None,
+    required=True,
+):
+    """
+    Checks a buffer containing any number of packed binary records with the
+    same layout, as written by :func:`struct.pack` and read by
+    :func:`struct.iter_unpack`.
+
+    The buffer can be `bytes` or any other object that supports the buffer
+    protocol, such as a `bytearray`, `memoryview` or `mmap.mmap`.  Its
+    length must be an exact multiple of the size of one record.
+
+    If a schema is given, each record is checked as if it had been unpacked
+    and passed to :func:`~validation.datastructure.validate_tuple`.  If NumPy
+    is installed, and every field is a number, each field is checked for all
+    records at once without unpacking them.
+
+    .. code:: python
+
+        validator = validate_records(format='<Hf', schema=(
+            validate_int(min_value=1),
+            validate_float(min_value=-40.0, max_value=125.0),
+        ))
+        validator(payload)
+
+    :param bytes value:
+        The buffer to be validated.
+    :param str format:
+        The :mod:`struct` format string describing one record.
+    :param tuple schema:
+        An optional tuple of validators, one for each field in a record.
+    :param bool required:
+        Whether the value can be `None`.  Defaults to `True`.
+
+    :raises TypeError:
+        If the value does not support the buffer protocol, or if it was
+        marked as `required` but `None` was passed in.
+    :raises ValueError:
+        If the length of the buffer is not a multiple of the size of a
+        record.  Errors raised by the schema are prefixed with the position
+        of the record, then the index of the field, that caused them.
+    """
+    if value is not _undefined:
+        validate = _records_validator_cache(format, schema, required)
+        validate(value)
+    else:
+        return intern_validator(_records_validator(
+            record_format=format, schema=schema, required=required,
+        ))
@@ -0,0 +1,43 @@
+from typing import Callable, Optional, Tuple, Union, overload
+import mmap
+
+from .common import _validator
+
+
+_Buffer = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+@overload
+def validate_records(
+    value: _Buffer,
+    *, format: str,
+    schema: Tuple=None,
+) -> None:
+    ...
+
+
+@overload
+def validate_records(
+    value: Optional[_Buffer],
+    *, format: str,
+    schema: Tuple=None,
+    required: bool,
+) -> None:
+    ...
+
+
+@overload
+def validate_records(
+    *, format: str,
+    schema: Tuple=None,
+) -> _validator[_Buffer]:
+    ...
+
+
+@overload
+def validate_records(
+    *, format: str,
+    schema: Tuple=None,
+    required: bool,
+) -> _validator[Optional[_Buffer]]:
+    ...
@@ -1,28 +1,468 @@
+import codecs
 import re
+import unicodedata
+import warnings
 
-# The typing module provides an abstract base class that we can check compiled
-# regular expressions against.  Unfortunately this wasn't available until
-# python 3.5.  For older versions of python, we fall back to using the private
-# ``_pattern_type`` class in ``re``.
 try:
-    from typing.re import Pattern as _pattern_type
+    from re import _parser as _sre_parse
 except ImportError:  # pragma: no cover
-    _pattern_type = re._pattern_type  # pylint: disable=no-member
+    try:
+        # Python 3.10 and earlier.
+        import sre_parse as _sre_parse
+    except ImportError:
+        # Both are private.  Without a parser, patterns are still matched,
+        # but are not analysed.
+        _sre_parse = None  # type: ignore
 
 import six
 
 from .core import _validate_bool
 from .number import _validate_int
-from .common import make_optional_argument_default
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator,
+)
 
 
 _undefined = make_optional_argument_default()
 
 
+class UnsafePatternWarning(UserWarning):
+    """
+    Warning issued when a pattern passed to :func:`validate_text` looks like
+    it could take time exponential in the length of a string to match it.
+    """
+
+
+# Compiled regular expressions are instances of a private class in `re`, which
+# has gone by several names.  Get hold of it without importing `typing`.
+_pattern_type = type(re.compile(''))
+
+
+def _fullmatch_function(compiled_pattern):
+    try:
+        return compiled_pattern.fullmatch
+    except AttributeError:  # pragma: no cover
+        # Python 2.  Anchoring the end of the pattern has the same effect.
+        return re.compile(
+            r'(?:' + compiled_pattern.pattern + r')\Z',
+            compiled_pattern.flags,
+        ).match
+
+
+def _flatten_groups(items):
+    # Groups that don't change flags don't affect what is matched, so we can
+    # treat their contents as if they were part of the enclosing sequence.
+    for op, av in items:
+        if op == _sre_parse.SUBPATTERN and (len(av) == 2 or av[1:3] == (0, 0)):
+            for item in _flatten_groups(av[-1]):
+                yield item
+        else:
+            yield op, av
+
+
+def _required_literal(parsed, flags):
+    """
+    Returns the longest run of literal characters that must appear in any
+    string that the parsed pattern matches, or `None` if there isn't one that
+    can be found cheaply.
+
+    Checking for the literal with `in` is much faster than running the regex
+    engine, and lets most non-matching strings be rejected early.
+    """
+    if flags & re.IGNORECASE:
+        return None
+
+    literal = longest = u""
+    for op, av in _flatten_groups(parsed):
+        if op == _sre_parse.LITERAL:
+            literal += six.unichr(av)
+            if len(literal) > len(longest):
+                longest = literal
+        else:
+            literal = u""
+
+    return longest or None
+
+
+# Sets of characters are represented as lists of inclusive ranges of code
+# points.  They only need to be precise enough to tell whether two sets can
+# overlap, and err on the side of saying that they can.
+_MAX_CHAR = 0x10FFFF
+_ANY_CHAR = [(0, _MAX_CHAR)]
+
+_SPACE_CHARS = [
+    (0x09, 0x0D), (0x1C, 0x20), (0x85, 0x85), (0xA0, 0xA0), (0x1680, 0x1680),
+    (0x2000, 0x200A), (0x2028, 0x2029), (0x202F, 0x202F), (0x205F, 0x205F),
+    (0x3000, 0x3000),
+]
+
+
+def _complement_chars(chars):
+    result = []
+    start = 0
+    for low, high in sorted(chars):
+        if low > start:
+            result.append((start, low - 1))
+        start = max(start, high + 1)
+    if start <= _MAX_CHAR:
+        result.append((start, _MAX_CHAR))
+    return result
+
+
+def _chars_overlap(a, b):
+    return any(
+        a_low <= b_high and b_low <= a_high
+        for a_low, a_high in a
+        for b_low, b_high in b
+    )
+
+
+def _fold_chars(chars):
+    # Only ascii letters are folded.  Close enough for our purposes.
+    result = list(chars)
+    for low, high in chars:
+        for first, last, offset in ((0x41, 0x5A, 0x20), (0x61, 0x7A, -0x20)):
+            if low <= last and first <= high:
+                result.append(
+                    (max(low, first) + offset, min(high, last) + offset),
+                )
+    return result
+
+
+# Maps each category to the characters that definitely belong to it, and the
+# characters that might.  We assume that any non-ascii character that isn't
+# whitespace might be a digit or part of a word.
+_NON_ASCII_NON_SPACE_CHARS = [
+    (low, high)
+    for low, high in _complement_chars(_SPACE_CHARS)
+    if low >= 0x80
+]
+_CATEGORY_CHARS = {
+    'DIGIT': (
+        [(0x30, 0x39)],
+        [(0x30, 0x39)] + _NON_ASCII_NON_SPACE_CHARS,
+    ),
+    'WORD': (
+        [(0x30, 0x39), (0x41, 0x5A), (0x5F, 0x5F), (0x61, 0x7A)],
+        [(0x30, 0x39), (0x41, 0x5A), (0x5F, 0x5F), (0x61, 0x7A)] +
+        _NON_ASCII_NON_SPACE_CHARS,
+    ),
+    'SPACE': (_SPACE_CHARS, _SPACE_CHARS),
+    'LINEBREAK': ([(0x0A, 0x0A)], [(0x0A, 0x0A)]),
+}
+
+
+def _category_chars(category):
+    # Categories are named constants on python 3, and lower case strings on
+    # python 2.
+    name = str(category).upper()
+    for prefix in ('CATEGORY_', 'UNI_', 'LOC_'):
+        if name.startswith(prefix):
+            name = name[len(prefix):]
+
+    negate = name.startswith('NOT_')
+    if negate:
+        name = name[len('NOT_'):]
+
+    if name not in _CATEGORY_CHARS:
+        return _ANY_CHAR
+
+    certain, possible = _CATEGORY_CHARS[name]
+    if negate:
+        return _complement_chars(certain)
+    return possible
+
+
+def _set_chars(items):
+    chars = []
+    negate = False
+    for op, av in items:
+        if op == _sre_parse.NEGATE:
+            negate = True
+        elif op == _sre_parse.LITERAL:
+            chars.append((av, av))
+        elif op == _sre_parse.RANGE:
+            chars.append(av)
+        elif op == _sre_parse.CATEGORY:
+            chars.extend(_category_chars(av))
+        else:
+            return _ANY_CHAR
+
+    if negate:
+        return _complement_chars(chars)
+    return chars
+
+
+def _ignore_case(av, ignore_case):
+    # Groups can turn case sensitivity on or off for their contents.
+    if len(av) == 4:
+        if av[1] & _sre_parse.SRE_FLAG_IGNORECASE:
+            return True
+        if av[2] & _sre_parse.SRE_FLAG_IGNORECASE:
+            return False
+    return ignore_case
+
+
+def _first_chars(items, ignore_case):
+    """
+    Returns the characters that a match for a sequence of parsed items could
+    start with, and whether the sequence could match the empty string.
+    """
+    chars = []
+    for item in items:
+        item_chars, nullable = _item_first_chars(item, ignore_case)
+        chars.extend(item_chars)
+        if not nullable:
+            return chars, False
+    return chars, True
+
+
+def _item_first_chars(item, ignore_case):
+    op, av = item
+    if op == _sre_parse.LITERAL:
+        chars = [(av, av)]
+    elif op == _sre_parse.NOT_LITERAL:
+        chars = _complement_chars([(av, av)])
+    elif op == _sre_parse.ANY:
+        chars = _ANY_CHAR
+    elif op == _sre_parse.IN:
+        chars = _set_chars(av)
+    elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+        chars, nullable = _first_chars(av[2], ignore_case)
+        return chars, nullable or av[0] == 0
+    elif op == _sre_parse.SUBPATTERN:
+        return _first_chars(av[-1], _ignore_case(av, ignore_case))
+    elif op == _sre_parse.BRANCH:
+        chars = []
+        nullable = False
+        for branch in av[1]:
+            branch_chars, branch_nullable = _first_chars(branch, ignore_case)
+            chars.extend(branch_chars)
+            nullable = nullable or branch_nullable
+        return chars, nullable
+    elif op in (_sre_parse.AT, _sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+        return [], True
+    else:
+        # Back references, conditionals, and anything that we don't know
+        # about could match anything.
+        return _ANY_CHAR, True
+
+    if ignore_case:
+        chars = _fold_chars(chars)
+    return chars, False
+
+
+def _branches_overlap(branches, ignore_case):
+    # Alternatives that could start with the same character, or that could
+    # match the empty string, give the engine more than one way to match the
+    # same text.  Note that the parser moves any prefix shared by every
+    # alternative out in front of the branch, which leaves an empty
+    # alternative behind, so `(a|ab)` is seen as `a(|b)`.
+    seen = []
+    for branch in branches:
+        chars, nullable = _first_chars(branch, ignore_case)
+        if nullable or _chars_overlap(chars, seen):
+            return True
+        seen = seen + chars
+    return False
+
+
+def _is_ambiguous_sequence(items, follow_chars, ignore_case):
+    # Walk backwards, keeping track of the characters that could follow the
+    # current item.
+    for op, av in reversed(list(_flatten_groups(items))):
+        chars, nullable = _item_first_chars((op, av), ignore_case)
+        if op == _sre_parse.BRANCH:
+            if _branches_overlap(av[1], ignore_case):
+                return True
+            for branch in av[1]:
+                if _is_ambiguous_sequence(branch, follow_chars, ignore_case):
+                    return True
+        elif op == _sre_parse.SUBPATTERN:
+            if _is_ambiguous_sequence(
+                av[-1], follow_chars, _ignore_case(av, ignore_case),
+            ):
+                return True
+        else:
+            if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+                varies = av[0] != av[1]
+            else:
+                varies = nullable
+
+            if varies and _chars_overlap(chars, follow_chars):
+                return True
+
+        if nullable:
+            follow_chars = follow_chars + chars
+        else:
+            follow_chars = chars
+    return False
+
+
+def _is_ambiguous_repeat(body, ignore_case):
+    # A repeated subpattern can match a string in exponentially many ways if
+    # some part of it can vary in length, and can consume the characters that
+    # would otherwise be matched by whatever follows it, either later in the
+    # same repetition or at the start of the next, for example `(a+)+`,
+    # `(\w+\s?)*` or `(\w+a)+`, but not `(-\w+)*` or `(\w+-)*`.  The same
+    # goes if it contains alternatives that overlap, as in `(a|a)*`, but not
+    # `(?:red|green|blue)+`.
+    follow_chars, _ = _first_chars(body, ignore_case)
+    return _is_ambiguous_sequence(body, follow_chars, ignore_case)
+
+
+def _has_backtracking_hazard(items, ignore_case):
+    """
+    Looks for repeated subpatterns that could take time exponential in the
+    length of the input to fail to match.
+
+    This is a heuristic.  It catches the shapes that cause most problems in
+    practice, but it doesn't catch everything, and it will occasionally flag
+    a pattern that is actually safe.
+    """
+    for op, av in items:
+        if op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT):
+            if av[1] > 1 and _is_ambiguous_repeat(av[2], ignore_case):
+                return True
+            if _has_backtracking_hazard(av[2], ignore_case):
+                return True
+        elif op == _sre_parse.SUBPATTERN:
+            if _has_backtracking_hazard(
+                av[-1], _ignore_case(av, ignore_case),
+            ):
+                return True
+        elif op == _sre_parse.BRANCH:
+            for branch in av[1]:
+                if _has_backtracking_hazard(branch, ignore_case):
+                    return True
+        elif op in (_sre_parse.ASSERT, _sre_parse.ASSERT_NOT):
+            if _has_backtracking_hazard(av[1], ignore_case):
+                return True
+        elif op == _sre_parse.GROUPREF_EXISTS:
+            for branch in av[1:]:
+                if branch is not None and _has_backtracking_hazard(
+                    branch, ignore_case,
+                ):
+                    return True
+    return False
+
+
+def _prepare_pattern(pattern):
+    """
+    Returns a function that matches `pattern` against the whole of a string,
+    the literal, if any, that a string must contain in order to match, and
+    whether the pattern is at risk of catastrophic backtracking.
+    """
+    if isinstance(pattern, six.string_types):
+        # Note that we are a little more permissive about non-unicode
+        # patterns in python2 than we are about non-unicode arguments.
+        # Users will probably written the pattern argument inline.
+        compiled_pattern = re.compile(pattern)
+    elif isinstance(pattern, _pattern_type):
+        compiled_pattern = pattern
+    else:
+        raise TypeError((
+            "expected compiled regex or string, "
+            "but pattern is of type {cls!r}"
+        ).format(cls=pattern.__class__.__name__))
+
+    fullmatch = _fullmatch_function(compiled_pattern)
+    if _sre_parse is None:  # pragma: no cover
+        return fullmatch, None, False
+
+    flags = compiled_pattern.flags
+    parsed = _sre_parse.parse(compiled_pattern.pattern, flags)
+
+    return (
+        fullmatch,
+        _required_literal(parsed, flags),
+        _has_backtracking_hazard(parsed, bool(flags & re.IGNORECASE)),
+    )
+
+
+# Validators that differ only in their other arguments, or that are created
+# and discarded by `_text_validator_cache`, will share the work of compiling
+# and analysing a pattern.
+_prepare_pattern_cache = make_validator_cache(_prepare_pattern)
+
+
+if hasattr(six.text_type, 'isascii'):
+    _is_ascii = six.text_type.isascii
+else:  # pragma: no cover
+    # Python 3.6 and earlier.
+    _non_ascii_search = re.compile(u'[^\x00-\x7f]').search
+
+    def _is_ascii(value):
+        return _non_ascii_search(value) is None
+
+
+def _prepare_alphabet(alphabet):
+    """
+    Returns a function that checks that a string contains only characters
+    from `alphabet`.
+    """
+    if not isinstance(alphabet, six.string_types):
+        raise TypeError((
+            "expected unicode string, but alphabet is of type {cls!r}"
+        ).format(cls=alphabet.__class__.__name__))
+
+    alphabet = six.text_type(alphabet)
+
+    if _is_ascii(alphabet):
+        # Deleting characters from a byte string is a simple loop over a
+        # lookup table, and is much quicker than either `str.translate` or a
+        # regular expression.
+        deletechars = alphabet.encode('ascii')
+
+        def contains_only(value):
+            return _is_ascii(value) and not value.encode('ascii').translate(
+                None, deletechars,
+            )
+    else:
+        table = dict.fromkeys(map(ord, alphabet))
+
+        def contains_only(value):
+            return not value.translate(table)
+
+    return contains_only
+
+
+_prepare_alphabet_cache = make_validator_cache(_prepare_alphabet)
+
+
+if hasattr(unicodedata, 'is_normalized'):
+    # Uses the quick check properties of each character, and so can usually
+    # give an answer without building the normalized string.
+    _is_normalized = unicodedata.is_normalized
+else:  # pragma: no cover
+    # Python 3.7 and earlier.
+    def _is_normalized(form, value):
+        return _is_ascii(value) or unicodedata.normalize(form, value) == value
+
+
+_NORMALIZATION_FORMS = ('NFC', 'NFD', 'NFKC', 'NFKD')
+
+
+def _invalid_character_error(value, is_allowed):
+    # Only called once a string is already known to be invalid, so it is fine
+    # to do this the slow way.
+    for index, char in enumerate(value):
+        if not is_allowed(char):
+            return ValueError((
+                "invalid character {char!r} at position {index}"
+            ).format(char=char, index=index))
+    raise AssertionError("no invalid characters in {value!r}".format(
+        value=value,
+    ))
+
+
 def _validate_text(
     value,
     min_length=None, max_length=None,
-    pattern=None,
+    ascii_only=False, alphabet=None, contains_only=None,
+    normalization=None,
+    fullmatch=None, required_literal=None,
     required=True,
 ):
     if value is None:
@@ -47,22 +487,39 @@ def _validate_text(
             "characters long"
         ).format(length=len(value), max=max_length))
 
-    if pattern is not None:
-        # Unfortunately `fullmatch` is not available in python2.
-        match = pattern.match(value)
+    if ascii_only and not _is_ascii(value):
+        raise _invalid_character_error(value, _is_ascii)
+
+    if contains_only is not None and not contains_only(value):
+        raise _invalid_character_error(value, alphabet.__contains__)
+
+    if normalization is not None and not _is_normalized(normalization, value):
+        raise ValueError((
+            "expected string in normalization form {form}"
+        ).format(form=normalization))
 
+    if fullmatch is not None:
         if not (
-            match is not None and
-            match.start() == 0 and
-            match.end() == len(value)
+            (required_literal is None or required_literal in value) and
+            fullmatch(value) is not None
         ):
             raise ValueError(
                 "string did not match pattern"
             )
 
 
-class _text_validator(object):
-    def __init__(self, min_length, max_length, pattern, required):
+class _text_validator(_validator):
+    __slots__ = (
+        '__min_length', '__max_length', '__ascii_only', '__alphabet',
+        '__contains_only', '__normalization', '__pattern', '__fullmatch',
+        '__required_literal', '__unsafe_pattern', '__unsafe_message',
+        '__required',
+    )
+
+    def __init__(
+        self, min_length, max_length, ascii_only, alphabet, normalization,
+        pattern, unsafe_pattern, required,
+    ):
         _validate_int(min_length, min_value=0, required=False)
         _validate_int(max_length, min_value=0, required=False)
         if (
@@ -76,34 +533,141 @@ class _text_validator(object):
         self.__min_length = min_length
         self.__max_length = max_length
 
+        _validate_bool(ascii_only)
+        self.__ascii_only = ascii_only
+
+        if alphabet is None:
+            contains_only = None
+        else:
+            contains_only = _prepare_alphabet_cache(alphabet)
+        self.__alphabet = alphabet
+        self.__contains_only = contains_only
+
+        if (
+            normalization is not None and
+            normalization not in _NORMALIZATION_FORMS
+        ):
+            raise ValueError((
+                "expected one of 'NFC', 'NFD', 'NFKC' or 'NFKD', but "
+                "normalization is {normalization!r}"
+            ).format(normalization=normalization))
+        self.__normalization = normalization
+
         _validate_bool(required)
         self.__required = required
 
+        if unsafe_pattern not in ('warn', 'error', 'ignore'):
+            raise ValueError((
+                "expected 'warn', 'error' or 'ignore', but unsafe_pattern is "
+                "{unsafe_pattern!r}"
+            ).format(unsafe_pattern=unsafe_pattern))
+        self.__unsafe_pattern = unsafe_pattern
+
         if pattern is None:
-            compiled_pattern = pattern
-        elif isinstance(pattern, six.string_types):
-            # Note that we are a little more permissive about non-unicode
-            # patterns in python2 than we are about non-unicode arguments.
-            # Users will probably written the pattern argument inline.
-            compiled_pattern = re.compile(pattern)
-        elif isinstance(pattern, _pattern_type):
-            compiled_pattern = pattern
+            fullmatch, required_literal, unsafe = None, None, False
         else:
-            raise TypeError((
-                "expected compiled regex or string, "
-                "but pattern is of type {cls!r}"
-            ).format(cls=pattern.__class__.__name__))
+            fullmatch, required_literal, unsafe = _prepare_pattern_cache(
+                pattern,
+            )
+
+        unsafe_message = None
+        if unsafe and unsafe_pattern != 'ignore':
+            unsafe_message = (
+                "pattern {pattern!r} could take time exponential in the "
+                "length of a string to match it"
+            ).format(pattern=pattern)
+            if unsafe_pattern == 'error':
+                raise ValueError(unsafe_message)
+        self.__unsafe_message = unsafe_message
 
         self.__pattern = pattern
-        self.__compiled_pattern = compiled_pattern
+        self.__fullmatch = fullmatch
+        self.__required_literal = required_literal
+
+    def _key(self):
+        return (
+            self.__min_length, self.__max_length,
+            self.__ascii_only, self.__alphabet, self.__normalization,
+            self.__pattern, self.__unsafe_pattern, self.__required,
+        )
+
+    def _warn_unsafe_pattern(self, stacklevel):
+        """
+        Issues an :class:`UnsafePatternWarning` if the pattern looks unsafe
+        and the validator was asked to warn about it.
+
+        Called by :func:`validate_text` rather than by the constructor, which
+        can be reached through a varying number of frames in the validator
+        cache.  `stacklevel` is interpreted as if passed to
+        :func:`warnings.warn` by the caller.
+        """
+        if self.__unsafe_message is not None:
+            warnings.warn(
+                self.__unsafe_message, UnsafePatternWarning,
+                stacklevel=stacklevel + 1,
+            )
 
     def __call__(self, value):
         _validate_text(
-            value,
-            min_length=self.__min_length, max_length=self.__max_length,
-            pattern=self.__compiled_pattern, required=self.__required,
+            value, self.__min_length, self.__max_length,
+            self.__ascii_only, self.__alphabet, self.__contains_only,
+            self.__normalization,
+            self.__fullmatch, self.__required_literal, self.__required,
         )
 
+    def _compile(self, compiler, value):
+        conditions = ['isinstance({value}, {type})'.format(
+            value=value, type=compiler.constant(six.text_type),
+        )]
+
+        if self.__min_length is not None:
+            conditions.append('len({value}) >= {min}'.format(
+                value=value, min=compiler.constant(self.__min_length),
+            ))
+
+        if self.__max_length is not None:
+            conditions.append('len({value}) <= {max}'.format(
+                value=value, max=compiler.constant(self.__max_length),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+            conditions = []
+            if self.__ascii_only:
+                conditions.append('{is_ascii}({value})'.format(
+                    is_ascii=compiler.constant(_is_ascii), value=value,
+                ))
+            if self.__contains_only is not None:
+                conditions.append('{contains_only}({value})'.format(
+                    contains_only=compiler.constant(self.__contains_only),
+                    value=value,
+                ))
+            if conditions:
+                compiler.check(self, value, conditions)
+
+            if self.__normalization is not None:
+                compiler.check(self, value, [
+                    '{is_normalized}({form}, {value})'.format(
+                        is_normalized=compiler.constant(_is_normalized),
+                        form=compiler.constant(self.__normalization),
+                        value=value,
+                    ),
+                ])
+
+            if self.__fullmatch is not None:
+                conditions = []
+                if self.__required_literal is not None:
+                    conditions.append('{literal} in {value}'.format(
+                        literal=compiler.constant(self.__required_literal),
+                        value=value,
+                    ))
+                conditions.append('{fullmatch}({value}) is not None'.format(
+                    fullmatch=compiler.constant(self.__fullmatch),
+                    value=value,
+                ))
+                compiler.check(self, value, conditions)
+
     def __repr__(self):
         args = []
         if self.__min_length is not None:
@@ -116,11 +680,31 @@ class _text_validator(object):
                 max_length=self.__max_length,
             ))
 
+        if self.__ascii_only:
+            args.append('ascii_only={ascii_only!r}'.format(
+                ascii_only=self.__ascii_only,
+            ))
+
+        if self.__alphabet is not None:
+            args.append('alphabet={alphabet!r}'.format(
+                alphabet=self.__alphabet,
+            ))
+
+        if self.__normalization is not None:
+            args.append('normalization={normalization!r}'.format(
+                normalization=self.__normalization,
+            ))
+
         if self.__pattern is not None:
             args.append('pattern={pattern!r}'.format(
                 pattern=self.__pattern,
             ))
 
+        if self.__unsafe_pattern != 'ignore':
+            args.append('unsafe_pattern={unsafe_pattern!r}'.format(
+                unsafe_pattern=self.__unsafe_pattern,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -129,10 +713,14 @@ class _text_validator(object):
         return 'validate_text({args})'.format(args=', '.join(args))
 
 
+_text_validator_cache = make_validator_cache(_text_validator)
+
+
 def validate_text(
     value=_undefined,
     min_length=None, max_length=None,
-    pattern=None,
+    ascii_only=False, alphabet=None, normalization=None,
+    pattern=None, unsafe_pattern='ignore',
     required=True,
 ):
     """
@@ -163,8 +751,29 @@ def validate_text(
     :param int max_length:
         The maximum acceptable length for the string.  By default, the length
         is not checked.
+    :param bool ascii_only:
+        Whether to reject strings containing characters outside the ASCII
+        range.  Defaults to `False`.
+    :param str alphabet:
+        A string containing every character that the value may contain, for
+        example ``string.hexdigits``.  This is much faster than the
+        equivalent pattern, particularly if the alphabet only contains ASCII
+        characters.
+    :param str normalization:
+        If set, the string must already be in the given unicode normalization
+        form.  One of `'NFC'`, `'NFD'`, `'NFKC'` or `'NFKD'`.  On python 3.8
+        and later this is checked without building a normalized copy of the
+        string.  Use ``validate_many`` to check many strings at once.
     :param str|re.Pattern pattern:
         Regular expression to check the value against.
+    :param str unsafe_pattern:
+        What to do if `pattern` looks like it could take time exponential in
+        the length of a string to match it, as with `(a+)+`.  One of
+        `'warn'`, to issue an :class:`UnsafePatternWarning`, `'error'`, to
+        raise a `ValueError`, or `'ignore'`.  The check is a heuristic, and
+        will not catch every slow pattern.  `max_length` is always checked
+        before the pattern is run, so setting it puts a bound on how long any
+        pattern can take.  Defaults to `'ignore'`.
     :param bool required:
         Whether the value can be `None`.  Defaults to `True`.
 
@@ -172,45 +781,180 @@ def validate_text(
         If the value is not a unicode string , or if it was marked as
         `required` but `None` was passed in.
     :raises ValueError:
-        If the value was longer or shorter than expected, or did not match
+        If the value was longer or shorter than expected, contained a
+        character that was not allowed, was not normalized, or did not match
         the pattern.
     """
-    validate = _text_validator(
-        min_length=min_length, max_length=max_length,
-        pattern=pattern, required=required,
-    )
-
     if value is not _undefined:
+        validate = _text_validator_cache(
+            min_length, max_length, ascii_only, alphabet, normalization,
+            pattern, unsafe_pattern, required,
+        )
+        validate._warn_unsafe_pattern(  # pylint: disable=protected-access
+            stacklevel=2,
+        )
         validate(value)
     else:
-        return validate
+        validator = intern_validator(_text_validator(
+            min_length=min_length, max_length=max_length,
+            ascii_only=ascii_only, alphabet=alphabet,
+            normalization=normalization,
+            pattern=pattern, unsafe_pattern=unsafe_pattern,
+            required=required,
+        ))
+        validator._warn_unsafe_pattern(  # pylint: disable=protected-access
+            stacklevel=2,
+        )
+        return validator
+
+
+def _buffer_length(value):
+    """
+    Returns the size in bytes of an object that supports the buffer protocol,
+    or `None` if it doesn't.  The contents of the buffer are not copied.
+    """
+    try:
+        view = memoryview(value)
+    except TypeError:
+        return None
+
+    # `nbytes` is not available on python 2.
+    length = view.itemsize
+    for size in view.shape:
+        length *= size
+    return length
+
+
+# Small enough that decoding a chunk stays in cache, which is faster than
+# decoding an entire large buffer in one go.
+_DECODE_CHUNK_SIZE = 16 * 1024
 
 
-def _validate_bytes(value, min_length, max_length, required):
+def _contiguous_buffer(value):
+    """
+    Returns an object that supports the buffer protocol, as the value does,
+    but that is guaranteed to be C-contiguous.  Buffers that are not, such as
+    strided views, are copied.  Others are returned unchanged.
+    """
+    # Views on python 2 can't be strided.
+    if six.PY2 or memoryview(value).c_contiguous:
+        return value
+    return memoryview(value).tobytes()
+
+
+def _iter_unpack(record_struct, buffer):
+    """
+    Returns an iterator over the records in a contiguous buffer, unpacked
+    into tuples.  Equivalent to :meth:`struct.Struct.iter_unpack`, which is
+    not available on python 2.
+    """
+    iter_unpack = getattr(record_struct, 'iter_unpack', None)
+    if iter_unpack is not None:
+        return iter_unpack(buffer)
+
+    unpack_from = record_struct.unpack_from
+    return (
+        unpack_from(buffer, offset)
+        for offset in range(0, _buffer_length(buffer), record_struct.size)
+    )
+
+
+def _byte_view(value):
+    """
+    Returns a flat view of the bytes in an object that supports the buffer
+    protocol, which can be sliced without copying.
+
+    Buffers that are not C-contiguous, such as strided views, are copied, as
+    are all buffers on python 2, where views can't be cast.
+    """
+    view = memoryview(value)
+    if six.PY2:  # pragma: no cover
+        return view.tobytes()
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    return view.cast('B')
+
+
+def _encoding_error(value, encoding, decoder_factory):
+    """
+    Returns a `ValueError` describing the first invalid sequence in a bytes
+    like value, or `None` if it is valid in the given encoding.
+
+    The value is decoded in fixed size chunks, so the amount of memory used
+    does not depend on its size.
+    """
+    decoder = decoder_factory()
+    data = _byte_view(value)
+    length = len(data)
+    start = 0
+    while True:
+        end = start + _DECODE_CHUNK_SIZE
+        # Bytes held over from the previous chunk, if it ended part way
+        # through a character.
+        pending = len(decoder.getstate()[0])
+        try:
+            decoder.decode(data[start:end], final=end >= length)
+        except UnicodeDecodeError as exc:
+            return ValueError((
+                "expected valid {encoding}, but found {reason} at byte "
+                "{offset}"
+            ).format(
+                encoding=encoding, reason=exc.reason,
+                offset=start - pending + exc.start,
+            ))
+        if end >= length:
+            return None
+        start = end
+
+
+def _validate_bytes(
+    value, min_length, max_length, allow_buffers,
+    encoding, decoder_factory, required,
+):
     if value is None:
         if required:
             raise TypeError("required value is None")
         return
 
-    if not isinstance(value, six.binary_type):
+    if isinstance(value, six.binary_type):
+        length = len(value)
+    elif allow_buffers:
+        length = _buffer_length(value)
+        if length is None:
+            raise TypeError((
+                "expected bytes-like object, but value is of type {cls!r}"
+            ).format(cls=value.__class__.__name__))
+    else:
         raise TypeError((
             "expected byte string, but value is of type {cls!r}"
         ).format(cls=value.__class__.__name__))
 
-    if min_length is not None and len(value) < min_length:
+    if min_length is not None and length < min_length:
         raise ValueError((
             "expected at least {min} bytes, but bytestring contains only "
             "{length}"
-        ).format(length=len(value), min=min_length))
+        ).format(length=length, min=min_length))
 
-    if max_length is not None and len(value) > max_length:
+    if max_length is not None and length > max_length:
         raise ValueError((
             "expected at most {max} bytes, but bytestring contains {length}"
-        ).format(length=len(value), max=max_length))
+        ).format(length=length, max=max_length))
 
+    if decoder_factory is not None:
+        error = _encoding_error(value, encoding, decoder_factory)
+        if error is not None:
+            raise error
 
-class _bytes_validator(object):
-    def __init__(self, min_length, max_length, required):
+
+class _bytes_validator(_validator):
+    __slots__ = (
+        '__min_length', '__max_length', '__allow_buffers', '__encoding',
+        '__decoder_factory', '__required',
+    )
+
+    def __init__(
+        self, min_length, max_length, allow_buffers, encoding, required,
+    ):
         _validate_int(min_length, min_value=0, required=False)
         _validate_int(max_length, min_value=0, required=False)
         if (
@@ -224,17 +968,78 @@ class _bytes_validator(object):
         self.__min_length = min_length
         self.__max_length = max_length
 
+        _validate_bool(allow_buffers)
+        self.__allow_buffers = allow_buffers
+
+        if encoding is None:
+            decoder_factory = None
+        elif not isinstance(encoding, six.string_types):
+            raise TypeError((
+                "expected string, but encoding is of type {cls!r}"
+            ).format(cls=encoding.__class__.__name__))
+        else:
+            try:
+                decoder_factory = codecs.getincrementaldecoder(encoding)
+            except LookupError:
+                raise ValueError((
+                    "unknown encoding {encoding!r}"
+                ).format(encoding=encoding))
+        self.__encoding = encoding
+        self.__decoder_factory = decoder_factory
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__min_length, self.__max_length,
+            self.__allow_buffers, self.__encoding, self.__required,
+        )
+
     def __call__(self, value):
         _validate_bytes(
-            value,
-            min_length=self.__min_length,
-            max_length=self.__max_length,
-            required=self.__required,
+            value, self.__min_length, self.__max_length,
+            self.__allow_buffers, self.__encoding, self.__decoder_factory,
+            self.__required,
         )
 
+    def _compile(self, compiler, value):
+        with compiler.optional(value, required=self.__required):
+            if self.__allow_buffers:
+                length = compiler.name('length')
+                compiler.line('{length} = {buffer_length}({value})'.format(
+                    length=length,
+                    buffer_length=compiler.constant(_buffer_length),
+                    value=value,
+                ))
+                conditions = ['{length} is not None'.format(length=length)]
+            else:
+                length = 'len({value})'.format(value=value)
+                conditions = ['isinstance({value}, {type})'.format(
+                    value=value, type=compiler.constant(six.binary_type),
+                )]
+
+            if self.__min_length is not None:
+                conditions.append('{length} >= {min}'.format(
+                    length=length, min=compiler.constant(self.__min_length),
+                ))
+
+            if self.__max_length is not None:
+                conditions.append('{length} <= {max}'.format(
+                    length=length, max=compiler.constant(self.__max_length),
+                ))
+
+            compiler.check(self, value, conditions)
+
+            if self.__decoder_factory is not None:
+                condition = '{error}({value}, {encoding}, {factory}) is None'
+                compiler.check(self, value, [condition.format(
+                    error=compiler.constant(_encoding_error),
+                    value=value,
+                    encoding=compiler.constant(self.__encoding),
+                    factory=compiler.constant(self.__decoder_factory),
+                )])
+
     def __repr__(self):
         args = []
         if self.__min_length is not None:
@@ -247,6 +1052,16 @@ class _bytes_validator(object):
                 max_length=self.__max_length,
             ))
 
+        if self.__allow_buffers:
+            args.append('allow_buffers={allow_buffers!r}'.format(
+                allow_buffers=self.__allow_buffers,
+            ))
+
+        if self.__encoding is not None:
+            args.append('encoding={encoding!r}'.format(
+                encoding=self.__encoding,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -255,9 +1070,13 @@ class _bytes_validator(object):
         return 'validate_bytes({args})'.format(args=', '.join(args))
 
 
+_bytes_validator_cache = make_validator_cache(_bytes_validator)
+
+
 def validate_bytes(
     value=_undefined,
     min_length=None, max_length=None,
+    allow_buffers=False, encoding=None,
     required=True,
 ):
     """
@@ -275,6 +1094,17 @@ def validate_bytes(
     :param int max_length:
         The maximum acceptable length for the string.  By default, the length
         is not checked.
+    :param bool allow_buffers:
+        Whether to also accept any other object that supports the buffer
+        protocol, such as a `bytearray`, `memoryview` or `mmap.mmap`.  These
+        are checked in place, without copying their contents, and their
+        length is measured in bytes.  Only supported on python 3.  Defaults
+        to `False`.
+    :param str encoding:
+        If set, the value must be valid in the named text encoding, for
+        example `'utf-8'`.  The value is decoded in small chunks, so checking
+        a large buffer does not need a copy of it to be held in memory.  The
+        error will give the offset of the first invalid byte.
     :param bool required:
         Whether the value can be `None`.  Defaults to `True`.
 
@@ -282,15 +1112,18 @@ def validate_bytes(
         If the value is not a byte-string, or if it was marked as `required`
         but `None` was passed in.
     :raises ValueError:
-        If the value was longer or shorter than expected.
+        If the value was longer or shorter than expected, or was not valid
+        in the requested encoding.
     """
 
-    validate = _bytes_validator(
-        min_length=min_length, max_length=max_length,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _bytes_validator_cache(
+            min_length, max_length, allow_buffers, encoding, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_bytes_validator(
+            min_length=min_length, max_length=max_length,
+            allow_buffers=allow_buffers, encoding=encoding,
+            required=required,
+        ))
@@ -1,12 +1,20 @@
 from typing import Union, overload, Callable, Pattern, Optional, Text
 import six
 
+from .common import _validator
+
+
+class UnsafePatternWarning(UserWarning):
+    ...
+
 
 @overload
 def validate_text(
     value: Text,
     *, min_length: int=None, max_length: int=None,
+    ascii_only: bool=False, alphabet: str=None, normalization: str=None,
     pattern: Union[str, Pattern]=None,
+    unsafe_pattern: str='ignore',
 ) -> None:
     ...
 
@@ -15,7 +23,9 @@ def validate_text(
 def validate_text(
     value: Optional[Text],
     *, min_length: int=None, max_length: int=None,
+    ascii_only: bool=False, alphabet: str=None, normalization: str=None,
     pattern: Union[str, Pattern]=None,
+    unsafe_pattern: str='ignore',
     required: bool,
 ) -> None:
     ...
@@ -24,17 +34,21 @@ def validate_text(
 @overload
 def validate_text(
     *, min_length: int=None, max_length: int=None,
+    ascii_only: bool=False, alphabet: str=None, normalization: str=None,
     pattern: Union[str, Pattern]=None,
-) -> Callable[[Text], None]:
+    unsafe_pattern: str='ignore',
+) -> _validator[Text]:
     ...
 
 
 @overload
 def validate_text(
     *, min_length: int=None, max_length: int=None,
+    ascii_only: bool=False, alphabet: str=None, normalization: str=None,
     pattern: Union[str, Pattern]=None,
+    unsafe_pattern: str='ignore',
     required: bool,
-) -> Callable[[Optional[Text]], None]:
+) -> _validator[Optional[Text]]:
     ...
 
 
@@ -42,6 +56,7 @@ def validate_text(
 def validate_bytes(
     value: bytes,
     *, min_length: int=None, max_length: int=None,
+    allow_buffers: bool=False, encoding: str=None,
 ) -> None:
     ...
 
@@ -50,6 +65,7 @@ def validate_bytes(
 def validate_bytes(
     value: Optional[bytes],
     *, min_length: int=None, max_length: int=None,
+    allow_buffers: bool=False, encoding: str=None,
     required: bool,
 ) -> None:
     ...
@@ -58,13 +74,15 @@ def validate_bytes(
 @overload
 def validate_bytes(
     *, min_length: int=None, max_length: int=None,
-) -> Callable[[bytes], None]:
+    allow_buffers: bool=False, encoding: str=None,
+) -> _validator[bytes]:
     ...
 
 
 @overload
 def validate_bytes(
     *, min_length: int=None, max_length: int=None,
+    allow_buffers: bool=False, encoding: str=None,
     required: bool,
-) -> Callable[[Optional[bytes]], None]:
+) -> _validator[Optional[bytes]]:
     ...
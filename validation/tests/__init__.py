@@ -17,6 +17,10 @@ from . import (
     test_optional_argument,
     test_email,
     test_uuid,
+    test_records,
+    test_compile,
+    test_numpy,
+    test_import,
 )  # noqa:
 
 
@@ -38,4 +42,8 @@ suite = unittest.TestSuite((
     loader.loadTestsFromModule(test_optional_argument),  # type: ignore
     loader.loadTestsFromModule(test_email),  # type: ignore
     loader.loadTestsFromModule(test_uuid),  # type: ignore
+    loader.loadTestsFromModule(test_records),  # type: ignore
+    loader.loadTestsFromModule(test_compile),  # type: ignore
+    loader.loadTestsFromModule(test_numpy),  # type: ignore
+    loader.loadTestsFromModule(test_import),  # type: ignore
 ))
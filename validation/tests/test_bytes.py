@@ -1,4 +1,8 @@
+import sys
 import unittest
+import array
+import mmap
+import tempfile
 
 from validation import validate_bytes
 
@@ -23,6 +27,161 @@ class ValidateBytesTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_bytes(b"123456", max_length=5)
 
+    def test_buffers_rejected_by_default(self):
+        with self.assertRaises(TypeError):
+            validate_bytes(bytearray(b"123456"))
+
+        with self.assertRaises(TypeError):
+            validate_bytes(memoryview(b"123456"))
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_allow_buffers(self):
+        validator = validate_bytes(
+            min_length=2, max_length=4, allow_buffers=True,
+        )
+        validator(b"123")
+        validator(bytearray(b"123"))
+        validator(memoryview(b"123456")[1:4])
+
+        with self.assertRaises(ValueError):
+            validator(bytearray(b"12345"))
+
+        with self.assertRaises(ValueError):
+            validator(memoryview(b"123456")[5:])
+
+        with self.assertRaises(TypeError):
+            validator(u"123")
+
+        with self.assertRaises(TypeError):
+            validator([1, 2, 3])
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_allow_buffers_length_in_bytes(self):
+        value = array.array('i', [1, 2])
+        length = 2 * value.itemsize
+        validate_bytes(
+            value, min_length=length, max_length=length, allow_buffers=True,
+        )
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_allow_buffers_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"x" * 4096)
+            f.flush()
+            buffer = mmap.mmap(f.fileno(), 0)
+            validate_bytes(buffer, max_length=4096, allow_buffers=True)
+            with self.assertRaises(ValueError):
+                validate_bytes(buffer, max_length=4095, allow_buffers=True)
+
+            # Nothing should still be holding on to the buffer.
+            buffer.close()
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_allow_buffers_released(self):
+        value = bytearray(b"123")
+        validate_bytes(value, allow_buffers=True)
+        validate_bytes(allow_buffers=True).is_valid(value)
+
+        # Resizing fails if a view of the buffer has not been released.
+        value.extend(b"456")
+
+    def test_encoding(self):  # type: () -> None
+        validate_bytes(b"", encoding='utf-8')
+        validate_bytes(u"caf\xe9".encode('utf-8'), encoding='utf-8')
+
+        with self.assertRaises(ValueError) as cm:
+            validate_bytes(b"caf\xe9", encoding='utf-8')
+        self.assertEqual(
+            str(cm.exception),
+            "expected valid utf-8, but found unexpected end of data at "
+            "byte 3",
+        )
+
+        with self.assertRaises(ValueError) as cm:
+            validate_bytes(b"ab\xffcd", encoding='utf-8')
+        self.assertEqual(
+            str(cm.exception),
+            "expected valid utf-8, but found invalid start byte at byte 2",
+        )
+
+        validate_bytes(b"caf\xe9", encoding='latin-1')
+
+        with self.assertRaises(ValueError):
+            validate_bytes(b"caf\xe9", encoding='ascii')
+
+    def test_encoding_checked_after_length(self):  # type: () -> None
+        with self.assertRaises(ValueError) as cm:
+            validate_bytes(b"\xff" * 10, max_length=5, encoding='utf-8')
+        self.assertIn("at most 5 bytes", str(cm.exception))
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_encoding_across_chunks(self):
+        # A multi-byte character split over the boundary between two chunks
+        # must not be reported as invalid.
+        snowman = u"\u2603".encode('utf-8')
+        for prefix in range(1, 4):
+            value = bytearray(b"a" * (16 * 1024 - prefix) + snowman * 8)
+            validate_bytes(value, allow_buffers=True, encoding='utf-8')
+
+            value[-1:] = b""
+            with self.assertRaises(ValueError) as cm:
+                validate_bytes(value, allow_buffers=True, encoding='utf-8')
+            self.assertIn(
+                "at byte {offset}".format(offset=len(value) - 2),
+                str(cm.exception),
+            )
+
+        value = bytearray(b"a" * 100000)
+        value[70000] = 0xff
+        with self.assertRaises(ValueError) as cm:
+            validate_bytes(value, allow_buffers=True, encoding='utf-8')
+        self.assertIn("at byte 70000", str(cm.exception))
+
+        # The buffer should have been released.
+        value.extend(b"a")
+
+    @unittest.skipIf(sys.version_info < (3,), "views can't be strided")
+    def test_allow_buffers_strided(self):
+        validator = validate_bytes(max_length=3, allow_buffers=True)
+        validator(memoryview(b"123456")[::2])
+        with self.assertRaises(ValueError):
+            validator(memoryview(b"1234567")[::2])
+
+    @unittest.skipIf(sys.version_info < (3,), "views can't be strided")
+    def test_encoding_strided(self):
+        validator = validate_bytes(allow_buffers=True, encoding='utf-8')
+        validator(memoryview(b"a\xffb\xffc")[::2])
+
+        value = memoryview(b"ab\xffcd\xff")[::2]
+        with self.assertRaises(ValueError) as cm:
+            validator(value)
+        self.assertEqual(
+            str(cm.exception),
+            "expected valid utf-8, but found invalid start byte at byte 1",
+        )
+        self.assertFalse(validator.is_valid(value))
+        self.assertTrue(validator.is_valid(memoryview(b"abcd")[::2]))
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_encoding_mmap(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b"x" * 100000 + b"\xc3")
+            f.flush()
+            buffer = mmap.mmap(f.fileno(), 0)
+            validator = validate_bytes(allow_buffers=True, encoding='utf-8')
+            with self.assertRaises(ValueError) as cm:
+                validator(buffer)
+            self.assertIn("at byte 100000", str(cm.exception))
+            self.assertFalse(validator.is_valid(buffer))
+            buffer.close()
+
+    def test_invalid_encoding(self):
+        with self.assertRaises(ValueError):
+            validate_bytes(encoding='utf-9')
+
+        with self.assertRaises(TypeError):
+            validate_bytes(encoding=8)
+
     def test_not_required(self):  # type: () -> None
         validate_bytes(None, required=False)
 
@@ -43,6 +202,14 @@ class ValidateBytesTestCase(unittest.TestCase):
             'validate_bytes(min_length=4, max_length=10, required=False)',
         )
 
+    def test_repr_encoding(self):  # type: () -> None
+        validator = validate_bytes(encoding='utf-8')
+        self.assertEqual(repr(validator), 'validate_bytes(encoding=\'utf-8\')')
+
+    def test_repr_allow_buffers(self):  # type: () -> None
+        validator = validate_bytes(allow_buffers=True)
+        self.assertEqual(repr(validator), 'validate_bytes(allow_buffers=True)')
+
     def test_check_requested_bounds(self):
         with self.assertRaises(TypeError):
             validate_bytes(min_length='1')
@@ -0,0 +1,307 @@
+import array
+import gc
+import linecache
+import traceback
+import unittest
+import uuid
+from datetime import date, datetime, timedelta
+
+import pytz
+
+from validation import (
+    validate_int, validate_float, validate_bool,
+    validate_text, validate_bytes,
+    validate_date, validate_datetime, validate_timedelta,
+    validate_list, validate_set, validate_mapping, validate_structure,
+    validate_tuple, validate_uuid,
+    compile, is_valid,
+)
+from validation.compiler import compile_many
+
+
+class CompileTestCase(unittest.TestCase):
+    def assertSameBehaviour(self, validator, value):
+        compiled = compile(validator)
+
+        try:
+            validator(value)
+        except Exception as exc:  # pylint: disable=broad-except
+            expected = exc
+        else:
+            expected = None
+
+        try:
+            compiled(value)
+        except Exception as exc:  # pylint: disable=broad-except
+            actual = exc
+        else:
+            actual = None
+
+        self.assertIs(type(actual), type(expected))
+        self.assertEqual(str(actual), str(expected))
+
+        self.assertIs(is_valid(validator, value), expected is None)
+
+    def test_not_callable(self):
+        with self.assertRaises(TypeError):
+            compile(1)
+
+    def test_int(self):  # type: () -> None
+        validator = validate_int(min_value=0, max_value=10)
+        for value in [None, 0, 5, 10, -1, 11, 1.0, True, "1"]:
+            self.assertSameBehaviour(validator, value)
+
+    def test_float(self):  # type: () -> None
+        for validator in [
+            validate_float(min_value=0.0, max_value=1.0),
+            validate_float(allow_nan=True, min_value=0.0),
+            validate_float(allow_infinite=True, max_value=1.0),
+        ]:
+            for value in [
+                None, 0.0, 0.5, -0.5, 1.5, 1, float('nan'),
+                float('inf'), float('-inf'),
+            ]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_bool(self):  # type: () -> None
+        for validator in [validate_bool(), validate_bool(required=False)]:
+            for value in [None, True, False, 1]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_text(self):  # type: () -> None
+        for validator in [
+            validate_text(min_length=1, max_length=3),
+            validate_text(pattern='a|ab'),
+            validate_text(pattern='(?:ab)+c'),
+            validate_text(ascii_only=True),
+            validate_text(alphabet=u'abc'),
+            validate_text(alphabet=u'abc\xe9', pattern='a.*'),
+            validate_text(normalization='NFD'),
+        ]:
+            for value in [
+                None, u"", u"a", u"ab", u"abcd", u"ababc", u"ab\xe9",
+                u"abe\u0301", b"ab",
+            ]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_bytes(self):  # type: () -> None
+        for validator in [
+            validate_bytes(min_length=1, max_length=3, required=False),
+            validate_bytes(min_length=1, max_length=3, allow_buffers=True),
+            validate_bytes(encoding='utf-8', allow_buffers=True),
+        ]:
+            for value in [
+                None, b"", b"a", b"abcd", u"ab", b"\xc3\xa9", b"a\xc3",
+                bytearray(b"ab"), memoryview(b"abcd"), memoryview(b"abcd")[2:],
+            ]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_datetime(self):  # type: () -> None
+        values = [
+            None, date(2000, 1, 1), datetime(2000, 1, 1),
+            datetime(2000, 1, 1, tzinfo=pytz.utc), timedelta(1),
+        ]
+        for validator in [
+            validate_date(), validate_datetime(), validate_timedelta(),
+        ]:
+            for value in values:
+                self.assertSameBehaviour(validator, value)
+
+    def test_uuid(self):  # type: () -> None
+        for validator in [
+            validate_uuid(version=4),
+            validate_uuid(version=4, allow_strings=True, allow_bytes=True),
+            validate_uuid(
+                variant=uuid.RESERVED_NCS, allow_strings=True, required=False,
+            ),
+            validate_uuid(
+                version=1,
+                min_timestamp=datetime(2000, 1, 1, tzinfo=pytz.utc),
+                max_timestamp=datetime(2100, 1, 1, tzinfo=pytz.utc),
+            ),
+            validate_uuid(
+                version=1, allow_strings=True, allow_bytes=True,
+                max_timestamp=datetime(2000, 1, 1, tzinfo=pytz.utc),
+            ),
+        ]:
+            for value in [
+                None, uuid.uuid4(), uuid.uuid1(),
+                str(uuid.uuid4()), str(uuid.uuid1()), u"not a uuid",
+                uuid.uuid4().bytes, uuid.uuid1().bytes, b"",
+            ]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_list(self):  # type: () -> None
+        validator = validate_list(
+            validator=validate_int(min_value=0), min_length=1, max_length=3,
+        )
+        for value in [None, [], [1], [1, -1], [1, 2, 3, 4], (1,)]:
+            self.assertSameBehaviour(validator, value)
+
+    def test_list_allow_arrays(self):
+        validator = validate_list(
+            validator=validate_int(min_value=0), allow_arrays=True,
+        )
+        for value in [
+            None, [1], [-1], array.array('i', [1]), array.array('i', [-1]),
+            array.array('d', [1.0]), (1,),
+        ]:
+            self.assertSameBehaviour(validator, value)
+
+    def test_set(self):  # type: () -> None
+        validator = validate_set(validator=validate_int(), required=False)
+        for value in [None, set(), {1}, {u"1"}, [1]]:
+            self.assertSameBehaviour(validator, value)
+
+    def test_mapping(self):
+        validator = validate_mapping(
+            key_validator=validate_text(),
+            value_validator=validate_int(),
+        )
+        for value in [None, {}, {u"a": 1}, {b"a": 1}, {u"a": u"1"}, []]:
+            self.assertSameBehaviour(validator, value)
+
+    def test_structure(self):
+        for validator in [
+            validate_structure(schema={
+                'a': validate_int(), 'b': validate_text(required=False),
+            }),
+            validate_structure(schema={
+                'a': validate_int(), 'b': validate_text(required=False),
+            }, missing_as_none=True),
+            validate_structure(schema={'a': validate_int()}, allow_extra=True),
+        ]:
+            for value in [
+                None, {}, {'a': 1}, {'a': 1, 'b': None}, {'a': 1, 'b': 1},
+                {'a': 1, 'b': u"b", 'c': 1}, {'a': u"1"}, [],
+            ]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_tuple(self):
+        for validator in [
+            validate_tuple(schema=(validate_int(), validate_text())),
+            validate_tuple(length=2),
+        ]:
+            for value in [None, (1, u"a"), (1, 1), (1,), [1, u"a"]]:
+                self.assertSameBehaviour(validator, value)
+
+    def test_custom_validator(self):  # type: () -> None
+        def validator(value):
+            if value != 1:
+                raise ValueError("message")
+
+        for value in [[1], [1, 2]]:
+            self.assertSameBehaviour(validate_list(validator=validator), value)
+
+    def test_nested(self):  # type: () -> None
+        validator = validate_structure(schema={
+            'items': validate_list(validator=validate_structure(schema={
+                'id': validate_int(min_value=0),
+                'tags': validate_mapping(value_validator=validate_list(
+                    validator=validate_text(),
+                )),
+            })),
+        })
+
+        for value in [
+            {'items': []},
+            {'items': [{'id': 1, 'tags': {}}]},
+            {'items': [{'id': 1, 'tags': {'a': [u"a", u"b"]}}]},
+            {'items': [{'id': 1, 'tags': {'a': [u"a", b"b"]}}]},
+            {'items': [{'id': 1, 'tags': {}}, {'id': -1, 'tags': {}}]},
+            {'items': [{'id': 1}]},
+        ]:
+            self.assertSameBehaviour(validator, value)
+
+    def test_source_in_traceback(self):
+        compiled = compile(validate_structure(schema={
+            'id': validate_int(min_value=0),
+        }))
+        try:
+            compiled({'id': -1})
+        except ValueError:
+            lines = traceback.format_exc()
+        self.assertIn("<validation.compile-", lines)
+        self.assertIn("def validate(value):", "".join(
+            linecache.getlines(compiled.__code__.co_filename),
+        ))
+
+    def test_source_released(self):
+        compiled = compile(validate_int(min_value=0))
+        filename = compiled.__code__.co_filename
+        self.assertTrue(linecache.getlines(filename))
+
+        del compiled
+        gc.collect()
+        self.assertNotIn(filename, linecache.cache)
+
+
+class CompileManyTestCase(unittest.TestCase):
+    def test_not_callable(self):
+        with self.assertRaises(TypeError):
+            compile_many(1)
+
+    def test_custom_validator(self):
+        def validator(value):
+            if value != 1:
+                raise ValueError("message")
+
+        validate_many = compile_many(validator)
+        validate_many([1, 1])
+
+        with self.assertRaises(ValueError) as cm:
+            validate_many([1, 2])
+        self.assertEqual(
+            str(cm.exception), "invalid item at position 1: message",
+        )
+
+    def test_generator_error(self):
+        def values():
+            yield 1
+            raise TypeError("message")
+
+        with self.assertRaises(TypeError) as cm:
+            compile_many(validate_int())(values())
+        self.assertEqual(str(cm.exception), "message")
+
+
+class IsValidTestCase(unittest.TestCase):
+    def test_custom_validator(self):  # type: () -> None
+        def validator(value):
+            if value != 1:
+                raise ValueError("message")
+
+        self.assertTrue(is_valid(validator, 1))
+        self.assertFalse(is_valid(validator, 2))
+
+    def test_custom_validator_unexpected_error(self):  # type: () -> None
+        def validator(value):
+            raise ZeroDivisionError()
+
+        with self.assertRaises(ZeroDivisionError):
+            is_valid(validate_list(validator=validator), [1])
+
+    def test_method(self):  # type: () -> None
+        validator = validate_structure(schema={
+            'id': validate_int(min_value=0),
+            'tags': validate_list(validator=validate_text()),
+        })
+        self.assertTrue(validator.is_valid({'id': 1, 'tags': [u"a"]}))
+        self.assertFalse(validator.is_valid({'id': 1, 'tags': [1]}))
+        self.assertFalse(validator.is_valid({'id': -1, 'tags': []}))
+        self.assertFalse(validator.is_valid({'id': 1}))
+        self.assertFalse(validator.is_valid(None))
+
+    def test_does_not_call_original_validators(self):  # type: () -> None
+        calls = []
+
+        def validator(value):
+            calls.append(value)
+
+        outer = validate_list(validator=validate_tuple(
+            schema=(validate_int(), validator),
+        ))
+        self.assertFalse(outer.is_valid([(1, u"a"), (u"2", u"b")]))
+        # The invalid int in the second tuple is found without calling
+        # anything.
+        self.assertEqual(calls, [u"a"])
@@ -1,8 +1,19 @@
 # -*- coding: utf-8 -*-
 
+import sys
 import unittest
+from random import Random
 
-from validation import validate_email_address
+from validation import validate_email_address, validate_email_addresses
+from validation.email import (
+    set_domain_cache_size, domain_cache_info, clear_domain_cache,
+)
+
+# The fast path helpers are private, and so are not in the stub.  They are
+# looked up on the module, from tests that are not type checked.
+import validation.email as email_module
+
+from validation.tests.test_import import _run_python
 
 
 class ValidateIntTestCase(unittest.TestCase):
@@ -318,3 +329,253 @@ class ValidateIntTestCase(unittest.TestCase):
                 u".1111111111222222222233333333334444"
                 u".info"
             )
+
+    def test_validate_many(self):
+        validator = validate_email_address()
+        validator.validate_many([u"one@example.com", u"two@example.com"])
+
+        with self.assertRaises(ValueError):
+            validator.validate_many([u"one@example.com", u"two"])
+
+    def test_invalid_characters_reported(self):
+        with self.assertRaises(ValueError) as cm:
+            validate_email_address(u"a b(c)d)@example.com")
+        self.assertEqual(
+            str(cm.exception),
+            "local part contains invalid characters: {chars!r}".format(
+                chars=u" , (, )",
+            ),
+        )
+
+    def test_invalid_characters_reported_no_smtputf8(self):
+        with self.assertRaises(ValueError) as cm:
+            validate_email_address(u"ü b@example.com", allow_smtputf8=False)
+        self.assertEqual(
+            str(cm.exception),
+            "local part contains invalid characters: {chars!r}".format(
+                chars=u" , \xfc",
+            ),
+        )
+
+
+class ValidateEmailAddressesTestCase(unittest.TestCase):
+    def test_results_in_order(self):
+        results = validate_email_addresses([
+            u"one@example.com",
+            u"two@example..com",
+            u"three@example.com",
+            u"four",
+            u"five@EXAMPLE.com",
+        ])
+        self.assertEqual(
+            [None if error is None else str(error) for error in results],
+            [
+                None,
+                "unexpected consecutive periods in domain name",
+                None,
+                "email address is missing an '@' sign",
+                "email address is not normalised",
+            ],
+        )
+
+    def test_matches_single_address_validation(self):
+        values = [
+            u"user@example.com",
+            u"user@Example.com",
+            u"юзер@екзампл.ком",
+            u"юзер@xn--80ajglhfv.xn--j1aef",
+            u"!#$%&'*+-/=?^_`.{|}~@example.com",
+            u"@example.com",
+            u"user@",
+            u"a@b@example.com",
+            u"user@localhost",
+            u"a" * 65 + u"@example.com",
+            u"a" * 64 + u"@" + u"b" * 63 + u"." + u"c" * 63 + u".com",
+            u"a" * 60 + u"@" + u"b" * 63 + u"." + u"c" * 63 + u"." +
+            u"d" * 63 + u".com",
+            None,
+            b"user@example.com",
+        ]
+        for allow_unnormalized in (False, True):
+            for allow_smtputf8 in (False, True):
+                expected = []
+                for value in values:
+                    try:
+                        validate_email_address(
+                            value,
+                            allow_unnormalized=allow_unnormalized,
+                            allow_smtputf8=allow_smtputf8,
+                        )
+                    except (TypeError, ValueError) as e:
+                        expected.append((type(e), str(e)))
+                    else:
+                        expected.append(None)
+
+                results = validate_email_addresses(
+                    values,
+                    allow_unnormalized=allow_unnormalized,
+                    allow_smtputf8=allow_smtputf8,
+                )
+                self.assertEqual(
+                    [
+                        None if error is None else (type(error), str(error))
+                        for error in results
+                    ],
+                    expected,
+                )
+
+    def test_not_required(self):
+        self.assertEqual(
+            validate_email_addresses([None], required=False), [None],
+        )
+
+    def test_domain_checked_once(self):
+        clear_domain_cache()
+        validate_email_addresses([
+            u"user{}@example.com".format(index) for index in range(100)
+        ])
+        self.assertEqual(domain_cache_info().misses, 1)
+        self.assertEqual(domain_cache_info().hits, 0)
+
+
+class PlainHostnameTestCase(unittest.TestCase):
+    # pylint: disable=protected-access
+
+    corpus = [
+        u"example.com",
+        u"mail.example.co.uk",
+        u"a.b",
+        u"123.com",
+        u"a-b.com",
+        u"a--b.com",
+        u"ab--c.com",
+        u"xn--mnchen-3ya.de",
+        u"xn--.com",
+        u"-a.com",
+        u"a-.com",
+        u"Example.com",
+        u"EXAMPLE.COM",
+        u"example.com.",
+        u".example.com",
+        u"example..com",
+        u"exa_mple.com",
+        u"exa mple.com",
+        u"münchen.de",
+        u"example\uff0ecom",
+        u"a" * 63 + u".com",
+        u"a" * 64 + u".com",
+        u".".join([u"a" * 63] * 4)[:253],
+        u".".join([u"a" * 63] * 4)[:254],
+        u"localhost",
+    ]
+
+    def assertSameAsIdna(self, domain):
+        try:
+            expected = email_module._idna_normalize_domain(domain)
+        except ValueError:
+            self.assertFalse(email_module._is_plain_hostname(domain), domain)
+        else:
+            if email_module._is_plain_hostname(domain):
+                self.assertEqual(expected, (domain, domain))
+
+    def test_corpus(self):
+        for domain in self.corpus:
+            self.assertSameAsIdna(domain)
+
+    def test_generated(self):
+        random = Random(0)
+        for _ in range(2000):
+            domain = u"".join(
+                random.choice(u"ab0-.X")
+                for _ in range(random.randint(1, 12))
+            )
+            self.assertSameAsIdna(domain)
+
+    def test_common_domains_are_plain(self):
+        for domain in [u"gmail.com", u"outlook.com", u"example.co.uk"]:
+            self.assertTrue(email_module._is_plain_hostname(domain))
+
+
+class DomainCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        clear_domain_cache()
+
+    def tearDown(self):
+        set_domain_cache_size(4096)
+        clear_domain_cache()
+
+    def test_hits(self):
+        validate_email_address(u"one@example.com")
+        validate_email_address(u"two@example.com")
+        validate_email_address(u"three@example.org")
+
+        info = domain_cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.currsize, 2)
+
+    def test_errors_cached(self):
+        for _ in range(2):
+            with self.assertRaises(ValueError) as cm:
+                validate_email_address(u"user@example..com")
+            self.assertEqual(
+                str(cm.exception),
+                "unexpected consecutive periods in domain name",
+            )
+        self.assertEqual(domain_cache_info().hits, 1)
+
+    def test_least_recently_used_evicted(self):
+        set_domain_cache_size(2)
+        validate_email_address(u"user@one.com")
+        validate_email_address(u"user@two.com")
+        validate_email_address(u"user@one.com")
+        validate_email_address(u"user@three.com")
+
+        # `two.com` was evicted, `one.com` was not.
+        validate_email_address(u"user@one.com")
+        self.assertEqual(domain_cache_info().hits, 2)
+        validate_email_address(u"user@two.com")
+        self.assertEqual(domain_cache_info().misses, 4)
+
+    def test_disabled(self):
+        set_domain_cache_size(0)
+        validate_email_address(u"one@example.com")
+        validate_email_address(u"two@example.com")
+        self.assertEqual(domain_cache_info().currsize, 0)
+
+    def test_shrink(self):
+        validate_email_address(u"user@one.com")
+        validate_email_address(u"user@two.com")
+        set_domain_cache_size(1)
+        self.assertEqual(domain_cache_info().currsize, 1)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            set_domain_cache_size(-1)
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 7), "lazy loading requires module __getattr__",
+)
+class LazyImportTestCase(unittest.TestCase):
+    def test_idna_not_imported(self):
+        stdout, _ = _run_python('-c', (
+            "import sys, validation\n"
+            "print('idna' in sys.modules)\n"
+            "validation.validate_email_address(u'user@example.com')\n"
+            "print('idna' in sys.modules)\n"
+        ))
+        self.assertEqual(stdout.strip(), "False\nTrue")
+
+    def test_idna_not_installed(self):
+        stdout, _ = _run_python('-c', (
+            "import sys\n"
+            "sys.modules['idna'] = None\n"
+            "import validation\n"
+            "print(hasattr(validation, 'validate_email_address'))\n"
+            "try:\n"
+            "    from validation import validate_email_address\n"
+            "except ImportError:\n"
+            "    print('ImportError')\n"
+        ))
+        self.assertEqual(stdout.strip(), "False\nImportError")
@@ -117,6 +117,13 @@ class ValidateFloatTestCase(unittest.TestCase):
             'validate_float(allow_infinite=True, allow_nan=True)',
         )
 
+    def test_interned_signed_zero(self):  # type: () -> None
+        positive = validate_float(min_value=0.0)
+        negative = validate_float(min_value=-0.0)
+        self.assertIsNot(positive, negative)
+        self.assertEqual(repr(negative), 'validate_float(min_value=-0.0)')
+        self.assertIs(validate_float(min_value=-0.0), negative)
+
     def test_check_requested_bounds(self):
         with self.assertRaises(TypeError):
             validate_float(min_value=1)
@@ -126,3 +133,10 @@ class ValidateFloatTestCase(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             validate_float(min_value=10.0, max_value=9.0)
+
+    def test_inline_check_requested_bounds_repeated(self):
+        validate_float(5.0, min_value=0.0)
+
+        for _ in range(3):
+            with self.assertRaises(TypeError):
+                validate_float(5.0, min_value=0)
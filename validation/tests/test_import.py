@@ -0,0 +1,76 @@
+import subprocess
+import sys
+import unittest
+
+import validation
+
+
+# Importing the package on its own was measured at around 3ms on a laptop,
+# against 100ms for going on to import everything in `__all__`.  The margin
+# is generous, as both are slower, and noisier, on CI machines.
+IMPORT_TIME_MAX_RATIO = 0.25
+
+
+def _run_python(*args):
+    process = subprocess.Popen(
+        [sys.executable] + list(args),
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+    )
+    stdout, stderr = process.communicate()
+    if process.returncode:
+        raise AssertionError(stderr.decode('utf-8'))
+    return stdout.decode('utf-8'), stderr.decode('utf-8')
+
+
+@unittest.skipIf(
+    sys.version_info < (3, 7), "lazy loading requires module __getattr__",
+)
+class LazyImportTestCase(unittest.TestCase):
+    def test_submodules_not_imported(self):
+        stdout, _ = _run_python('-c', (
+            "import sys, validation\n"
+            "print(sorted(\n"
+            "    name for name in sys.modules\n"
+            "    if name.startswith('validation.') or\n"
+            "    name in ('six', 'typing', 'idna')\n"
+            "))\n"
+        ))
+        self.assertEqual(stdout.strip(), "[]")
+
+    def test_import_time(self):
+        stdout, _ = _run_python('-c', (
+            "import time\n"
+            "start = time.perf_counter()\n"
+            "import validation\n"
+            "lazy = time.perf_counter() - start\n"
+            "start = time.perf_counter()\n"
+            "from validation import *\n"
+            "eager = time.perf_counter() - start\n"
+            "print(lazy, eager)\n"
+        ))
+        lazy, eager = map(float, stdout.split())
+
+        self.assertLess(lazy, eager * IMPORT_TIME_MAX_RATIO)
+
+    def test_all(self):  # type: () -> None
+        for name in validation.__all__:
+            self.assertTrue(callable(getattr(validation, name)), name)
+
+    def test_import_star_keeps_builtin_compile(self):
+        namespace = {}
+        exec("from validation import *", namespace)
+        self.assertNotIn('compile', namespace)
+
+    def test_dir(self):  # type: () -> None
+        self.assertTrue(set(validation.__all__) <= set(dir(validation)))
+
+    def test_missing(self):
+        with self.assertRaises(AttributeError):
+            validation.validate_nothing  # pylint: disable=no-member
+
+    def test_submodule_attribute(self):
+        stdout, _ = _run_python('-c', (
+            "import validation\n"
+            "print(validation.datastructure.validate_list.__module__)\n"
+        ))
+        self.assertEqual(stdout.strip(), "validation.datastructure")
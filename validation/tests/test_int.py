@@ -62,3 +62,60 @@ class ValidateIntTestCase(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             validate_int(min_value=10, max_value=9)
+
+    def test_inline_repeated(self):  # type: () -> None
+        for _ in range(3):
+            validate_int(5, min_value=0, max_value=10)
+
+            with self.assertRaises(ValueError):
+                validate_int(-1, min_value=0, max_value=10)
+
+    def test_inline_check_requested_bounds_repeated(self):
+        validate_int(5, required=True)
+
+        for _ in range(3):
+            with self.assertRaises(TypeError):
+                validate_int(5, required=1)
+
+    def test_equality(self):  # type: () -> None
+        self.assertEqual(validate_int(min_value=1), validate_int(min_value=1))
+        self.assertEqual(
+            hash(validate_int(min_value=1)), hash(validate_int(min_value=1)),
+        )
+        self.assertNotEqual(validate_int(min_value=1), validate_int())
+        self.assertNotEqual(
+            validate_int(min_value=1), validate_int(max_value=1),
+        )
+
+    def test_interned(self):  # type: () -> None
+        self.assertIs(validate_int(min_value=1), validate_int(min_value=1))
+        self.assertIsNot(
+            validate_int(min_value=True), validate_int(min_value=1),
+        )
+
+    def test_no_instance_dict(self):  # type: () -> None
+        self.assertFalse(hasattr(validate_int(min_value=1), '__dict__'))
+
+    def test_validate_many(self):  # type: () -> None
+        validator = validate_int(min_value=0)
+        validator.validate_many([])
+        validator.validate_many([0, 1, 2])
+        validator.validate_many(iter([0, 1, 2]))
+
+    def test_validate_many_invalid(self):
+        validator = validate_int(min_value=0)
+
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many([0, 1, -2, -3])
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 2: "
+            "expected value less than 0, but got -2",
+        )
+
+        with self.assertRaises(TypeError):
+            validator.validate_many([0, None])
+
+    def test_validate_many_not_iterable(self):
+        with self.assertRaises(TypeError):
+            validate_int().validate_many(1)
@@ -1,5 +1,8 @@
+import array
+import pickle
 import unittest
 
+import validation.compiler
 from validation import validate_int, validate_list
 
 
@@ -77,6 +80,38 @@ class ValidateListTestCase(unittest.TestCase):
         self.assertIsNot(caught, thrown)
         self.assertEqual(str(caught), "invalid item at position 0: message")
 
+    def test_reraise_nested(self):
+        thrown = ValueError("message")
+
+        def inner(value):
+            raise thrown
+
+        with self.assertRaises(ValueError) as cm:
+            validate_list([[], [1]], validator=validate_list(
+                validator=inner,
+            ))
+        caught = cm.exception
+        message = "invalid item at position 1: invalid item at position 0: "\
+            "message"
+
+        self.assertIsNot(caught, thrown)
+        self.assertEqual(caught.path, [1, 0])
+        self.assertEqual(str(caught), message)
+        self.assertEqual(caught.args, (message,))
+        self.assertIsInstance(caught, ValueError)
+        # The format of the repr of exceptions changed in python 3.7.
+        self.assertEqual(repr(caught), repr(ValueError(message)))
+
+    def test_reraise_nested_pickle(self):
+        with self.assertRaises(ValueError) as cm:
+            validate_list([[1, -1]], validator=validate_list(
+                validator=validate_int(min_value=0),
+            ))
+
+        copied = pickle.loads(pickle.dumps(cm.exception))
+        self.assertIs(type(copied), ValueError)
+        self.assertEqual(str(copied), str(cm.exception))
+
     def test_reraise_builtin_nomessage(self):
         thrown = TypeError()
 
@@ -130,3 +165,158 @@ class ValidateListTestCase(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             validate_list(min_length=10, max_length=9)
+
+    def test_interned_nested_argument_types(self):  # type: () -> None
+        a = validate_list(validator=validate_int(min_value=True))
+        b = validate_list(validator=validate_int(min_value=1))
+        self.assertIsNot(a, b)
+        self.assertEqual(
+            repr(a), 'validate_list(validator=validate_int(min_value=True))',
+        )
+        self.assertIs(
+            validate_list(validator=validate_int(min_value=1)), b,
+        )
+
+    def test_inline_nested_argument_types(self):  # type: () -> None
+        for min_value in (True, 1):
+            with self.assertRaises(ValueError) as cm:
+                validate_list([0], validator=validate_int(min_value=min_value))
+            self.assertIn(repr(min_value), str(cm.exception))
+
+    def test_equality(self):  # type: () -> None
+        self.assertEqual(
+            validate_list(validator=validate_int(min_value=0)),
+            validate_list(validator=validate_int(min_value=0)),
+        )
+        self.assertNotEqual(
+            validate_list(validator=validate_int(min_value=0)),
+            validate_list(validator=validate_int(min_value=1)),
+        )
+        self.assertNotEqual(
+            validate_list(validator=validate_int()),
+            validate_list(validator=lambda value: None),
+        )
+
+    def test_compile_deferred_for_short_lists(self):
+        compiled = []
+        compile_many = validation.compiler.compile_many
+
+        def record_compile_many(validator):
+            compiled.append(validator)
+            return compile_many(validator)
+
+        validation.compiler.compile_many = record_compile_many
+        try:
+            # Checking a short list with a new child validator is cheaper in
+            # a loop than compiling the child's `validate_many`.
+            child = validate_int(min_value=-1001)
+            validate_list([1, 2, 3], validator=child)
+            self.assertEqual(compiled, [])
+
+            # Compiling pays off once the child is reused.
+            validate_list([1, 2, 3], validator=child)
+            self.assertEqual(compiled, [child])
+
+            # Or for long lists.
+            child = validate_int(min_value=-1002)
+            validate_list(list(range(1000)), validator=child)
+            self.assertEqual(compiled[1:], [child])
+        finally:
+            validation.compiler.compile_many = compile_many
+
+    def test_short_list_invalid(self):  # type: () -> None
+        with self.assertRaises(ValueError) as cm:
+            validate_list([1003, 1004, 2], validator=validate_int(
+                min_value=1003,
+            ))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 2: "
+            "expected value less than 1003, but got 2",
+        )
+        self.assertEqual(cm.exception.path, [2])  # type: ignore
+
+    def test_typed_array_not_allowed(self):
+        with self.assertRaises(TypeError):
+            validate_list(array.array('i', [1, 2]))
+
+    def test_allow_arrays(self):
+        validator = validate_list(
+            validator=validate_int(min_value=0), allow_arrays=True,
+        )
+        validator(array.array('B', [1, 2]))
+        validator([1, 2])
+
+        with self.assertRaises(ValueError) as cm:
+            validator(array.array('i', [1, -2]))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 1: "
+            "expected value less than 0, but got -2",
+        )
+
+        with self.assertRaises(TypeError):
+            validator((1, 2))
+
+    def test_max_errors(self):
+        with self.assertRaises(TypeError) as cm:
+            validate_list(
+                [1, 'a', -1, 3],
+                validator=validate_int(min_value=0), max_errors=5,
+            )
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 1: "
+            "expected 'int', but value is of type 'str' (and 1 more error)",
+        )
+        self.assertEqual(cm.exception.path, [1])
+        first, second = cm.exception.errors
+        self.assertIsInstance(first, TypeError)
+        self.assertEqual(first.path, [1])
+        self.assertIsInstance(second, ValueError)
+        self.assertEqual(second.path, [2])
+
+    def test_max_errors_stops_at_limit(self):
+        with self.assertRaises(ValueError) as cm:
+            validate_list(
+                [-1, -2, -3, -4],
+                validator=validate_int(min_value=0), max_errors=2,
+            )
+        self.assertEqual(
+            [error.path for error in cm.exception.errors], [[0], [1]],
+        )
+
+    def test_max_errors_nested(self):
+        validator = validate_list(
+            validator=validate_list(validator=validate_int(), max_errors=5),
+            max_errors=5,
+        )
+        with self.assertRaises(TypeError) as cm:
+            validator([[1, 'x', 'y'], ['z']])
+        self.assertEqual(
+            [error.path for error in cm.exception.errors],
+            [[0, 1], [0, 2], [1, 0]],
+        )
+
+    def test_max_errors_single_error(self):
+        with self.assertRaises(TypeError) as cm:
+            validate_list([1, 'a'], validator=validate_int(), max_errors=5)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 1: "
+            "expected 'int', but value is of type 'str'",
+        )
+
+    def test_max_errors_is_valid(self):  # type: () -> None
+        validator = validate_list(validator=validate_int(), max_errors=5)
+        self.assertTrue(validator.is_valid([1, 2]))
+        self.assertFalse(validator.is_valid([1, 'a', 'b']))
+
+    def test_max_errors_invalid(self):
+        with self.assertRaises(ValueError):
+            validate_list(max_errors=0)
+
+    def test_max_errors_repr(self):  # type: () -> None
+        self.assertEqual(
+            repr(validate_list(max_errors=5)), 'validate_list(max_errors=5)',
+        )
@@ -198,3 +198,23 @@ class ValidateMappingTestCase(unittest.TestCase):
         caught = cm.exception
 
         self.assertIs(caught, thrown)
+
+    def test_max_errors(self):
+        with self.assertRaises(TypeError) as cm:
+            validate_mapping(
+                {1: 1, 2: 'x', 3.5: 4},
+                key_validator=validate_int(),
+                value_validator=validate_int(),
+                max_errors=5,
+            )
+        # Dictionaries are only ordered on python 3.7 and later.
+        errors = sorted(cm.exception.errors, key=lambda error: error.path)
+        self.assertEqual(
+            [str(error) for error in errors],
+            [
+                "invalid value for key 2: expected 'int', "
+                "but value is of type 'str'",
+                "invalid key 3.5: expected 'int', "
+                "but value is of type 'float'",
+            ],
+        )
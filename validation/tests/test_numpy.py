@@ -0,0 +1,365 @@
+import array
+import struct
+import unittest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None  # type: ignore
+
+import validation.numpy
+from validation import (
+    validate_int, validate_float, validate_bool, validate_list,
+    validate_records,
+)
+from validation.tests.test_import import _run_python
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ValidateManyIntArrayTestCase(unittest.TestCase):
+    def test_valid(self):  # type: () -> None
+        validator = validate_int(min_value=0, max_value=255)
+        validator.validate_many(numpy.arange(256, dtype=numpy.uint8))
+        validator.validate_many(numpy.arange(256, dtype=numpy.int64))
+
+    def test_bool_dtype(self):  # type: () -> None
+        validate_int().validate_many(numpy.array([True, False]))
+
+    def test_empty(self):  # type: () -> None
+        validate_int(min_value=0).validate_many(
+            numpy.array([], dtype=numpy.int64),
+        )
+
+    def test_invalid_min_value(self):  # type: () -> None
+        values = numpy.arange(1000)
+        values[700] = -5
+        with self.assertRaises(ValueError) as cm:
+            validate_int(min_value=0).validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 700: "
+            "expected value less than 0, but got -5",
+        )
+
+    def test_invalid_max_value(self):  # type: () -> None
+        values = numpy.arange(1000)
+        with self.assertRaises(ValueError) as cm:
+            validate_int(max_value=255).validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 256: "
+            "expected value greater than 255, but got 256",
+        )
+
+    def test_bounds_outside_dtype(self):  # type: () -> None
+        values = numpy.arange(10, dtype=numpy.int8)
+        validate_int(min_value=-2**70, max_value=2**70).validate_many(values)
+        with self.assertRaises(ValueError):
+            validate_int(min_value=1000).validate_many(values)
+
+    def test_invalid_float_dtype(self):  # type: () -> None
+        with self.assertRaises(TypeError) as cm:
+            validate_int().validate_many(numpy.zeros(10))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 0: "
+            "expected 'int', but value is of type 'float'",
+        )
+
+    def test_object_dtype(self):  # type: () -> None
+        validator = validate_int(min_value=0)
+        validator.validate_many(numpy.array([1, 2**70], dtype=object))
+        with self.assertRaises(TypeError):
+            validator.validate_many(numpy.array([1, u"2"], dtype=object))
+
+    def test_two_dimensional(self):  # type: () -> None
+        with self.assertRaises(TypeError) as cm:
+            validate_int().validate_many(numpy.zeros((2, 2), dtype=int))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 0: "
+            "expected 'int', but value is of type 'list'",
+        )
+
+    def test_long_list(self):  # type: () -> None
+        values = list(range(1000))
+        validator = validate_int(min_value=0, max_value=999)
+        validator.validate_many(values)
+
+        values[500] = True
+        validator.validate_many(values)
+
+        values[600] = 1000
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 600: "
+            "expected value greater than 999, but got 1000",
+        )
+
+    def test_long_list_mixed_types(self):
+        values = [1] * 1000
+        values[800] = 1.0
+        with self.assertRaises(TypeError) as cm:
+            validate_int().validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 800: "
+            "expected 'int', but value is of type 'float'",
+        )
+
+    def test_long_list_numpy_scalars(self):
+        values = [1] * 1000
+        values[900] = numpy.int64(1)
+        with self.assertRaises(TypeError):
+            validate_int().validate_many(values)
+
+    def test_long_list_big_ints(self):  # type: () -> None
+        values = [1] * 1000
+        values[100] = 2**70
+        validate_int().validate_many(values)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ValidateManyDtypeRangeTestCase(unittest.TestCase):
+    def test_int_range_guaranteed(self):  # type: () -> None
+        # Far too big to check element by element.
+        values = numpy.broadcast_to(numpy.uint8(0), (10 ** 12,))
+        validate_int(min_value=0, max_value=255).validate_many(values)
+        validate_int(min_value=-1).validate_many(values)
+        validate_int().validate_many(values)
+
+    def test_int_range_not_guaranteed(self):  # type: () -> None
+        values = numpy.array([0, 255, 256], dtype=numpy.int16)
+        with self.assertRaises(ValueError) as cm:
+            validate_int(min_value=0, max_value=255).validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 2: "
+            "expected value greater than 255, but got 256",
+        )
+
+    def test_float_range_guaranteed(self):  # type: () -> None
+        values = numpy.broadcast_to(numpy.float32(numpy.nan), (10 ** 12,))
+        validate_float(allow_nan=True, allow_infinite=True).validate_many(
+            values,
+        )
+
+    def test_bool_range_guaranteed(self):  # type: () -> None
+        values = numpy.broadcast_to(numpy.bool_(True), (10 ** 12,))
+        validate_bool().validate_many(values)
+
+    def test_typed_array(self):  # type: () -> None
+        validate_int(min_value=-128, max_value=127).validate_many(
+            array.array('b', [1, 2, 3]),
+        )
+        validate_float().validate_many(array.array('d', [0.5, 1.5]))
+
+    def test_typed_array_invalid(self):
+        values = array.array('h', [1, 2, -3])
+        with self.assertRaises(ValueError) as cm:
+            validate_int(min_value=0).validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 2: "
+            "expected value less than 0, but got -3",
+        )
+
+        values = array.array('d', [0.5, float('nan')])
+        with self.assertRaises(ValueError):
+            validate_float().validate_many(values)
+
+        with self.assertRaises(TypeError):
+            validate_float().validate_many(array.array('i', [1]))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ValidateManyFloatArrayTestCase(unittest.TestCase):
+    def test_valid(self):  # type: () -> None
+        validator = validate_float(min_value=0.0, max_value=1.0)
+        validator.validate_many(numpy.linspace(0.0, 1.0, 1000))
+        validator.validate_many(
+            numpy.linspace(0.0, 1.0, 1000, dtype=numpy.float32),
+        )
+
+    def test_invalid_nan(self):  # type: () -> None
+        values = numpy.zeros(1000)
+        values[3] = numpy.nan
+        validate_float(allow_nan=True).validate_many(values)
+        with self.assertRaises(ValueError) as cm:
+            validate_float().validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 3: expected valid float, but got nan",
+        )
+
+    def test_invalid_infinite(self):  # type: () -> None
+        values = numpy.zeros(1000)
+        values[4] = -numpy.inf
+        validate_float(allow_infinite=True).validate_many(values)
+        with self.assertRaises(ValueError) as cm:
+            validate_float().validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 4: expected finite value, but got -inf",
+        )
+
+    def test_nan_ignores_bounds(self):  # type: () -> None
+        values = numpy.array([numpy.nan, 0.5])
+        validate_float(
+            min_value=0.0, max_value=1.0, allow_nan=True,
+        ).validate_many(values)
+
+    def test_narrow_dtype_not_rounded(self):  # type: () -> None
+        # `0.1` can't be represented exactly as a 16 bit float.  The widened
+        # value should be compared against the bound, not the other way
+        # around.
+        values = numpy.array([0.1], dtype=numpy.float16)
+        with self.assertRaises(ValueError):
+            validate_float(min_value=0.1).validate_many(values)
+
+    def test_invalid_int_dtype(self):  # type: () -> None
+        with self.assertRaises(TypeError):
+            validate_float().validate_many(numpy.arange(10))
+
+    def test_long_list(self):  # type: () -> None
+        values = [0.5] * 1000
+        validator = validate_float(min_value=0.0, max_value=1.0)
+        validator.validate_many(values)
+
+        values[999] = 1.5
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(values)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 999: "
+            "expected value greater than 1.0, but got 1.5",
+        )
+
+    def test_long_list_ints(self):
+        values = [0.5] * 1000
+        values[10] = 1
+        with self.assertRaises(TypeError):
+            validate_float().validate_many(values)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ValidateManyBoolArrayTestCase(unittest.TestCase):
+    def test_valid(self):  # type: () -> None
+        validate_bool().validate_many(numpy.zeros(1000, dtype=bool))
+
+    def test_invalid_int_dtype(self):  # type: () -> None
+        with self.assertRaises(TypeError):
+            validate_bool().validate_many(numpy.zeros(1000, dtype=int))
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class ValidateListTestCase(unittest.TestCase):
+    def test_array_not_allowed(self):
+        with self.assertRaises(TypeError):
+            validate_list(numpy.arange(10))
+
+    def test_allow_arrays(self):
+        validator = validate_list(
+            validator=validate_int(min_value=0, max_value=255),
+            allow_arrays=True,
+        )
+        validator(numpy.arange(10, dtype=numpy.uint8))
+        validator(numpy.broadcast_to(numpy.uint8(0), (10 ** 12,)))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(numpy.arange(-1, 10))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 0: "
+            "expected value less than 0, but got -1",
+        )
+
+    def test_allow_arrays_two_dimensional(self):
+        with self.assertRaises(TypeError):
+            validate_list(numpy.zeros((2, 2)), allow_arrays=True)
+
+    def test_allow_arrays_custom_validator(self):
+        def validator(value):
+            if type(value) is not int:
+                raise TypeError("expected python int")
+
+        validate_list(
+            numpy.arange(10), validator=validator, allow_arrays=True,
+        )
+
+    def test_long_list(self):  # type: () -> None
+        validator = validate_list(validator=validate_int(min_value=0))
+        validator(list(range(1000)))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(list(range(-1, 999)))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 0: "
+            "expected value less than 0, but got -1",
+        )
+
+
+class WithoutNumpyTestCase(unittest.TestCase):
+    """
+    Checks the fallbacks used when NumPy is not installed, by hiding the
+    module from `validation.numpy`.
+    """
+    def setUp(self):
+        self.numpy = validation.numpy.numpy
+        validation.numpy.numpy = None
+
+    def tearDown(self):
+        validation.numpy.numpy = self.numpy
+
+    def test_typed_array_guaranteed(self):  # type: () -> None
+        validate_int(min_value=-128, max_value=127).validate_many(
+            array.array('b', [-128, 0, 127]),
+        )
+
+    def test_typed_array(self):  # type: () -> None
+        validator = validate_int(min_value=0)
+        validator.validate_many(array.array('i', [0, 1, 2]))
+
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(array.array('i', [0, 1, -2]))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 2: "
+            "expected value less than 0, but got -2",
+        )
+
+    def test_long_list(self):  # type: () -> None
+        validator = validate_float(max_value=1.0)
+        validator.validate_many([0.5] * 1000)
+
+        values = [0.5] * 1000
+        values[600] = 2.0
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(values)
+        self.assertEqual(cm.exception.path, [600])  # type: ignore
+
+    def test_records(self):  # type: () -> None
+        validator = validate_records(format='<Hf', schema=(
+            validate_int(min_value=1), validate_float(max_value=1.0),
+        ))
+        validator(struct.pack('<HfHf', 1, 0.5, 2, 1.0))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(struct.pack('<HfHf', 1, 0.5, 2, 1.5))
+        self.assertEqual(cm.exception.path, [1, 1])  # type: ignore
+
+    def test_not_installed(self):
+        # Blocks the import of NumPy in a fresh interpreter, to check that the
+        # module can still be loaded.
+        stdout, _ = _run_python('-c', (
+            "import sys\n"
+            "sys.modules['numpy'] = None\n"
+            "import validation.numpy\n"
+            "from validation import validate_int\n"
+            "validate_int(min_value=0).validate_many([1] * 1000)\n"
+            "print(validation.numpy.numpy)\n"
+        ))
+        self.assertEqual(stdout.strip(), "None")
@@ -0,0 +1,201 @@
+import unittest
+import mmap
+import struct
+import sys
+import tempfile
+
+import validation.string as string_module
+from validation import (
+    validate_records, validate_int, validate_float, validate_bool,
+    validate_bytes, is_valid,
+)
+
+
+def _pack(record_format, records):
+    return b"".join(struct.pack(record_format, *record) for record in records)
+
+
+class ValidateRecordsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.validator = validate_records(format='<Hbf', schema=(
+            validate_int(min_value=1),
+            validate_int(min_value=-10, max_value=10),
+            validate_float(min_value=-40.0, max_value=125.0),
+        ))
+
+    def test_valid(self):  # type: () -> None
+        self.validator(_pack('<Hbf', [(1, 0, 0.5), (65535, -10, 125.0)]))
+
+    def test_empty(self):  # type: () -> None
+        self.validator(b"")
+
+    @unittest.skipIf(sys.version_info < (3,), "buffers need python 3")
+    def test_buffers(self):
+        value = _pack('<Hbf', [(1, 0, 0.5)] * 100)
+        self.validator(bytearray(value))
+        self.validator(memoryview(value)[7:])
+
+        with tempfile.TemporaryFile() as f:
+            f.write(value)
+            f.flush()
+            buffer = mmap.mmap(f.fileno(), 0)
+            self.validator(buffer)
+            buffer.close()
+
+    @unittest.skipIf(sys.version_info < (3,), "views can't be strided")
+    def test_strided_buffer(self):
+        # Every other byte of a buffer holding each byte twice.
+        value = _pack('<Hbf', [(1, 0, 0.5), (2, 11, 0.5)])
+        doubled = memoryview(bytearray(
+            byte for byte in bytearray(value) for _ in range(2)
+        ))
+        self.validator(doubled[:14][::2])
+
+        with self.assertRaises(ValueError) as cm:
+            self.validator(doubled[::2])
+        self.assertEqual(cm.exception.path, [1, 1])
+        self.assertFalse(self.validator.is_valid(doubled[::2]))
+
+    def test_unpack_without_iter_unpack(self):
+        # Python 2 has no `Struct.iter_unpack`.
+        class Struct(struct.Struct):
+            iter_unpack = None
+
+        # pylint: disable=protected-access
+        records = string_module._iter_unpack(
+            Struct('<Hb'), _pack('<Hb', [(1, 2), (3, 4)]),
+        )
+        self.assertEqual(list(records), [(1, 2), (3, 4)])
+
+    def test_invalid_field(self):  # type: () -> None
+        value = _pack('<Hbf', [(1, 0, 0.5), (2, 0, 0.5), (3, 11, 0.5)])
+        with self.assertRaises(ValueError) as cm:
+            self.validator(value)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid record at position 2: invalid value at index 1: "
+            "expected value greater than 10, but got 11",
+        )
+        self.assertEqual(cm.exception.path, [2, 1])  # type: ignore
+
+    def test_first_invalid_record_reported(self):  # type: () -> None
+        # The first field of the last record is checked in bulk before the
+        # last field of the first, but the first record should be reported.
+        value = _pack('<Hbf', [(1, 0, 200.0), (2, 0, 0.5), (0, 0, 0.5)])
+        with self.assertRaises(ValueError) as cm:
+            self.validator(value)
+        self.assertEqual(cm.exception.path, [0, 2])  # type: ignore
+
+    def test_partial_record(self):  # type: () -> None
+        with self.assertRaises(ValueError) as cm:
+            self.validator(_pack('<Hbf', [(1, 0, 0.5)]) + b"\0")
+        self.assertEqual(
+            str(cm.exception),
+            "expected a multiple of 7 bytes, but buffer contains 8",
+        )
+
+    def test_not_buffer(self):
+        with self.assertRaises(TypeError):
+            self.validator(u"hello")
+
+        with self.assertRaises(TypeError):
+            self.validator([1, 0, 0.5])
+
+    def test_byte_order_and_alignment(self):  # type: () -> None
+        validator = validate_records(format='>bxq?', schema=(
+            validate_int(max_value=0),
+            validate_int(min_value=2 ** 40),
+            validate_bool(),
+        ))
+        validator(_pack('>bxq?', [(-1, 2 ** 40, True), (0, 2 ** 62, False)]))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(_pack('>bxq?', [(0, 2 ** 40 - 1, True)]))
+        self.assertEqual(cm.exception.path, [0, 1])  # type: ignore
+
+        validator = validate_records(format='@bq', schema=(
+            validate_int(), validate_int(min_value=0),
+        ))
+        validator(_pack('@bq', [(1, 2), (3, 4)]))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(_pack('@bq', [(1, 2), (3, -4)]))
+        self.assertEqual(cm.exception.path, [1, 1])  # type: ignore
+
+    def test_non_numeric_fields(self):  # type: () -> None
+        validator = validate_records(format='<4sI', schema=(
+            validate_bytes(min_length=4), validate_int(max_value=10),
+        ))
+        validator(_pack('<4sI', [(b"ab", 1), (b"abcd", 10)]))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(_pack('<4sI', [(b"ab", 1), (b"abcd", 11)]))
+        self.assertEqual(cm.exception.path, [1, 1])  # type: ignore
+
+    def test_custom_validator(self):  # type: () -> None
+        def validate_even(value):
+            if value % 2:
+                raise ValueError("expected even number")
+
+        validator = validate_records(format='<ii', schema=(
+            validate_int(), validate_even,
+        ))
+        validator(_pack('<ii', [(1, 2), (3, 4)]))
+
+        with self.assertRaises(ValueError) as cm:
+            validator(_pack('<ii', [(1, 2), (3, 5)]))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid record at position 1: invalid value at index 1: "
+            "expected even number",
+        )
+
+    def test_no_schema(self):  # type: () -> None
+        validator = validate_records(format='<Hbf')
+        validator(b"\0" * 14)
+
+        with self.assertRaises(ValueError):
+            validator(b"\0" * 15)
+
+    def test_is_valid(self):  # type: () -> None
+        self.assertTrue(self.validator.is_valid(
+            _pack('<Hbf', [(1, 0, 0.5)]),
+        ))
+        self.assertFalse(self.validator.is_valid(
+            _pack('<Hbf', [(1, 0, 0.5), (0, 0, 0.5)]),
+        ))
+        self.assertFalse(is_valid(self.validator, None))
+
+    def test_not_required(self):  # type: () -> None
+        validate_records(None, format='<H', required=False)
+
+    def test_required(self):
+        with self.assertRaises(TypeError):
+            validate_records(None, format='<H')
+
+    def test_invalid_format(self):
+        with self.assertRaises(TypeError):
+            validate_records(format=None)
+
+        with self.assertRaises(ValueError):
+            validate_records(format='<Hy')
+
+        with self.assertRaises(ValueError):
+            validate_records(format='<')
+
+    def test_schema_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            validate_records(format='<2Hx', schema=(validate_int(),))
+
+        with self.assertRaises(TypeError):
+            validate_records(format='<H', schema=[validate_int()])
+
+    def test_repr(self):  # type: () -> None
+        validator = validate_records(
+            format='<H', schema=(validate_int(),), required=False,
+        )
+        self.assertEqual(
+            repr(validator),
+            "validate_records(format='<H', schema=(validate_int(),), "
+            "required=False)",
+        )
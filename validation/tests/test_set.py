@@ -79,3 +79,9 @@ class ValidateSetTestCase(unittest.TestCase):
 
         with self.assertRaises(ValueError):
             validate_set(min_length=10, max_length=9)
+
+    def test_max_errors(self):
+        with self.assertRaises(TypeError) as cm:
+            validate_set({1, 'a', 'b'}, validator=validate_int(), max_errors=5)
+        self.assertEqual(len(cm.exception.errors), 2)
+        self.assertTrue(str(cm.exception).endswith("(and 1 more error)"))
@@ -1,6 +1,9 @@
+import pickle
 import unittest
 
-from validation import validate_int, validate_text, validate_structure
+from validation import (
+    validate_int, validate_text, validate_list, validate_structure, compile,
+)
 
 
 class ValidateStructureTestCase(unittest.TestCase):
@@ -164,3 +167,175 @@ class ValidateStructureTestCase(unittest.TestCase):
         caught = cm.exception
 
         self.assertIs(caught, thrown)
+
+    def test_equality(self):  # type: () -> None
+        validator = validate_structure(schema={
+            'hello': validate_text(),
+            'count': validate_int(min_value=0),
+        })
+
+        self.assertEqual(validator, validate_structure(schema={
+            'hello': validate_text(),
+            'count': validate_int(min_value=0),
+        }))
+        self.assertNotEqual(validator, validate_structure(schema={
+            'hello': validate_text(),
+            'count': validate_int(min_value=1),
+        }))
+        self.assertNotEqual(validator, validate_structure(schema={
+            'hello': validate_text(),
+        }))
+        self.assertNotEqual(validator, validate_structure(schema={
+            'hello': validate_text(),
+            'count': validate_int(min_value=0),
+        }, required=False))
+
+    def test_interned(self):  # type: () -> None
+        self.assertIs(
+            validate_structure(schema={'count': validate_int(min_value=0)}),
+            validate_structure(schema={'count': validate_int(min_value=0)}),
+        )
+
+    def test_interned_schema_key_types(self):
+        validators = [
+            validate_structure(schema={1: validate_int()}),
+            validate_structure(schema={1.0: validate_int()}),
+            validate_structure(schema={True: validate_int()}),
+        ]
+        self.assertEqual(len(set(map(id, validators))), 3)
+        self.assertEqual(
+            [repr(validator) for validator in validators],
+            [
+                'validate_structure(schema={1: validate_int()})',
+                'validate_structure(schema={1.0: validate_int()})',
+                'validate_structure(schema={True: validate_int()})',
+            ],
+        )
+
+    def test_interned_nested_argument_types(self):  # type: () -> None
+        a = validate_structure(schema={'a': validate_int(min_value=True)})
+        b = validate_structure(schema={'a': validate_int(min_value=1)})
+        self.assertIsNot(a, b)
+        self.assertEqual(
+            repr(a),
+            "validate_structure(schema={'a': validate_int(min_value=True)})",
+        )
+
+    def test_unhashable_schema_value(self):  # type: () -> None
+        class Unhashable(object):
+            __hash__ = None  # type: ignore
+
+            def __call__(self, value):
+                pass
+
+        validator = validate_structure(schema={'key': Unhashable()})
+        validator({'key': 1})
+
+        with self.assertRaises(TypeError):
+            hash(validator)
+
+    def test_no_instance_dict(self):  # type: () -> None
+        validator = validate_structure(schema={'key': validate_int()})
+        self.assertFalse(hasattr(validator, '__dict__'))
+
+    def test_validate_many(self):
+        validator = validate_structure(schema={'key': validate_int()})
+        validator.validate_many([{'key': 1}, {'key': 2}])
+
+        with self.assertRaises(TypeError) as cm:
+            validator.validate_many([{'key': 1}, {'key': "2"}])
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 1: invalid value for key 'key': "
+            "expected 'int', but value is of type 'str'",
+        )
+
+    def test_pickle_compiled(self):  # type: () -> None
+        validator = validate_structure(
+            schema={'key': validate_list(validator=validate_int())},
+            allow_extra=True,
+        )
+        validator.validate_many([{'key': [1]}])
+        self.assertTrue(validator.is_valid({'key': [1]}))
+
+        copied = pickle.loads(pickle.dumps(validator))
+        self.assertEqual(copied, validator)
+        self.assertFalse(copied.is_valid({'key': [u"1"]}))
+        with self.assertRaises(TypeError):
+            copied.validate_many([{'key': [u"1"]}])
+
+    def test_nested_error_path(self):
+        validator = validate_structure(schema={
+            'items': validate_list(validator=validate_structure(schema={
+                'id': validate_int(min_value=0),
+            })),
+        })
+
+        with self.assertRaises(KeyError) as cm:
+            validator({'items': [{'id': 1}, {}]})
+        self.assertEqual(cm.exception.path, ['items', 1])
+        self.assertEqual(
+            str(cm.exception),
+            "\"invalid value for key 'items': invalid item at position 1: "
+            "dictionary missing expected key: 'id'\"",
+        )
+
+    def test_max_errors(self):
+        validator = validate_structure(
+            schema={'a': validate_int(), 'b': validate_int()},
+            max_errors=5,
+        )
+        with self.assertRaises(TypeError) as cm:
+            validator({'a': 'x', 'c': 1})
+        self.assertEqual(
+            str(cm.exception),
+            "invalid value for key 'a': "
+            "expected 'int', but value is of type 'str' (and 2 more errors)",
+        )
+        invalid, missing, unexpected = cm.exception.errors
+        self.assertIsInstance(invalid, TypeError)
+        self.assertIsInstance(missing, KeyError)
+        self.assertIsInstance(unexpected, ValueError)
+
+    def test_max_errors_compiled(self):
+        validator = compile(validate_structure(schema={
+            'x': validate_list(validator=validate_int(), max_errors=5),
+        }))
+        with self.assertRaises(TypeError) as cm:
+            validator({'x': ['a', 'b']})
+        self.assertEqual(
+            [error.path for error in cm.exception.errors],
+            [['x', 0], ['x', 1]],
+        )
+
+    def test_max_errors_nested_context(self):
+        validator = validate_list(validator=validate_structure(schema={
+            'x': validate_list(validator=validate_int(), max_errors=5),
+        }))
+        with self.assertRaises(TypeError) as cm:
+            validator([{'x': [1]}, {'x': ['a', 2, 'b']}])
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 1: invalid value for key 'x': "
+            "invalid item at position 0: "
+            "expected 'int', but value is of type 'str' (and 1 more error)",
+        )
+        self.assertEqual(cm.exception.path, [1, 'x', 0])
+        self.assertEqual(
+            [str(error) for error in cm.exception.errors],
+            [
+                "invalid item at position 1: invalid value for key 'x': "
+                "invalid item at position 0: "
+                "expected 'int', but value is of type 'str'",
+                "invalid item at position 1: invalid value for key 'x': "
+                "invalid item at position 2: "
+                "expected 'int', but value is of type 'str'",
+            ],
+        )
+        self.assertEqual(
+            [error.path for error in cm.exception.errors],
+            [[1, 'x', 0], [1, 'x', 2]],
+        )
+
+        cm.exception.args = ("replaced",)
+        self.assertEqual(str(cm.exception), "replaced")
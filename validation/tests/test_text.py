@@ -1,7 +1,12 @@
 import unittest
 import re
+import string
+import sys
+import warnings
 
 from validation import validate_text
+from validation.string import UnsafePatternWarning
+from validation.string import _prepare_pattern_cache  # type: ignore
 
 
 class ValidateTextTestCase(unittest.TestCase):
@@ -42,6 +47,233 @@ class ValidateTextTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_text(u"begin end", pattern=re.compile(r"begin"))
 
+    def test_pattern_must_match_whole_string(self):  # type: () -> None
+        # The first alternative matches a prefix, but only the second matches
+        # the whole string.
+        validate_text(u"ab", pattern=r"a|ab")
+        validate_text(u"ab", pattern=re.compile(r"a|ab"))
+
+    def test_pattern_required_literal(self):  # type: () -> None
+        validator = validate_text(pattern=r"SKU-[0-9]{4}(?:-[A-Z]{2})?")
+        validator(u"SKU-1234")
+        validator(u"SKU-1234-AB")
+
+        for value in [u"XKU-1234", u"SKU-123", u"1234-SKU-"]:
+            with self.assertRaises(ValueError):
+                validator(value)
+
+    def test_pattern_ignore_case(self):  # type: () -> None
+        validate_text(u"SKU-1", pattern=r"(?i)sku-[0-9]")
+        validate_text(u"SKU-1", pattern=re.compile(r"sku-[0-9]", re.I))
+        if sys.version_info >= (3, 6):
+            # Scoped flags are not supported by older versions of `re`.
+            validate_text(u"SKU-1", pattern=r"(?i:sku)-[0-9]")
+
+        with self.assertRaises(ValueError):
+            validate_text(u"SKU-1", pattern=r"sku-[0-9]")
+
+    def test_pattern_shared(self):  # type: () -> None
+        pattern = u"[a-z]+-[0-9]+"
+        self.assertIs(
+            _prepare_pattern_cache(pattern),
+            _prepare_pattern_cache(pattern),
+        )
+
+    def test_ascii_only(self):  # type: () -> None
+        validate_text(u"hello world\n", ascii_only=True)
+
+        with self.assertRaises(ValueError) as cm:
+            validate_text(u"caf\xe9 au lait", ascii_only=True)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid character {char!r} at position 3".format(
+                char=u"\xe9",
+            ),
+        )
+
+    def test_alphabet(self):  # type: () -> None
+        validate_text(u"", alphabet=string.hexdigits)
+        validate_text(u"deadBEEF01", alphabet=string.hexdigits)
+
+        with self.assertRaises(ValueError) as cm:
+            validate_text(u"deadbeefg1", alphabet=string.hexdigits)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid character {char!r} at position 8".format(
+                char=u"g",
+            ),
+        )
+
+        with self.assertRaises(ValueError):
+            validate_text(u"dead\xe9", alphabet=string.hexdigits)
+
+    def test_alphabet_non_ascii(self):  # type: () -> None
+        alphabet = u"abc\xe9\u2603"
+        validate_text(u"a\xe9\u2603c", alphabet=alphabet)
+
+        with self.assertRaises(ValueError) as cm:
+            validate_text(u"a\xe9\u2603d", alphabet=alphabet)
+        self.assertEqual(
+            str(cm.exception),
+            "invalid character {char!r} at position 3".format(
+                char=u"d",
+            ),
+        )
+
+    def test_alphabet_and_ascii_only(self):  # type: () -> None
+        validator = validate_text(ascii_only=True, alphabet=u"ab\xe9")
+        validator(u"abba")
+        with self.assertRaises(ValueError):
+            validator(u"ab\xe9")
+
+    def test_alphabet_checked_before_pattern(self):  # type: () -> None
+        validator = validate_text(alphabet=u"ab", pattern=u"a+")
+        with self.assertRaises(ValueError) as cm:
+            validator(u"abc")
+        self.assertIn("invalid character", str(cm.exception))
+
+    def test_invalid_alphabet(self):
+        if sys.version_info >= (3,):
+            # Native strings are accepted as alphabets on python 2, so that
+            # constants from the `string` module can be used.
+            with self.assertRaises(TypeError):
+                validate_text(alphabet=b"abc")  # type: ignore
+
+        with self.assertRaises(TypeError):
+            validate_text(alphabet=bytearray(b"abc"))  # type: ignore
+
+        with self.assertRaises(TypeError):
+            validate_text(alphabet=["a", "b"])  # type: ignore
+
+    def test_normalization(self):  # type: () -> None
+        composed = u"caf\xe9"
+        decomposed = u"cafe\u0301"
+
+        validate_text(composed, normalization='NFC')
+        validate_text(decomposed, normalization='NFD')
+
+        with self.assertRaises(ValueError) as cm:
+            validate_text(decomposed, normalization='NFC')
+        self.assertEqual(
+            str(cm.exception), "expected string in normalization form NFC",
+        )
+
+        with self.assertRaises(ValueError):
+            validate_text(composed, normalization='NFD')
+
+    def test_normalization_compatibility(self):  # type: () -> None
+        validate_text(u"\ufb01", normalization='NFC')
+
+        with self.assertRaises(ValueError):
+            validate_text(u"\ufb01", normalization='NFKC')
+
+    def test_normalization_many(self):  # type: () -> None
+        validator = validate_text(normalization='NFC')
+        validator.validate_many([u"caf\xe9", u"tea", u""])
+
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many([u"caf\xe9", u"cafe\u0301"])
+        self.assertIn("position 1", str(cm.exception))
+
+    def test_invalid_normalization(self):
+        with self.assertRaises(ValueError):
+            validate_text(normalization='nfc')
+
+    def test_unsafe_pattern_warns(self):  # type: () -> None
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            validate_text(pattern=r"(a+)+", unsafe_pattern='warn')
+
+        self.assertEqual(len(caught), 1)
+        self.assertTrue(issubclass(caught[0].category, UnsafePatternWarning))
+        self.assertEqual(caught[0].filename, __file__.replace('.pyc', '.py'))
+
+    def test_unsafe_pattern_warns_inline(self):
+        # Inline calls construct the validator through the validator cache,
+        # which adds frames between the caller and the constructor.  Calls
+        # that reuse a cached validator should warn as well.
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            for _ in range(2):
+                validate_text(
+                    u"bbb", pattern=r"(b+)+", unsafe_pattern='warn',
+                )
+
+        self.assertEqual(len(caught), 2)
+        for warning in caught:
+            self.assertTrue(issubclass(warning.category, UnsafePatternWarning))
+            self.assertEqual(warning.filename, __file__.replace('.pyc', '.py'))
+
+    def test_unsafe_pattern_error(self):
+        with self.assertRaises(ValueError):
+            validate_text(pattern=r"(a+)+", unsafe_pattern='error')
+
+        with self.assertRaises(ValueError):
+            validate_text(
+                u"aaa", pattern=re.compile(r"(\w+\s?)*"),
+                unsafe_pattern='error',
+            )
+
+    def test_unsafe_pattern_ignored_by_default(self):  # type: () -> None
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            validator = validate_text(pattern=r"(a+)+")
+        self.assertEqual(caught, [])
+        validator(u"aaaa")
+
+    def test_unsafe_pattern_invalid(self):
+        with self.assertRaises(ValueError):
+            validate_text(pattern=r"a", unsafe_pattern='raise')
+
+    def test_unsafe_patterns_detected(self):  # type: () -> None
+        for pattern in [
+            r"(a+)+",
+            r"(a*)*b",
+            r"(aa?)+",
+            r"(a|aa)+",
+            r"(a|ab)*c",
+            r"(a|a)*",
+            r"([a-z]+a)+",
+            r"(\d+\.?)+",
+            r"(\w+\s?)*",
+            r"(?i)([a-z]+A)+",
+            r"x(?=(a+)+)",
+            r"^([a-zA-Z0-9])(([\-.]|[_]+)?([a-zA-Z0-9]+))*@example\.com$",
+        ]:
+            with self.assertRaises(ValueError, msg=pattern):
+                validate_text(pattern=pattern, unsafe_pattern='error')
+
+    def test_safe_patterns_accepted(self):  # type: () -> None
+        for pattern in [
+            r"SKU-[0-9]{8}-[A-Z]{2}",
+            r"[a-z0-9]+(?:-[a-z0-9]+)*",
+            r"(?:[a-z0-9]+-)*",
+            r"\d+(?:\.\d+)*",
+            r"([A-Z][a-z]+)+",
+            r"(ab?)+",
+            r"[^,]+(?:,[^,]+)*",
+            r"(?:\s*,\s*\w+)*",
+            r'(?:"[^"]*")+',
+            r"(?:red|green|blue)+",
+            r"(ab|cd)*",
+            r'"(?:[^"\\]|\\.)*"',
+            r"\w+(?:-\w+)*",
+        ]:
+            validate_text(pattern=pattern, unsafe_pattern='error')
+
+    def test_max_length_checked_before_pattern(self):
+        validator = validate_text(
+            max_length=100, pattern=r"(a+)+", unsafe_pattern='ignore',
+        )
+        # Would take longer than the age of the universe to fail to match.
+        with self.assertRaises(ValueError) as cm:
+            validator(u"a" * 10000 + u"!")
+        self.assertEqual(
+            str(cm.exception),
+            "expected at most 100 characters, but string is 10001 characters "
+            "long",
+        )
+
     def test_invalid_pattern(self):
         with self.assertRaises(TypeError):
             validate_text(pattern=lambda string: None)
@@ -69,6 +301,26 @@ class ValidateTextTestCase(unittest.TestCase):
             'validate_text(pattern=\'hello world\', required=False)',
         )
 
+    def test_repr_unsafe_pattern(self):  # type: () -> None
+        validator = validate_text(pattern='a+', unsafe_pattern='error')
+        self.assertEqual(
+            repr(validator),
+            'validate_text(pattern=\'a+\', unsafe_pattern=\'error\')',
+        )
+
+    def test_repr_alphabet(self):  # type: () -> None
+        validator = validate_text(ascii_only=True, alphabet='abc')
+        self.assertEqual(
+            repr(validator),
+            'validate_text(ascii_only=True, alphabet=\'abc\')',
+        )
+
+    def test_repr_normalization(self):  # type: () -> None
+        validator = validate_text(normalization='NFKC')
+        self.assertEqual(
+            repr(validator), 'validate_text(normalization=\'NFKC\')',
+        )
+
     def test_repr_2(self):  # type: () -> None
         validator = validate_text(min_length=4, max_length=10)
         self.assertEqual(
@@ -143,3 +143,27 @@ class ValidateTupleTestCase(unittest.TestCase):
         caught = cm.exception
 
         self.assertIs(caught, thrown)
+
+    def test_max_errors(self):
+        validator = validate_tuple(
+            schema=(validate_int(), validate_int(), validate_int()),
+            max_errors=5,
+        )
+        with self.assertRaises(TypeError) as cm:
+            validator(('a', 2, 'b'))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid value at index 0: "
+            "expected 'int', but value is of type 'str' (and 1 more error)",
+        )
+        self.assertEqual(
+            [error.path for error in cm.exception.errors], [[0], [2]],
+        )
+
+    def test_max_errors_wrong_length(self):
+        with self.assertRaises(TypeError) as cm:
+            validate_tuple(('a',), schema=(validate_int(),) * 2, max_errors=5)
+        self.assertEqual(
+            str(cm.exception),
+            "expected tuple of length 2 but value is of length 1",
+        )
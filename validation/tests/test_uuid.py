@@ -1,9 +1,49 @@
+import sys
 import unittest
 import uuid
+from datetime import datetime, timedelta
+
+import pytz
+import six
 
 from validation import validate_uuid
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+# 100 nanosecond intervals between 1582-10-15 and the unix epoch.
+_GREGORIAN_OFFSET = 0x01b21dd213814000
+
+
+def _microseconds(timestamp):
+    # Dividing one `timedelta` by another isn't supported on python 2.
+    delta = timestamp - _EPOCH
+    return (delta.days * 86400 + delta.seconds) * 10 ** 6 + delta.microseconds
+
+
+def _uuid7(timestamp, rand=0x123456789abc):
+    milliseconds = _microseconds(timestamp) // 1000
+    return uuid.UUID(int=(
+        (milliseconds << 80) | (7 << 76) | (0x2 << 62) | rand
+    ))
+
+
+def _uuid6(timestamp, rand=0x123456789abc):
+    ticks = _microseconds(timestamp) * 10 + _GREGORIAN_OFFSET
+    return uuid.UUID(int=(
+        ((ticks >> 12) << 80) | (6 << 76) | ((ticks & 0xfff) << 64) |
+        (0x2 << 62) | rand
+    ))
+
+
+def _uuid1(timestamp, rand=0x123456789abc):
+    ticks = _microseconds(timestamp) * 10 + _GREGORIAN_OFFSET
+    return uuid.UUID(fields=(
+        ticks & 0xffffffff, (ticks >> 32) & 0xffff,
+        ((ticks >> 48) & 0xfff) | (1 << 12), 0x80, 0, rand,
+    ))
+
+
 class ValidateUUIDTestCase(unittest.TestCase):
     def test_uuid1_valid(self):
         validate_uuid(uuid.uuid1())
@@ -42,6 +82,314 @@ class ValidateUUIDTestCase(unittest.TestCase):
         with self.assertRaises(ValueError):
             validate_uuid(variant=uuid.RESERVED_MICROSOFT, version=4)
 
+    def test_version_error_message(self):
+        with self.assertRaises(ValueError) as cm:
+            validate_uuid(uuid.uuid4(), version=1)
+        self.assertEqual(
+            str(cm.exception), "expected UUID1, but received UUID4",
+        )
+
+    def test_string_not_allowed(self):
+        with self.assertRaises(TypeError):
+            validate_uuid(six.text_type(uuid.uuid4()))
+
+        with self.assertRaises(TypeError):
+            validate_uuid(uuid.uuid4().bytes)
+
+    def test_string(self):
+        validator = validate_uuid(allow_strings=True)
+        validator(u"12345678-1234-5678-1234-567812345678")
+        validator(u"12345678-ABCD-5678-EF12-567812345678")
+        validator(uuid.uuid4())
+
+        for value in [
+            u"12345678123456781234567812345678",
+            u"{12345678-1234-5678-1234-567812345678}",
+            u"urn:uuid:12345678-1234-5678-1234-567812345678",
+            u"12345678-1234-5678-1234-56781234567",
+            u"12345678-1234-5678-1234-5678123456789",
+            u"12345678-1234-5678-1234-56781234567g",
+            u"1234567-81234-5678-1234-567812345678",
+            u"",
+        ]:
+            with self.assertRaises(ValueError):
+                validator(value)
+
+            self.assertFalse(validator.is_valid(value), value)
+
+        with self.assertRaises(TypeError):
+            validator(b"12345678-1234-5678-1234-567812345678")
+
+    def test_string_version_and_variant(self):
+        for version, generate in [
+            (1, uuid.uuid1),
+            (3, lambda: uuid.uuid3(uuid.uuid4(), "name")),
+            (4, uuid.uuid4),
+            (5, lambda: uuid.uuid5(uuid.uuid4(), "name")),
+        ]:
+            value = generate()
+            for form in [six.text_type(value), six.text_type(value).upper()]:
+                validate_uuid(form, version=version, allow_strings=True)
+                validate_uuid(form, variant=uuid.RFC_4122, allow_strings=True)
+                self.assertTrue(validate_uuid(
+                    version=version, allow_strings=True,
+                ).is_valid(form))
+
+                with self.assertRaises(ValueError) as cm:
+                    validate_uuid(
+                        form, version=3 if version == 1 else 1,
+                        allow_strings=True,
+                    )
+                self.assertIn(
+                    "received UUID{version}".format(version=version),
+                    str(cm.exception),
+                )
+
+                self.assertFalse(validate_uuid(
+                    version=3 if version == 1 else 1, allow_strings=True,
+                ).is_valid(form))
+
+    def test_string_variants(self):
+        for variant in [
+            uuid.RESERVED_NCS,
+            uuid.RFC_4122,
+            uuid.RESERVED_MICROSOFT,
+            uuid.RESERVED_FUTURE,
+        ]:
+            for nibble in range(16):
+                value = (
+                    u"12345678-1234-1234-{nibble:x}234-567812345678"
+                ).format(nibble=nibble)
+                expected = uuid.UUID(value).variant == variant
+                validator = validate_uuid(variant=variant, allow_strings=True)
+                self.assertEqual(validator.is_valid(value), expected, value)
+                self.assertEqual(
+                    validator.is_valid(uuid.UUID(value).bytes), False,
+                )
+
+    def test_bytes(self):
+        validator = validate_uuid(version=4, allow_bytes=True)
+        validator(uuid.uuid4().bytes)
+        validator(uuid.uuid4())
+
+        with self.assertRaises(ValueError) as cm:
+            validator(uuid.uuid1().bytes)
+        self.assertIn("received UUID1", str(cm.exception))
+
+        with self.assertRaises(ValueError):
+            validator(uuid.uuid4().bytes[:15])
+
+        with self.assertRaises(TypeError):
+            validator(six.text_type(uuid.uuid4()))
+
+        self.assertTrue(validator.is_valid(uuid.uuid4().bytes))
+        self.assertFalse(validator.is_valid(uuid.uuid1().bytes))
+        self.assertFalse(validator.is_valid(uuid.uuid4().bytes + b"\0"))
+
+    def test_bytes_variant(self):
+        value = bytearray(uuid.uuid4().bytes)
+        value[8] = 0xc0
+        validator = validate_uuid(variant=uuid.RFC_4122, allow_bytes=True)
+        with self.assertRaises(ValueError) as cm:
+            validator(bytes(value))
+        self.assertEqual(
+            str(cm.exception),
+            "expected RFC_4122 variant, "
+            "but uuid variant is RESERVED_MICROSOFT",
+        )
+
+    def test_validate_many_packed(self):
+        validator = validate_uuid(version=4, allow_bytes=True)
+        values = [uuid.uuid4() for _ in range(1000)]
+        packed = b"".join(value.bytes for value in values)
+
+        validator.validate_many(packed)
+        validator.validate_many(bytearray(packed))
+        validator.validate_many(memoryview(packed))
+        validator.validate_many(values)
+        validator.validate_many([value.bytes for value in values])
+        validator.validate_many(b"")
+
+        values[700] = uuid.uuid1()
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(b"".join(value.bytes for value in values))
+        self.assertEqual(
+            str(cm.exception),
+            "invalid item at position 700: expected UUID4, but received UUID1",
+        )
+        self.assertEqual(cm.exception.path, [700])
+
+        with self.assertRaises(ValueError):
+            validator.validate_many(packed[:-1])
+
+    def test_validate_many_packed_variant(self):
+        validator = validate_uuid(variant=uuid.RFC_4122, allow_bytes=True)
+        packed = bytearray(uuid.uuid4().bytes * 10)
+        validator.validate_many(packed)
+
+        packed[16 * 3 + 8] = 0x00
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(packed)
+        self.assertEqual(cm.exception.path, [3])
+
+        # The buffer should have been released.
+        packed.extend(b"\0")
+
+    @unittest.skipIf(sys.version_info < (3,), "views can't be strided")
+    def test_validate_many_packed_strided(self):
+        validator = validate_uuid(version=4, allow_bytes=True)
+        values = [uuid.uuid4() for _ in range(10)]
+        doubled = bytearray(
+            byte for value in values for byte in bytearray(value.bytes * 2)
+        )
+        # Every other UUID, as a view that is not contiguous.
+        strided = memoryview(doubled).cast('B', (20, 16))[::2]
+        validator.validate_many(strided)
+
+        doubled[16 * 6 + 6] = 0x10
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(strided)
+        self.assertEqual(cm.exception.path, [3])
+
+    def test_modern_versions(self):
+        now = datetime.now(pytz.utc)
+        validate_uuid(_uuid6(now), version=6)
+        validate_uuid(_uuid7(now), version=7)
+        validate_uuid(
+            six.text_type(_uuid7(now)), version=7, variant=uuid.RFC_4122,
+            allow_strings=True,
+        )
+
+        with self.assertRaises(ValueError):
+            validate_uuid(_uuid7(now), version=6)
+
+        with self.assertRaises(ValueError):
+            validate_uuid(version=9)
+
+        with self.assertRaises(ValueError):
+            validate_uuid(version=2)
+
+    def test_timestamp_window(self):
+        start = datetime(2024, 1, 1, tzinfo=pytz.utc)
+        end = datetime(2024, 2, 1, tzinfo=pytz.utc)
+
+        for version, generate in [(1, _uuid1), (6, _uuid6), (7, _uuid7)]:
+            validator = validate_uuid(
+                version=version, min_timestamp=start, max_timestamp=end,
+                allow_strings=True, allow_bytes=True,
+            )
+            for timestamp, expected in [
+                (start, True),
+                (start - timedelta(milliseconds=1), False),
+                (datetime(2024, 1, 15, 12, tzinfo=pytz.utc), True),
+                (end, True),
+                (end + timedelta(milliseconds=1), False),
+            ]:
+                value = generate(timestamp)
+                for form in [value, six.text_type(value), value.bytes]:
+                    self.assertIs(
+                        validator.is_valid(form), expected, (version, form),
+                    )
+                    if expected:
+                        validator(form)
+                        validator.validate_many([form])
+                    else:
+                        with self.assertRaises(ValueError):
+                            validator(form)
+                        with self.assertRaises(ValueError):
+                            validator.validate_many([form])
+
+    def test_timestamp_v1_matches_stdlib(self):
+        value = uuid.uuid1()
+        timestamp = _EPOCH + timedelta(
+            microseconds=(value.time - _GREGORIAN_OFFSET) // 10,
+        )
+        validate_uuid(
+            value, version=1,
+            min_timestamp=timestamp, max_timestamp=timestamp,
+        )
+        with self.assertRaises(ValueError):
+            validate_uuid(
+                value, version=1,
+                min_timestamp=timestamp + timedelta(microseconds=1),
+            )
+
+    def test_timestamp_timezone(self):
+        value = _uuid7(datetime(2024, 1, 1, 12, tzinfo=pytz.utc))
+        tz = pytz.timezone('America/New_York')
+        validate_uuid(
+            value, version=7,
+            min_timestamp=tz.localize(datetime(2024, 1, 1, 7)),
+            max_timestamp=tz.localize(datetime(2024, 1, 1, 7)),
+        )
+
+    def test_timestamp_error_message(self):
+        start = datetime(2024, 1, 1, tzinfo=pytz.utc)
+        value = _uuid7(datetime(2023, 12, 31, 23, 59, 59, 250000, pytz.utc))
+        with self.assertRaises(ValueError) as cm:
+            validate_uuid(value, version=7, min_timestamp=start)
+        self.assertEqual(
+            str(cm.exception),
+            "expected uuid timestamp no earlier than "
+            "2024-01-01 00:00:00+00:00, "
+            "but got 2023-12-31 23:59:59.250000+00:00",
+        )
+
+        value = uuid.UUID(int=(0xffffffffffff << 80) | (7 << 76) | (2 << 62))
+        with self.assertRaises(ValueError) as cm:
+            validate_uuid(value, version=7, max_timestamp=start)
+        self.assertIn("no later than", str(cm.exception))
+
+    def test_timestamp_validate_many_packed(self):
+        start = datetime(2024, 1, 1, tzinfo=pytz.utc)
+        validator = validate_uuid(
+            version=7, min_timestamp=start, allow_bytes=True,
+        )
+        values = [
+            _uuid7(start + timedelta(seconds=index)) for index in range(100)
+        ]
+        validator.validate_many(b"".join(value.bytes for value in values))
+        validator.validate_many(values)
+
+        values[60] = _uuid7(start - timedelta(seconds=1))
+        values[70] = uuid.uuid4()
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(b"".join(value.bytes for value in values))
+        self.assertEqual(cm.exception.path, [60])
+        self.assertIn("no earlier than", str(cm.exception))
+
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(values)
+        self.assertEqual(cm.exception.path, [60])
+
+        values[50] = uuid.uuid4()
+        with self.assertRaises(ValueError) as cm:
+            validator.validate_many(b"".join(value.bytes for value in values))
+        self.assertEqual(cm.exception.path, [50])
+        self.assertIn("UUID4", str(cm.exception))
+
+    def test_timestamp_requires_time_based_version(self):
+        start = datetime(2024, 1, 1, tzinfo=pytz.utc)
+        with self.assertRaises(ValueError):
+            validate_uuid(min_timestamp=start)
+
+        with self.assertRaises(ValueError):
+            validate_uuid(version=4, min_timestamp=start)
+
+    def test_timestamp_bounds_checked(self):
+        start = datetime(2024, 1, 1, tzinfo=pytz.utc)
+        with self.assertRaises(ValueError):
+            validate_uuid(version=7, min_timestamp=datetime(2024, 1, 1))
+
+        with self.assertRaises(TypeError):
+            validate_uuid(version=7, min_timestamp=1704067200)
+
+        with self.assertRaises(ValueError):
+            validate_uuid(
+                version=7, min_timestamp=start,
+                max_timestamp=start - timedelta(seconds=1),
+            )
+
     def test_not_required(self):
         validate_uuid(None, required=False)
 
@@ -62,3 +410,20 @@ class ValidateUUIDTestCase(unittest.TestCase):
             repr(validator),
             'validate_uuid(variant=uuid.RFC_4122, version=3)',
         )
+
+    def test_repr_timestamps(self):
+        start = datetime(2024, 1, 1, tzinfo=pytz.utc)
+        validator = validate_uuid(version=7, min_timestamp=start)
+        self.assertEqual(
+            repr(validator),
+            'validate_uuid(version=7, min_timestamp={start!r})'.format(
+                start=start,
+            ),
+        )
+
+    def test_repr_allow(self):
+        validator = validate_uuid(allow_strings=True, allow_bytes=True)
+        self.assertEqual(
+            repr(validator),
+            'validate_uuid(allow_strings=True, allow_bytes=True)',
+        )
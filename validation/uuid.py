@@ -1,10 +1,20 @@
 from __future__ import absolute_import
 
+import re
+import struct
 import uuid
+from datetime import datetime, timedelta
+
+import six
 
 from .core import _validate_bool
 from .number import _validate_int
-from .common import make_optional_argument_default
+from .string import _buffer_length, _byte_view, _iter_unpack
+from .datetime import _validate_datetime
+from .common import (
+    make_optional_argument_default, make_validator_cache,
+    _validator, intern_validator, _try_contextualize_exception,
+)
 
 
 _undefined = make_optional_argument_default()
@@ -19,41 +29,351 @@ def _variant_to_string(variant):
     }.get(variant, "unknown")
 
 
+# Maps from the top four bits of the eighth byte of a UUID, or the first hex
+# digit of its fourth group, to its variant.
+_NIBBLE_VARIANTS = (
+    (uuid.RESERVED_NCS,) * 8 + (uuid.RFC_4122,) * 4 +
+    (uuid.RESERVED_MICROSOFT,) * 2 + (uuid.RESERVED_FUTURE,) * 2
+)
+
+_HEX_DIGIT = u'[0-9a-fA-F]'
+
+
+def _uuid_string_pattern(version_nibbles=None, variant_nibbles=None):
+    """
+    Returns a pattern matching the canonical string form of a UUID, with the
+    first digits of the third and fourth groups restricted to the given
+    nibbles.
+    """
+    def digits(nibbles):
+        if nibbles is None:
+            return _HEX_DIGIT
+        return u'[{digits}]'.format(digits=u''.join(sorted(set(
+            u''.join(u'{:x}{:X}'.format(nibble, nibble) for nibble in nibbles)
+        ))))
+
+    return re.compile((
+        u'{hex}{{8}}-{hex}{{4}}-{version}{hex}{{3}}-{variant}{hex}{{3}}-'
+        u'{hex}{{12}}'
+    ).format(
+        hex=_HEX_DIGIT,
+        version=digits(version_nibbles),
+        variant=digits(variant_nibbles),
+    ))
+
+
+_UUID_STRING_RE = _uuid_string_pattern()
+
+
+def _uuid_fields(value, allow_strings, allow_bytes):
+    """
+    Returns the variant and version of a UUID in any of the accepted forms,
+    reading them directly from the string or bytes rather than constructing a
+    `uuid.UUID`.  As with `uuid.UUID`, the version is `None` unless the
+    variant is `RFC_4122`.
+    """
+    if isinstance(value, uuid.UUID):
+        return value.variant, value.version
+
+    if allow_strings and isinstance(value, six.text_type):
+        if not _UUID_STRING_RE.match(value) or len(value) != 36:
+            raise ValueError(
+                "expected uuid string in canonical 8-4-4-4-12 hex digit form"
+            )
+        version = int(value[14], 16)
+        variant = _NIBBLE_VARIANTS[int(value[19], 16)]
+
+    elif allow_bytes and isinstance(value, six.binary_type):
+        if len(value) != 16:
+            raise ValueError((
+                "expected 16 bytes, but uuid contains {length}"
+            ).format(length=len(value)))
+        version = six.indexbytes(value, 6) >> 4
+        variant = _NIBBLE_VARIANTS[six.indexbytes(value, 8) >> 4]
+
+    else:
+        raise TypeError((
+            "expected uuid, but value is of type {cls!r}"
+        ).format(cls=value.__class__.__name__))
+
+    if variant != uuid.RFC_4122:
+        version = None
+    return variant, version
+
+
+# Versions 6, 7 and 8 were added by RFC 9562.  Version 2, for DCE security,
+# is not supported by the `uuid` module.
+_VERSIONS = (1, 3, 4, 5, 6, 7, 8)
+
+
+# Functions that extract the timestamp from the most significant 64 bits of a
+# time based UUID.  Versions 1 and 6 count 100 nanosecond intervals since the
+# start of the Gregorian calendar, and version 7 counts milliseconds since the
+# unix epoch.
+def _v1_timestamp(high):
+    return (
+        (high >> 32) |
+        ((high << 16) & 0xffff00000000) |
+        ((high & 0xfff) << 48)
+    )
+
+
+def _v6_timestamp(high):
+    return ((high >> 32) << 28) | ((high >> 4) & 0xffff000) | (high & 0xfff)
+
+
+def _v7_timestamp(high):
+    return high >> 16
+
+
+_TIMESTAMP_FUNCTIONS = {1: _v1_timestamp, 6: _v6_timestamp, 7: _v7_timestamp}
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+# The number of 100 nanosecond intervals between the start of the Gregorian
+# calendar and the unix epoch.
+_GREGORIAN_OFFSET = 0x01b21dd213814000
+
+
+def _timestamp_from_datetime(version, value, round_up):
+    """
+    Converts a timezone aware datetime to a timestamp in the units used by
+    UUIDs of the given version, rounding up or down if it falls between two.
+    """
+    delta = value.replace(tzinfo=None) - value.utcoffset() - _UNIX_EPOCH
+    microseconds = (
+        (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+    )
+    if version == 7:
+        if round_up:
+            return -(-microseconds // 1000)
+        return microseconds // 1000
+    return microseconds * 10 + _GREGORIAN_OFFSET
+
+
+def _describe_timestamp(version, timestamp):
+    if version == 7:
+        microseconds = timestamp * 1000
+    else:
+        microseconds = (timestamp - _GREGORIAN_OFFSET) // 10
+
+    try:
+        value = _UNIX_EPOCH + timedelta(microseconds=microseconds)
+    except OverflowError:
+        return "{microseconds} microseconds after 1970-01-01".format(
+            microseconds=microseconds,
+        )
+    return "{value}+00:00".format(value=value)
+
+
+# Reads the most significant 64 bits of each UUID in a buffer of packed UUIDs.
+_HIGH_BITS_STRUCT = struct.Struct('>Q8x')
+
+
+def _uuid_high_bits(value):
+    """
+    Returns the most significant 64 bits of a UUID in any of the accepted
+    forms, which must already have been checked by `_uuid_fields`.
+    """
+    if isinstance(value, uuid.UUID):
+        return value.int >> 64
+    if isinstance(value, six.text_type):
+        return int(value[:8] + value[9:13] + value[14:18], 16)
+    return struct.unpack('>Q', value[:8])[0]
+
+
 def _validate_uuid(
     value,
     variant,
     version,
-    required
+    allow_strings=False,
+    allow_bytes=False,
+    min_timestamp=None,
+    max_timestamp=None,
+    timestamp_range=None,
+    required=True,
 ):
     if value is None:
         if required:
             raise TypeError("required value is None")
         return
 
-    if not isinstance(value, uuid.UUID):
-        raise TypeError((
-            "expected uuid, but value is of type {cls!r}"
-        ).format(cls=value.__class__.__name__))
+    actual_variant, actual_version = _uuid_fields(
+        value, allow_strings, allow_bytes,
+    )
 
-    if variant is not None and value.variant != variant:
+    if variant is not None and actual_variant != variant:
         raise ValueError((
             "expected {expected} variant, but uuid variant is {actual}"
         ).format(
             expected=_variant_to_string(variant),
-            actual=_variant_to_string(value.variant)
+            actual=_variant_to_string(actual_variant)
         ))
 
-    if version is not None and value.version != version:
+    if version is not None and actual_version != version:
         raise ValueError((
             "expected UUID{expected}, but received UUID{actual}"
-        ).format(expected=version, actual=version))
+        ).format(expected=version, actual=actual_version))
+
+    if timestamp_range is None:
+        return
+
+    lowest, highest = timestamp_range
+    timestamp = _TIMESTAMP_FUNCTIONS[version](_uuid_high_bits(value))
+
+    if timestamp < lowest:
+        raise ValueError((
+            "expected uuid timestamp no earlier than {min}, but got {actual}"
+        ).format(
+            min=min_timestamp, actual=_describe_timestamp(version, timestamp),
+        ))
+
+    if timestamp > highest:
+        raise ValueError((
+            "expected uuid timestamp no later than {max}, but got {actual}"
+        ).format(
+            max=max_timestamp, actual=_describe_timestamp(version, timestamp),
+        ))
+
+
+def _make_uuid_checker(
+    variant, version, allow_strings, allow_bytes, timestamp_range,
+):
+    """
+    Returns a predicate that accepts exactly the values that `_validate_uuid`
+    would accept, and checks strings and bytes with a single pattern match or
+    a pair of table lookups.
+    """
+    if timestamp_range is None:
+        timestamp = None
+    else:
+        timestamp = _TIMESTAMP_FUNCTIONS[version]
+        lowest, highest = timestamp_range
+
+    if version is not None:
+        variant = uuid.RFC_4122
+
+    if variant is None:
+        variant_nibbles = None
+    else:
+        variant_nibbles = [
+            nibble for nibble, nibble_variant in enumerate(_NIBBLE_VARIANTS)
+            if nibble_variant == variant
+        ]
+
+    if version is None:
+        version_nibbles = None
+    else:
+        version_nibbles = [version]
+
+    # The pattern has a fixed length, so only needs to be checked against
+    # strings of that length.
+    string_match = _uuid_string_pattern(
+        version_nibbles, variant_nibbles,
+    ).match
+
+    # Indexed by byte value.
+    version_bytes = [
+        version_nibbles is None or octet >> 4 in version_nibbles
+        for octet in range(256)
+    ]
+    variant_bytes = [
+        variant_nibbles is None or octet >> 4 in variant_nibbles
+        for octet in range(256)
+    ]
+
+    # For use with `bytes.translate`, which will leave behind any bytes that
+    # aren't valid.
+    valid_version_bytes = bytes(bytearray(
+        octet for octet in range(256) if version_bytes[octet]
+    ))
+    valid_variant_bytes = bytes(bytearray(
+        octet for octet in range(256) if variant_bytes[octet]
+    ))
+
+    def is_valid_uuid(value):
+        if isinstance(value, uuid.UUID):
+            if not (
+                (variant is None or value.variant == variant) and
+                (version is None or value.version == version)
+            ):
+                return False
+
+        elif allow_strings and isinstance(value, six.text_type):
+            if not (len(value) == 36 and string_match(value) is not None):
+                return False
+
+        elif allow_bytes and isinstance(value, six.binary_type):
+            if not (
+                len(value) == 16 and
+                version_bytes[six.indexbytes(value, 6)] and
+                variant_bytes[six.indexbytes(value, 8)]
+            ):
+                return False
+
+        else:
+            return False
+
+        return (
+            timestamp is None or
+            lowest <= timestamp(_uuid_high_bits(value)) <= highest
+        )
+
+    def find_invalid_packed(data):
+        """
+        Returns the index of the first invalid UUID in a flat view of packed
+        16 byte UUIDs, as returned by `_byte_view`, or `None` if they are all
+        valid.
+        """
+        invalid = None
+
+        # Slicing with a step copies out the same byte from each UUID.
+        versions = bytes(data[6::16])
+        variants = bytes(data[8::16])
+        if (
+            versions.translate(None, valid_version_bytes) or
+            variants.translate(None, valid_variant_bytes)
+        ):
+            for index, (version_byte, variant_byte) in enumerate(zip(
+                bytearray(versions), bytearray(variants),
+            )):
+                if not version_bytes[version_byte]:
+                    invalid = index
+                    break
+                if not variant_bytes[variant_byte]:
+                    invalid = index
+                    break
 
+        if timestamp is not None:
+            # Timestamps only need to be checked up to the first UUID with the
+            # wrong version or variant.
+            highs = _iter_unpack(_HIGH_BITS_STRUCT, data)
+            for index, (high,) in enumerate(highs):
+                if index == invalid:
+                    break
+                if not lowest <= timestamp(high) <= highest:
+                    return index
+
+        return invalid
+
+    return is_valid_uuid, find_invalid_packed
+
+
+class _uuid_validator(_validator):
+    __slots__ = (
+        '__variant', '__version', '__allow_strings', '__allow_bytes',
+        '__min_timestamp', '__max_timestamp', '__timestamp_range',
+        '__is_valid_uuid', '__find_invalid_packed', '__required',
+    )
 
-class _uuid_validator(object):
     def __init__(
         self,
         variant,
         version,
+        allow_strings,
+        allow_bytes,
+        min_timestamp,
+        max_timestamp,
         required
     ):
         if variant is not None and variant not in (
@@ -67,7 +387,7 @@ class _uuid_validator(object):
 
         _validate_int(version, required=False)
         if version is not None:
-            if version not in (1, 3, 4, 5):
+            if version not in _VERSIONS:
                 raise ValueError(
                     "unknown UUID version: {version}".format(version=version)
                 )
@@ -81,17 +401,149 @@ class _uuid_validator(object):
                 ).format(variant=_variant_to_string(variant)))
         self.__version = version
 
+        _validate_bool(allow_strings)
+        self.__allow_strings = allow_strings
+
+        _validate_bool(allow_bytes)
+        self.__allow_bytes = allow_bytes
+
+        _validate_datetime(min_timestamp, required=False)
+        _validate_datetime(max_timestamp, required=False)
+        if min_timestamp is None and max_timestamp is None:
+            timestamp_range = None
+        else:
+            if version not in _TIMESTAMP_FUNCTIONS:
+                raise ValueError((
+                    "timestamp bounds require a time based version, one of "
+                    "1, 6 or 7, but version is {version!r}"
+                ).format(version=version))
+
+            if (
+                min_timestamp is not None and max_timestamp is not None and
+                min_timestamp > max_timestamp
+            ):
+                raise ValueError((
+                    'minimum timestamp {min!r} is greater than maximum '
+                    'timestamp {max!r}'
+                ).format(min=min_timestamp, max=max_timestamp))
+
+            # Converted once here so that checking a UUID needs nothing more
+            # than integer comparisons.  Timestamps are always positive and
+            # fit in 64 bits.
+            lowest, highest = 0, 2 ** 64
+            if min_timestamp is not None:
+                lowest = _timestamp_from_datetime(
+                    version, min_timestamp, round_up=True,
+                )
+            if max_timestamp is not None:
+                highest = _timestamp_from_datetime(
+                    version, max_timestamp, round_up=False,
+                )
+            timestamp_range = (lowest, highest)
+
+        self.__min_timestamp = min_timestamp
+        self.__max_timestamp = max_timestamp
+        self.__timestamp_range = timestamp_range
+
+        self.__is_valid_uuid, self.__find_invalid_packed = _make_uuid_checker(
+            self.__variant, version, allow_strings, allow_bytes,
+            timestamp_range,
+        )
+
         _validate_bool(required)
         self.__required = required
 
+    def _key(self):
+        return (
+            self.__variant, self.__version,
+            self.__allow_strings, self.__allow_bytes,
+            self.__min_timestamp, self.__max_timestamp, self.__required,
+        )
+
     def __call__(self, value):
         _validate_uuid(
-            value,
-            variant=self.__variant,
-            version=self.__version,
-            required=self.__required
+            value, self.__variant, self.__version,
+            self.__allow_strings, self.__allow_bytes,
+            self.__min_timestamp, self.__max_timestamp,
+            self.__timestamp_range, self.__required,
         )
 
+    def _compile(self, compiler, value):
+        if self.__allow_strings or self.__allow_bytes:
+            with compiler.optional(value, required=self.__required):
+                compiler.check(self, value, ['{is_valid_uuid}({value})'.format(
+                    is_valid_uuid=compiler.constant(self.__is_valid_uuid),
+                    value=value,
+                )])
+            return
+
+        conditions = ['isinstance({value}, {uuid})'.format(
+            value=value, uuid=compiler.constant(uuid.UUID),
+        )]
+
+        if self.__variant is not None:
+            conditions.append('{value}.variant == {variant}'.format(
+                value=value, variant=compiler.constant(self.__variant),
+            ))
+
+        if self.__version is not None:
+            conditions.append('{value}.version == {version}'.format(
+                value=value, version=compiler.constant(self.__version),
+            ))
+
+        if self.__timestamp_range is not None:
+            lowest, highest = self.__timestamp_range
+            timestamp = _TIMESTAMP_FUNCTIONS[self.__version]
+            condition = '{lowest} <= {timestamp}({value}.int >> 64) <= {max}'
+            conditions.append(condition.format(
+                lowest=compiler.constant(lowest),
+                timestamp=compiler.constant(timestamp),
+                value=value,
+                max=compiler.constant(highest),
+            ))
+
+        with compiler.optional(value, required=self.__required):
+            compiler.check(self, value, conditions)
+
+    def _compile_many(self):
+        validate_many = super(_uuid_validator, self)._compile_many()
+        if not self.__allow_bytes:
+            return validate_many
+
+        find_invalid_packed = self.__find_invalid_packed
+
+        def validate_many_packed(values):
+            length = _buffer_length(values)
+            if length is None:
+                validate_many(values)
+                return
+
+            if length % 16:
+                raise ValueError((
+                    "expected a multiple of 16 bytes, but buffer contains "
+                    "{length}"
+                ).format(length=length))
+
+            data = _byte_view(values)
+            index = find_invalid_packed(data)
+            if index is None:
+                return
+            item = bytes(data[16 * index:16 * (index + 1)])
+
+            # Release the view, so that it doesn't stop the buffer from being
+            # resized while the exception is alive.
+            del data
+
+            try:
+                self(item)
+            except (TypeError, ValueError, KeyError):
+                _try_contextualize_exception(
+                    "invalid item at position {key}", index,
+                )
+                raise
+
+        return validate_many_packed
+
     def __repr__(self):
         args = []
         if self.__variant is not None:
@@ -104,6 +556,26 @@ class _uuid_validator(object):
                 version=self.__version,
             ))
 
+        if self.__min_timestamp is not None:
+            args.append('min_timestamp={min_timestamp!r}'.format(
+                min_timestamp=self.__min_timestamp,
+            ))
+
+        if self.__max_timestamp is not None:
+            args.append('max_timestamp={max_timestamp!r}'.format(
+                max_timestamp=self.__max_timestamp,
+            ))
+
+        if self.__allow_strings:
+            args.append('allow_strings={allow_strings!r}'.format(
+                allow_strings=self.__allow_strings,
+            ))
+
+        if self.__allow_bytes:
+            args.append('allow_bytes={allow_bytes!r}'.format(
+                allow_bytes=self.__allow_bytes,
+            ))
+
         if not self.__required:
             args.append('required={required!r}'.format(
                 required=self.__required,
@@ -112,10 +584,17 @@ class _uuid_validator(object):
         return 'validate_uuid({args})'.format(args=', '.join(args))
 
 
+_uuid_validator_cache = make_validator_cache(_uuid_validator)
+
+
 def validate_uuid(
     value=_undefined,
     variant=None,
     version=None,
+    allow_strings=False,
+    allow_bytes=False,
+    min_timestamp=None,
+    max_timestamp=None,
     required=True,
 ):
     """
@@ -143,7 +622,25 @@ def validate_uuid(
         be one of `RESERVED_NCS`, `RFC_4122`, `RESERVED_MICROSOFT`, or
         `RESERVED_FUTURE` from the `uuid` module.
     :param int version:
-        Can be 1, 3, 4, or 5.
+        Can be 1, 3, 4, 5, 6, 7 or 8.
+    :param datetime min_timestamp:
+        The earliest timestamp that a time based UUID may contain, as a
+        timezone aware datetime.  Requires `version` to be 1, 6 or 7.  The
+        bound is converted to the integer units used by the UUID once, so
+        checking it does not construct any datetimes.
+    :param datetime max_timestamp:
+        The latest timestamp that a time based UUID may contain.
+    :param bool allow_strings:
+        Whether to also accept UUIDs as unicode strings in the canonical
+        8-4-4-4-12 hex digit form.  The variant and version are read directly
+        from the string without constructing a `uuid.UUID`.  Defaults to
+        `False`.
+    :param bool allow_bytes:
+        Whether to also accept UUIDs as 16 byte strings, as in
+        `uuid.UUID.bytes`.  If set, ``validate_many`` will also accept a
+        `bytes`, `bytearray`, `memoryview` or other buffer containing any
+        number of packed 16 byte UUIDs, and will check all of them in bulk.
+        Defaults to `False`.
     :param bool required:
         Whether the value can be `None`.  Defaults to `True`.
 
@@ -154,13 +651,19 @@ def validate_uuid(
         If the value was longer or shorter than expected, or did not match
         the pattern.
     """
-    validate = _uuid_validator(
-        variant=variant,
-        version=version,
-        required=required,
-    )
-
     if value is not _undefined:
+        validate = _uuid_validator_cache(
+            variant, version, allow_strings, allow_bytes,
+            min_timestamp, max_timestamp, required,
+        )
         validate(value)
     else:
-        return validate
+        return intern_validator(_uuid_validator(
+            variant=variant,
+            version=version,
+            allow_strings=allow_strings,
+            allow_bytes=allow_bytes,
+            min_timestamp=min_timestamp,
+            max_timestamp=max_timestamp,
+            required=required,
+        ))
@@ -1,7 +1,10 @@
 from typing import Union, overload, Callable, Pattern, Optional
 from uuid import UUID
+from datetime import datetime
 import six
 
+from .common import _validator
+
 
 @overload
 def validate_uuid(
@@ -9,6 +12,10 @@ def validate_uuid(
     *,
     variant: Optional[str] = None,
     version: Optional[int] = None,
+    allow_strings: bool = False,
+    allow_bytes: bool = False,
+    min_timestamp: Optional[datetime] = None,
+    max_timestamp: Optional[datetime] = None,
 ) -> None:
     ...
 
@@ -19,6 +26,10 @@ def validate_uuid(
     *,
     variant: Optional[str] = None,
     version: Optional[int] = None,
+    allow_strings: bool = False,
+    allow_bytes: bool = False,
+    min_timestamp: Optional[datetime] = None,
+    max_timestamp: Optional[datetime] = None,
     required: bool,
 ) -> None:
     ...
@@ -29,7 +40,11 @@ def validate_uuid(
     *,
     variant: Optional[str] = None,
     version: Optional[int] = None,
-) -> Callable[[UUID], None]:
+    allow_strings: bool = False,
+    allow_bytes: bool = False,
+    min_timestamp: Optional[datetime] = None,
+    max_timestamp: Optional[datetime] = None,
+) -> _validator[UUID]:
     ...
 
 
@@ -38,7 +53,11 @@ def validate_uuid(
     *,
     variant: Optional[str] = None,
     version: Optional[int] = None,
+    allow_strings: bool = False,
+    allow_bytes: bool = False,
+    min_timestamp: Optional[datetime] = None,
+    max_timestamp: Optional[datetime] = None,
     required: bool,
-) -> Callable[[Optional[UUID]], None]:
+) -> _validator[Optional[UUID]]:
     ...
 